@@ -1,15 +1,32 @@
 import os
 import sys
+import gzip
+import time
+import tempfile
+import threading
+import importlib.util
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from datetime import datetime, timedelta
 
 # 상위 디렉토리 추가하여 database 모듈 import 가능하게 설정
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from database.db_connector import db
+from database.parallel import run_concurrently
+from database.rollup import (
+    load_rollup_stats, load_rollup_matrix, load_monthly_series, rollup_available, rollup_pending_rows
+)
+from database.range_cache import (
+    month_segment_cache, month_starts, month_range_clause, shift_month, next_month, to_date, concat_segments
+)
+from database.streaming import groupby_sum_chunks, write_csv_chunks, write_parquet_chunks
+from database.synthetic import zipf_weights
+from database.dimensions import dimension_cache
+from database.filters import normalize_ids, append_id_filters
 from database.models import (
     Region, CarType, Manufacturer, CarModel, CarRegistration
 )
@@ -21,8 +38,10 @@ st.set_page_config(
     layout="wide"
 )
 
-# 데이터베이스 연결 확인
-@st.cache_resource
+# 샘플 데이터 난수 시드 (DB 연결 실패 시 표시되는 데이터를 재현 가능하게)
+SAMPLE_SEED = int(os.getenv('SAMPLE_DATA_SEED', '42'))
+
+# 데이터베이스 연결 확인 (헬스 모니터의 마지막 상태를 바로 반환하므로 장애가 복구되면 자동으로 다시 연결됨)
 def check_db_connection():
     try:
         return db.connect()
@@ -31,6 +50,14 @@ def check_db_connection():
         st.info("샘플 데이터로 실행됩니다. 일부 기능이 제한됩니다.")
         return False
 
+# 집계 테이블(registration_rollup, registration_monthly) 확인 - 없으면 만들지 않고 샘플 데이터 사용
+# 있으면 뒤처진 행을 자동으로 반영 (database.rollup.rollup_available)
+def check_rollup():
+    if rollup_available():
+        return True
+    st.warning("집계 테이블이 없습니다. `python -m database.rollup` 으로 생성하면 통계가 표시됩니다. 샘플 데이터를 사용합니다.")
+    return False
+
 # 샘플 지역 데이터 생성
 def create_sample_regions():
     return [
@@ -139,42 +166,45 @@ def create_sample_car_models(manufacturer_id=None):
     return all_models
 
 # 샘플 등록 데이터 생성
-def create_sample_registration_data(region_id=None, car_type_id=None, start_date=None, end_date=None):
+def create_sample_registration_data(region_ids=None, car_type_ids=None, start_date=None, end_date=None, size=100):
     # 기본값 설정
     if not start_date:
         start_date = datetime.now() - timedelta(days=365)
     if not end_date:
         end_date = datetime.now()
     
-    # 샘플 데이터 생성
-    regions = create_sample_regions()
-    car_types = create_sample_car_types()
-    manufacturers = create_sample_manufacturers()
+    # 샘플 데이터 생성 (시드 고정 - 같은 조건이면 페이지를 넘겨도 같은 데이터)
+    rng = np.random.default_rng(SAMPLE_SEED)
+    regions = pd.DataFrame(create_sample_regions())
+    car_types = pd.DataFrame(create_sample_car_types())
+    manufacturers = pd.DataFrame(create_sample_manufacturers())
     
-    data = []
-    for i in range(100):  # 100개의 샘플 데이터 생성
-        region = np.random.choice([r['id'] for r in regions])
-        car_type = np.random.choice([c['id'] for c in car_types])
-        manufacturer = np.random.choice([m['id'] for m in manufacturers])
-        reg_date = start_date + timedelta(days=np.random.randint(0, (end_date - start_date).days))
-        count = np.random.randint(50, 1000)
-        
-        if (region_id is None or region == region_id) and (car_type_id is None or car_type == car_type_id):
-            data.append({
-                'region_id': region,
-                'region_name': next(r['name'] for r in regions if r['id'] == region),
-                'car_type_id': car_type,
-                'car_type_name': next(c['name'] for c in car_types if c['id'] == car_type),
-                'manufacturer_id': manufacturer,
-                'manufacturer_name': next(m['name'] for m in manufacturers if m['id'] == manufacturer),
-                'registration_date': reg_date,
-                'registration_count': count
-            })
-    
-    return pd.DataFrame(data)
+    region_index = rng.integers(0, len(regions), size=size)
+    car_type_index = rng.integers(0, len(car_types), size=size)
+    # 제조사는 상위 업체에 몰리도록 Zipf 가중치로 선택
+    manufacturer_index = rng.choice(len(manufacturers), size=size, p=zipf_weights(len(manufacturers)))
+    days = rng.integers(0, max((end_date - start_date).days, 1), size=size)
+    
+    df = pd.DataFrame({
+        'region_id': regions['id'].to_numpy()[region_index],
+        'region_name': regions['name'].to_numpy()[region_index],
+        'car_type_id': car_types['id'].to_numpy()[car_type_index],
+        'car_type_name': car_types['name'].to_numpy()[car_type_index],
+        'manufacturer_id': manufacturers['id'].to_numpy()[manufacturer_index],
+        'manufacturer_name': manufacturers['name'].to_numpy()[manufacturer_index],
+        'registration_date': pd.Timestamp(start_date) + pd.to_timedelta(days, unit='D'),
+        'registration_count': rng.integers(50, 1000, size=size)
+    })
+    
+    mask = np.ones(size, dtype=bool)
+    if normalize_ids(region_ids):
+        mask &= df['region_id'].isin(normalize_ids(region_ids)).to_numpy()
+    if normalize_ids(car_type_ids):
+        mask &= df['car_type_id'].isin(normalize_ids(car_type_ids)).to_numpy()
+    return df[mask]
 
 # 샘플 지역 통계 생성
-def create_sample_region_stats(car_type_id=None, start_date=None, end_date=None):
+def create_sample_region_stats(car_type_ids=None, start_date=None, end_date=None):
     regions = create_sample_regions()
     data = []
     
@@ -188,7 +218,7 @@ def create_sample_region_stats(car_type_id=None, start_date=None, end_date=None)
     return pd.DataFrame(data).sort_values('total_count', ascending=False)
 
 # 샘플 차종 통계 생성
-def create_sample_car_type_stats(region_id=None, start_date=None, end_date=None):
+def create_sample_car_type_stats(region_ids=None, start_date=None, end_date=None):
     car_types = create_sample_car_types()
     data = []
     
@@ -202,7 +232,7 @@ def create_sample_car_type_stats(region_id=None, start_date=None, end_date=None)
     return pd.DataFrame(data).sort_values('total_count', ascending=False)
 
 # 샘플 제조사 통계 생성
-def create_sample_manufacturer_stats(region_id=None, car_type_id=None, start_date=None, end_date=None):
+def create_sample_manufacturer_stats(region_ids=None, car_type_ids=None, start_date=None, end_date=None):
     manufacturers = create_sample_manufacturers()
     data = []
     
@@ -216,23 +246,34 @@ def create_sample_manufacturer_stats(region_id=None, car_type_id=None, start_dat
     return pd.DataFrame(data).sort_values('total_count', ascending=False)
 
 # 샘플 월별 추이 생성
-def create_sample_monthly_trend(region_id=None, car_type_id=None, months=12):
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=30*months)
+def create_sample_monthly_trend(region_ids=None, car_type_ids=None, months=12, split_by=None):
+    # 이번 달까지 최근 months 개 달력 월
+    this_month = datetime.now().date().replace(day=1)
+    month_list = [month.strftime('%Y-%m') for month in month_starts(shift_month(this_month, 1 - months), this_month)]
+    rng = np.random.default_rng(SAMPLE_SEED)
     
-    data = []
-    current_date = start_date
-    
-    while current_date <= end_date:
-        month_str = current_date.strftime('%Y-%m')
-        count = np.random.randint(5000, 20000)
-        data.append({
-            'month': month_str,
-            'total_count': count
+    if not split_by:
+        return pd.DataFrame({
+            'month': month_list,
+            'total_count': rng.integers(5000, 20000, size=len(month_list))
         })
-        current_date = current_date + timedelta(days=30)
     
-    return pd.DataFrame(data)
+    # 비교 기준(선택한 지역/차종)별 월별 추이
+    items = create_sample_regions() if split_by == 'region' else create_sample_car_types()
+    selected = normalize_ids(region_ids if split_by == 'region' else car_type_ids)
+    names = [item['name'] for item in items if not selected or item['id'] in selected]
+    return pd.DataFrame({
+        'month': np.repeat(month_list, len(names)),
+        COMPARE_COLUMNS[split_by]: np.tile(names, len(month_list)),
+        'total_count': rng.integers(500, 5000, size=len(month_list) * len(names))
+    })
+
+# 샘플 지역 × 차종 등록 대수 행렬 생성
+def create_sample_region_car_type_matrix(start_date=None, end_date=None):
+    regions = [region['name'] for region in create_sample_regions()]
+    car_types = [car_type['name'] for car_type in create_sample_car_types()]
+    rng = np.random.default_rng(SAMPLE_SEED)
+    return regions, car_types, rng.integers(500, 5000, size=(len(regions), len(car_types))).astype(np.int64)
 
 # 지역 데이터 로드
 @st.cache_data(ttl=3600)
@@ -256,235 +297,443 @@ def load_car_types():
         car_types = create_sample_car_types()
         return car_types, {car_type['id']: car_type['name'] for car_type in car_types}
 
-# 등록 데이터 로드
-def load_registration_data(region_id=None, car_type_id=None, start_date=None, end_date=None):
+# 등록 데이터 조회 조건 생성
+# (region_ids/car_type_ids 는 하나 또는 여러 id - 여러 개면 IN 조건 하나)
+def build_registration_filters(region_ids=None, car_type_ids=None, start_date=None, end_date=None):
+    params = []
+    where_clauses = []
+    
+    append_id_filters(where_clauses, params, [("cr.region_id", region_ids), ("cr.car_type_id", car_type_ids)])
+    
+    if start_date:
+        where_clauses.append("cr.registration_date >= %s")
+        params.append(start_date.strftime('%Y-%m-%d'))
+    
+    if end_date:
+        where_clauses.append("cr.registration_date <= %s")
+        params.append(end_date.strftime('%Y-%m-%d'))
+    
+    where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
+    return where_clause, tuple(params)
+
+# 등록 데이터 조회 쿼리 (limit 이 있으면 그 건수만 조회)
+# 기준 정보 테이블은 조인하지 않고 id 만 받아 dimension_cache 로 이름을 매핑
+def build_registration_query(where_clause, limit=None):
+    limit_clause = f"LIMIT {int(limit)}" if limit else ""
+    return f"""
+        SELECT 
+            cr.id,
+            cr.registration_date,
+            cr.region_id,
+            cr.car_type_id,
+            cr.car_model_id,
+            cr.registration_count
+        FROM 
+            car_registration cr
+        WHERE 
+            {where_clause}
+        ORDER BY 
+            cr.registration_date DESC, cr.id DESC
+        {limit_clause}
+    """
+
+# 날짜 조건이 없으면 최근 1년
+def default_date_range(start_date=None, end_date=None):
+    today = datetime.now().date()
+    return start_date or today - timedelta(days=365), end_date or today
+
+# 등록 데이터 요약 기준 (월 × 지역 × 차종 × 제조사별 등록 대수 합계와 원본 행 수)
+SUMMARY_COLUMNS = ['month', 'region_name', 'car_type_name', 'manufacturer_name']
+
+# 등록 데이터 청크 -> 요약 (메모리는 청크 크기와 그룹 수에만 비례)
+def summarize_registration_chunks(chunks):
+    def with_month(chunks):
+        for chunk in chunks:
+            month = pd.to_datetime(chunk['registration_date']).dt.to_period('M').dt.start_time
+            yield chunk.assign(month=month, rows=1)
+    return groupby_sum_chunks(with_month(chunks), SUMMARY_COLUMNS, ['registration_count', 'rows'])
+
+# 조건에 맞는 등록 데이터를 DB 커서에서 청크 단위로 읽어 이름을 매핑
+# 기준 정보는 커서를 열기 전에 읽음 (스트리밍 중 커넥션을 하나 더 잡으면 여러 세션이 동시에 내보낼 때 풀이 고갈됨)
+def iter_registration_chunks(where_clause, params, label, chunk_size=50000):
+    query = build_registration_query(where_clause)
+    dimensions = dimension_cache.load()
+    for chunk in db.iter_dataframes(query, params, chunk_size=chunk_size, label=label):
+        yield dimension_cache.decode_registrations(chunk, dimensions)
+
+# 등록 데이터 요약 로드 (조회 조건의 행 전체를 DataFrame 으로 만들지 않고 청크 단위로 읽으며 합산)
+# 기간에 전부 포함되는 달력 월은 월 단위로 요약을 캐시하고, 일부만 걸치는 처음/마지막 월은 날짜 조건 그대로 조회
+def load_registration_summary(region_ids=None, car_type_ids=None, start_date=None, end_date=None):
     connection_successful = check_db_connection()
     if connection_successful:
-        params = []
-        where_clauses = []
-        
-        if region_id:
-            where_clauses.append("cr.region_id = %s")
-            params.append(region_id)
-        
-        if car_type_id:
-            where_clauses.append("cr.car_type_id = %s")
-            params.append(car_type_id)
-        
-        if start_date:
-            where_clauses.append("cr.registration_date >= %s")
-            params.append(start_date.strftime('%Y-%m-%d'))
+        start_date, end_date = map(to_date, default_date_range(start_date, end_date))
+        region_ids, car_type_ids = normalize_ids(region_ids), normalize_ids(car_type_ids)
+        months = month_starts(start_date, end_date)
+        full_months = [month for month in months if month >= start_date and next_month(month) <= end_date + timedelta(days=1)]
         
-        if end_date:
-            where_clauses.append("cr.registration_date <= %s")
-            params.append(end_date.strftime('%Y-%m-%d'))
+        def fetch(months):
+            where_clause, params = build_registration_filters(region_ids, car_type_ids)
+            range_clause, range_params = month_range_clause('cr.registration_date', months)
+            chunks = iter_registration_chunks(f"{where_clause} AND {range_clause}", params + range_params, 'load_registration_summary')
+            return summarize_registration_chunks(chunks)
         
-        where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
-        
-        query = f"""
-            SELECT 
-                cr.id,
-                cr.registration_date,
-                r.name AS region_name,
-                ct.name AS car_type_name,
-                cm.name AS car_model_name,
-                m.name AS manufacturer_name,
-                cr.registration_count
-            FROM 
-                car_registration cr
-            JOIN 
-                regions r ON cr.region_id = r.id
-            JOIN 
-                car_types ct ON cr.car_type_id = ct.id
-            JOIN 
-                car_models cm ON cr.car_model_id = cm.id
-            JOIN 
-                manufacturers m ON cm.manufacturer_id = m.id
-            WHERE 
-                {where_clause}
-            ORDER BY 
-                cr.registration_date DESC
-        """
-        
-        df = db.query_to_dataframe(query, tuple(params))
-        return df
+        segments = month_segment_cache.load(
+            ('load_registration_summary', region_ids, car_type_ids),
+            full_months,
+            fetch,
+            'load_registration_summary',
+            period_column='month',
+            tables=('car_registration',)
+        )
+        for month in months:
+            if month not in full_months:
+                month_end = next_month(month) - timedelta(days=1)
+                where_clause, params = build_registration_filters(
+                    region_ids, car_type_ids, max(start_date, month), min(end_date, month_end))
+                segments.append(summarize_registration_chunks(
+                    iter_registration_chunks(where_clause, params, 'load_registration_summary')))
+        return concat_segments(segments)
     else:
-        return create_sample_registration_data(region_id, car_type_id, start_date, end_date)
+        return summarize_registration_chunks([create_sample_registration_data(region_ids, car_type_ids, start_date, end_date)])
 
-# 지역별 통계 로드
-def load_region_stats(car_type_id=None, start_date=None, end_date=None):
+# 요약 -> 등록 데이터 건수와 등록 대수 합계
+def registration_totals(summary):
+    return {'rows': int(summary['rows'].sum()), 'total_count': int(summary['registration_count'].sum())}
+
+# 등록 데이터 건수/합계 로드 (DB 집계 모드 - 요약 없이 집계 쿼리 한 번)
+def load_registration_totals(region_ids=None, car_type_ids=None, start_date=None, end_date=None):
     connection_successful = check_db_connection()
     if connection_successful:
-        params = []
-        where_clauses = []
-        
-        if car_type_id:
-            where_clauses.append("cr.car_type_id = %s")
-            params.append(car_type_id)
-        
-        if start_date:
-            where_clauses.append("cr.registration_date >= %s")
-            params.append(start_date.strftime('%Y-%m-%d'))
-        
-        if end_date:
-            where_clauses.append("cr.registration_date <= %s")
-            params.append(end_date.strftime('%Y-%m-%d'))
-        
-        where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
-        
+        start_date, end_date = default_date_range(start_date, end_date)
+        where_clause, params = build_registration_filters(region_ids, car_type_ids, start_date, end_date)
         query = f"""
-            SELECT 
-                r.name AS region_name, 
-                SUM(cr.registration_count) AS total_count
-            FROM 
+            SELECT
+                COUNT(*) AS row_count,
+                COALESCE(SUM(cr.registration_count), 0) AS total_count
+            FROM
                 car_registration cr
-            JOIN 
-                regions r ON cr.region_id = r.id
-            WHERE 
+            WHERE
                 {where_clause}
-            GROUP BY 
-                r.name
-            ORDER BY 
-                total_count DESC
         """
-        
-        df = db.query_to_dataframe(query, tuple(params))
+        row = db.query_to_dataframe(query, params, label='load_registration_totals').iloc[0]
+        return {'rows': int(row['row_count']), 'total_count': int(row['total_count'])}
+    else:
+        return registration_totals(load_registration_summary(region_ids, car_type_ids, start_date, end_date))
+
+# 기준 정보에 있는 id 의 등록 건만 (기존 INNER JOIN 과 같은 행 - LIMIT 전에 SQL 에서 거름)
+KNOWN_DIMENSIONS_CLAUSE = (
+    "cr.region_id IN (SELECT id FROM regions)"
+    " AND cr.car_type_id IN (SELECT id FROM car_types)"
+    " AND cr.car_model_id IN (SELECT cm.id FROM car_models cm JOIN manufacturers m ON cm.manufacturer_id = m.id)"
+)
+
+# 상세 데이터 한 페이지 로드 (registration_date, id 기준 keyset 페이지네이션)
+# after: 이전 페이지 마지막 행의 (등록일, id) - 그 다음 행부터 page_size + 1 건을 조회하여 다음 페이지 유무 판단
+# 기준 정보 캐시가 DB 보다 오래되어 이름 매핑에서 빠진 행이 있으면 마지막으로 읽은 행 다음부터 모자란 만큼 더 조회
+def load_registration_page(region_ids=None, car_type_ids=None, start_date=None, end_date=None, page_size=50, after=None):
+    connection_successful = check_db_connection()
+    if connection_successful:
+        where_clause, params = build_registration_filters(region_ids, car_type_ids, start_date, end_date)
+        where_clause += f" AND {KNOWN_DIMENSIONS_CLAUSE}"
+        frames, found = [], 0
+        while True:
+            page_where, page_params = where_clause, params
+            if after:
+                after_date, after_id = after
+                page_where += " AND (cr.registration_date < %s OR (cr.registration_date = %s AND cr.id < %s))"
+                page_params += (after_date, after_date, after_id)
+            limit = page_size + 1 - found
+            query = build_registration_query(page_where, limit=limit)
+            
+            df = db.query_to_dataframe(query, page_params, label='load_registration_page', columnar=True)
+            frames.append(dimension_cache.decode_registrations(df))
+            found += len(frames[-1])
+            if len(df) < limit or found > page_size:
+                return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+            last_row = df.iloc[-1]
+            after = (pd.Timestamp(last_row['registration_date']).strftime('%Y-%m-%d'), int(last_row['id']))
+    else:
+        df = create_sample_registration_data(region_ids, car_type_ids, start_date, end_date)
+        df = df.rename_axis('id').reset_index()
+        df = df.sort_values(['registration_date', 'id'], ascending=False)
+        if after:
+            after_date, after_id = after
+            dates = pd.to_datetime(df['registration_date'])
+            after_date = pd.Timestamp(after_date)
+            df = df[(dates < after_date) | ((dates == after_date) & (df['id'] < after_id))]
+        return df.head(page_size + 1)
+
+# 등록 데이터를 청크 단위로 로드 (합계/집계/CSV 내보내기를 제한된 메모리로 처리)
+def iter_registration_data(region_ids=None, car_type_ids=None, start_date=None, end_date=None, chunk_size=50000):
+    connection_successful = check_db_connection()
+    if connection_successful:
+        where_clause, params = build_registration_filters(region_ids, car_type_ids, start_date, end_date)
+        yield from iter_registration_chunks(where_clause, params, 'iter_registration_data', chunk_size=chunk_size)
+    else:
+        yield create_sample_registration_data(region_ids, car_type_ids, start_date, end_date)
+
+# 지역별 통계 로드 (미리 집계된 registration_rollup 을 월 구간 캐시를 거쳐 조회)
+def load_region_stats(car_type_ids=None, start_date=None, end_date=None):
+    connection_successful = check_db_connection() and check_rollup()
+    if connection_successful:
+        start_date, end_date = default_date_range(start_date, end_date)
+        df = load_rollup_stats('region', car_type_ids=car_type_ids, start_date=start_date, end_date=end_date, label='load_region_stats')
         return df
     else:
-        return create_sample_region_stats(car_type_id, start_date, end_date)
+        return create_sample_region_stats(car_type_ids, start_date, end_date)
 
 # 차종별 통계 로드
-def load_car_type_stats(region_id=None, start_date=None, end_date=None):
-    connection_successful = check_db_connection()
+def load_car_type_stats(region_ids=None, start_date=None, end_date=None):
+    connection_successful = check_db_connection() and check_rollup()
     if connection_successful:
-        params = []
-        where_clauses = []
-        
-        if region_id:
-            where_clauses.append("cr.region_id = %s")
-            params.append(region_id)
-        
-        if start_date:
-            where_clauses.append("cr.registration_date >= %s")
-            params.append(start_date.strftime('%Y-%m-%d'))
-        
-        if end_date:
-            where_clauses.append("cr.registration_date <= %s")
-            params.append(end_date.strftime('%Y-%m-%d'))
-        
-        where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
-        
-        query = f"""
-            SELECT 
-                ct.name AS car_type, 
-                SUM(cr.registration_count) AS total_count
-            FROM 
-                car_registration cr
-            JOIN 
-                car_types ct ON cr.car_type_id = ct.id
-            WHERE 
-                {where_clause}
-            GROUP BY 
-                ct.name
-            ORDER BY 
-                total_count DESC
-        """
-        
-        df = db.query_to_dataframe(query, tuple(params))
+        start_date, end_date = default_date_range(start_date, end_date)
+        df = load_rollup_stats('car_type', region_ids=region_ids, start_date=start_date, end_date=end_date, label='load_car_type_stats')
         return df
     else:
-        return create_sample_car_type_stats(region_id, start_date, end_date)
+        return create_sample_car_type_stats(region_ids, start_date, end_date)
 
 # 제조사별 통계 로드
-def load_manufacturer_stats(region_id=None, car_type_id=None, start_date=None, end_date=None):
-    connection_successful = check_db_connection()
+def load_manufacturer_stats(region_ids=None, car_type_ids=None, start_date=None, end_date=None):
+    connection_successful = check_db_connection() and check_rollup()
     if connection_successful:
-        params = []
-        where_clauses = []
-        
-        if region_id:
-            where_clauses.append("cr.region_id = %s")
-            params.append(region_id)
-        
-        if car_type_id:
-            where_clauses.append("cr.car_type_id = %s")
-            params.append(car_type_id)
-        
-        if start_date:
-            where_clauses.append("cr.registration_date >= %s")
-            params.append(start_date.strftime('%Y-%m-%d'))
-        
-        if end_date:
-            where_clauses.append("cr.registration_date <= %s")
-            params.append(end_date.strftime('%Y-%m-%d'))
-        
-        where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
-        
-        query = f"""
-            SELECT 
-                m.name AS manufacturer_name, 
-                SUM(cr.registration_count) AS total_count
-            FROM 
-                car_registration cr
-            JOIN 
-                car_models cm ON cr.car_model_id = cm.id
-            JOIN 
-                manufacturers m ON cm.manufacturer_id = m.id
-            WHERE 
-                {where_clause}
-            GROUP BY 
-                m.name
-            ORDER BY 
-                total_count DESC
-        """
-        
-        df = db.query_to_dataframe(query, tuple(params))
+        start_date, end_date = default_date_range(start_date, end_date)
+        df = load_rollup_stats(
+            'manufacturer', region_ids=region_ids, car_type_ids=car_type_ids, start_date=start_date, end_date=end_date,
+            label='load_manufacturer_stats'
+        )
         return df
     else:
-        return create_sample_manufacturer_stats(region_id, car_type_id, start_date, end_date)
+        return create_sample_manufacturer_stats(region_ids, car_type_ids, start_date, end_date)
 
-# 월별 추이 로드
-def load_monthly_trend(region_id=None, car_type_id=None, months=12):
-    connection_successful = check_db_connection()
+# 월별 추이 로드 (이번 달까지 최근 months 개 달력 월, 미리 집계된 월별 시계열에서 조회)
+# split_by 를 주면 선택한 지역/차종별 추이를 같은 쿼리 한 번으로 조회 (month, 이름 컬럼, total_count)
+def load_monthly_trend(region_ids=None, car_type_ids=None, months=12, split_by=None):
+    connection_successful = check_db_connection() and check_rollup()
     if connection_successful:
-        params = []
-        where_clauses = []
-        
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=30*months)
-        
-        where_clauses.append("cr.registration_date BETWEEN %s AND %s")
-        params.append(start_date.strftime('%Y-%m-%d'))
-        params.append(end_date.strftime('%Y-%m-%d'))
-        
-        if region_id:
-            where_clauses.append("cr.region_id = %s")
-            params.append(region_id)
-        
-        if car_type_id:
-            where_clauses.append("cr.car_type_id = %s")
-            params.append(car_type_id)
-        
-        where_clause = " AND ".join(where_clauses)
-        
-        query = f"""
-            SELECT 
-                DATE_FORMAT(cr.registration_date, '%Y-%m') AS month,
-                SUM(cr.registration_count) AS total_count
-            FROM 
-                car_registration cr
-            WHERE 
-                {where_clause}
-            GROUP BY 
-                DATE_FORMAT(cr.registration_date, '%Y-%m')
-            ORDER BY 
-                month
-        """
-        
-        df = db.query_to_dataframe(query, tuple(params))
+        label = 'load_monthly_comparison' if split_by else 'load_monthly_trend'
+        df = load_monthly_series(region_ids, car_type_ids, months, label=label, split_by=split_by)
         return df
     else:
-        return create_sample_monthly_trend(region_id, car_type_id, months)
+        return create_sample_monthly_trend(region_ids, car_type_ids, months, split_by)
+
+# 지역 × 차종 등록 대수 행렬 로드 -> (지역 이름 목록, 차종 이름 목록, 2차원 배열)
+# 지역/차종 조건과 관계없이 기간 전체를 한 번의 그룹 조회로 집계 (월 구간 캐시로 같은 기간은 재사용)
+def load_region_car_type_matrix(start_date=None, end_date=None):
+    connection_successful = check_db_connection() and check_rollup()
+    if connection_successful:
+        start_date, end_date = default_date_range(start_date, end_date)
+        return load_rollup_matrix('region', 'car_type', start_date, end_date, label='load_region_car_type_matrix')
+    else:
+        return create_sample_region_car_type_matrix(start_date, end_date)
+
+# 탭별 통계 계산 방식 ('slice': 조회 조건의 등록 데이터 요약으로 계산, 'database': 통계마다 DB 집계)
+AGGREGATE_MODE = os.getenv('REGISTRATION_AGGREGATE_MODE', 'slice')
+# 조회 조건의 등록 데이터가 이 행 수를 넘으면 요약을 스트리밍하지 않고 DB 집계로 전환 (COUNT(*) 로 먼저 확인)
+SLICE_AGGREGATE_MAX_ROWS = int(os.getenv('REGISTRATION_SLICE_MAX_ROWS', '200000'))
+MONTHLY_TREND_MONTHS = 12
+# 비교 기준별 이름 컬럼 (DB 집계 결과 / 상세 조회 결과)
+COMPARE_COLUMNS = {'region': 'region_name', 'car_type': 'car_type'}
+SLICE_COMPARE_COLUMNS = {'region': 'region_name', 'car_type': 'car_type_name'}
+COMPARE_LABELS = {'region': '지역', 'car_type': '차종'}
+
+# 등록 건수 합계를 그룹별로 계산 (DB 집계와 같은 컬럼명, 내림차순)
+def sum_registration_count(df, column, output_column):
+    counts = df['registration_count'].astype('int64')
+    result = counts.groupby(df[column], observed=True).sum().sort_values(ascending=False)
+    return result.reset_index().rename(columns={column: output_column, 'registration_count': 'total_count'})
+
+# 두 컬럼 기준 등록 건수 합계 행렬 -> (행 이름 목록, 열 이름 목록, int64 2차원 배열)
+def registration_matrix(df, row_column, column_column):
+    rows = pd.Categorical(df[row_column])
+    columns = pd.Categorical(df[column_column])
+    shape = (len(rows.categories), len(columns.categories))
+    flat = np.bincount(
+        rows.codes.astype(np.int64) * shape[1] + columns.codes,
+        weights=df['registration_count'].to_numpy(dtype=np.float64),
+        minlength=shape[0] * shape[1]
+    )
+    return list(rows.categories), list(columns.categories), flat.astype(np.int64).reshape(shape)
+
+# 여러 지역(또는 차종)을 선택했을 때 비교 기준 ('region' 우선, 둘 다 하나 이하면 None)
+def comparison_dimension(region_ids=None, car_type_ids=None):
+    if len(normalize_ids(region_ids)) > 1:
+        return 'region'
+    if len(normalize_ids(car_type_ids)) > 1:
+        return 'car_type'
+    return None
+
+# 조회 조건의 등록 데이터 요약(슬라이스)에서 같은 조건의 탭 통계를 한 번에 계산
+# 조건이 다른 통계(지역 필터가 있을 때의 지역별 통계 등)는 계산하지 않고 DB 조회에 맡김
+def aggregate_registration_slice(summary, region_ids=None, car_type_ids=None, start_date=None, end_date=None,
+                                 months=MONTHLY_TREND_MONTHS):
+    region_ids, car_type_ids = normalize_ids(region_ids), normalize_ids(car_type_ids)
+    results = {
+        'registration_totals': registration_totals(summary),
+        'manufacturer_stats': sum_registration_count(summary, 'manufacturer_name', 'manufacturer_name'),
+    }
+    
+    # 지역별 통계는 지역 필터 없이, 차종별 통계는 차종 필터 없이 조회하므로 필터가 없을 때만 동일
+    if not region_ids:
+        results['region_stats'] = sum_registration_count(summary, 'region_name', 'region_name')
+    if not car_type_ids:
+        results['car_type_stats'] = sum_registration_count(summary, 'car_type_name', 'car_type')
+    
+    # 지역 × 차종 행렬은 두 필터가 모두 없을 때만 동일 (범주 코드로 바로 행렬 위치 계산)
+    if not region_ids and not car_type_ids:
+        results['region_car_type_matrix'] = registration_matrix(summary, 'region_name', 'car_type_name')
+    
+    # 월별 추이 기간(이번 달까지 최근 months 개 달력 월)이 조회 기간 안에 있을 때만 계산
+    this_month = datetime.now().date().replace(day=1)
+    trend_months = month_starts(shift_month(this_month, 1 - months), this_month)
+    if start_date and end_date and start_date <= trend_months[0] and end_date >= datetime.now().date():
+        dates = pd.to_datetime(summary['month'])
+        in_window = (dates >= pd.Timestamp(trend_months[0])).to_numpy()
+        counts = summary.loc[in_window, 'registration_count'].astype('int64')
+        periods = dates[in_window].dt.to_period('M')
+        month_index = pd.PeriodIndex(trend_months, freq='M')
+        monthly = counts.groupby(periods).sum().reindex(month_index, fill_value=0)
+        results['monthly_trend'] = pd.DataFrame({
+            'month': monthly.index.strftime('%Y-%m'),
+            'total_count': monthly.to_numpy(),
+        })
+        
+        # 비교 기준별 월별 추이 (월 × 기준 으로 펼친 뒤 긴 형식으로)
+        split_by = comparison_dimension(region_ids, car_type_ids)
+        if split_by:
+            names = summary.loc[in_window, SLICE_COMPARE_COLUMNS[split_by]]
+            table = counts.groupby([periods, names], observed=True).sum().unstack(fill_value=0)
+            table = table.reindex(month_index, fill_value=0)
+            table.index = table.index.strftime('%Y-%m')
+            table = table.rename_axis(index='month', columns=COMPARE_COLUMNS[split_by])
+            results['monthly_comparison'] = table.stack().rename('total_count').reset_index()
+    
+    return results
+
+# 검색 결과 탭에 필요한 데이터를 로드
+# 슬라이스 모드에서는 먼저 건수를 세어 SLICE_AGGREGATE_MAX_ROWS 이하일 때만
+# 등록 데이터를 청크 단위로 읽어 요약만 남기고 통계를 그 요약에서 계산하며,
+# 계산할 수 없는 통계(또는 DB 집계 모드의 모든 통계)는 풀의 커넥션으로 동시에 DB 집계
+# 여러 지역/차종을 선택해도 통계마다 IN 조건 쿼리 하나이므로 왕복 횟수는 하나를 선택했을 때와 같음
+def load_search_results(region_ids=None, car_type_ids=None, start_date=None, end_date=None):
+    region_ids, car_type_ids = normalize_ids(region_ids), normalize_ids(car_type_ids)
+    tasks = {
+        'registration_totals': (load_registration_totals, dict(
+            region_ids=region_ids, car_type_ids=car_type_ids, start_date=start_date, end_date=end_date)),
+        'region_stats': (load_region_stats, dict(
+            car_type_ids=car_type_ids, start_date=start_date, end_date=end_date)),
+        'car_type_stats': (load_car_type_stats, dict(
+            region_ids=region_ids, start_date=start_date, end_date=end_date)),
+        'manufacturer_stats': (load_manufacturer_stats, dict(
+            region_ids=region_ids, car_type_ids=car_type_ids, start_date=start_date, end_date=end_date)),
+        'monthly_trend': (load_monthly_trend, dict(
+            region_ids=region_ids, car_type_ids=car_type_ids, months=MONTHLY_TREND_MONTHS)),
+        'region_car_type_matrix': (load_region_car_type_matrix, dict(
+            start_date=start_date, end_date=end_date)),
+    }
+    split_by = comparison_dimension(region_ids, car_type_ids)
+    if split_by:
+        tasks['monthly_comparison'] = (load_monthly_trend, dict(
+            region_ids=region_ids, car_type_ids=car_type_ids, months=MONTHLY_TREND_MONTHS, split_by=split_by))
+    
+    # 작업 스레드에서도 st 호출이 현재 세션에 연결되도록 실행 컨텍스트 전달
+    ctx = get_script_run_ctx()
+    
+    def attach_context():
+        add_script_run_ctx(threading.current_thread(), ctx)
+    
+    started = time.perf_counter()
+    results, timings = {}, {}
+    
+    if AGGREGATE_MODE == 'slice':
+        func, kwargs = tasks.pop('registration_totals')
+        query_started = time.perf_counter()
+        results['registration_totals'] = func(**kwargs)
+        timings['registration_totals'] = time.perf_counter() - query_started
+        
+        # 행 수가 기준을 넘으면 나머지 통계는 DB 집계 (요약 스트리밍 시간이 행 수에 비례하므로)
+        if results['registration_totals']['rows'] <= SLICE_AGGREGATE_MAX_ROWS:
+            query_started = time.perf_counter()
+            summary = load_registration_summary(**kwargs)
+            timings['registration_summary'] = time.perf_counter() - query_started
+            
+            aggregate_started = time.perf_counter()
+            derived = aggregate_registration_slice(summary, region_ids, car_type_ids, start_date, end_date)
+            timings['슬라이스 집계'] = time.perf_counter() - aggregate_started
+            results.update(derived)
+            for name in derived:
+                tasks.pop(name, None)
+    
+    if tasks:
+        remaining, remaining_timings = run_concurrently(tasks, max_workers=db.pool.pool_size, initializer=attach_context)
+        results.update(remaining)
+        timings.update(remaining_timings)
+    
+    timings['전체'] = time.perf_counter() - started
+    return results, timings
+
+# 상세 데이터 탭 페이지 크기 선택지와 표시 컬럼
+DETAIL_PAGE_SIZES = [25, 50, 100, 200]
+DETAIL_COLUMNS = {
+    'registration_date': '등록일',
+    'region_name': '지역',
+    'car_type_name': '차종',
+    'manufacturer_name': '제조사',
+    'car_model_name': '모델명',
+    'registration_count': '등록대수'
+}
+
+# 내보내기 형식별 (확장자, MIME) - Parquet 는 pyarrow 가 설치된 경우에만 제공
+EXPORT_FORMATS = {
+    'CSV': ('csv', 'text/csv'),
+    'CSV (gzip)': ('csv.gz', 'application/gzip'),
+}
+if importlib.util.find_spec('pyarrow') is not None:
+    EXPORT_FORMATS['Parquet'] = ('parquet', 'application/vnd.apache.parquet')
+
+# 내보내기 파일 디렉터리와 보관 시간(초) - 다운로드하지 않고 떠난 세션의 파일은 다음 내보내기 때 정리
+EXPORT_DIR = os.path.join(tempfile.gettempdir(), 'car_registration_exports')
+EXPORT_FILE_TTL = int(os.getenv('EXPORT_FILE_TTL', '3600'))
+
+# 보관 시간이 지난 내보내기 파일 삭제 (다른 세션이 지우는 중인 파일은 무시)
+def remove_stale_exports():
+    cutoff = time.time() - EXPORT_FILE_TTL
+    for name in os.listdir(EXPORT_DIR):
+        path = os.path.join(EXPORT_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+# 검색 조건의 등록 데이터를 DB 커서에서 청크 단위로 읽어 임시 파일에 기록 (메모리는 청크 크기에 비례)
+def export_registration_data(filters, export_format):
+    extension, _ = EXPORT_FORMATS[export_format]
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    remove_stale_exports()
+    chunks = iter_registration_data(**filters)
+    with tempfile.NamedTemporaryFile(suffix=f'.{extension}', dir=EXPORT_DIR, delete=False) as f:
+        if export_format == 'Parquet':
+            rows = write_parquet_chunks(chunks, f, rename=DETAIL_COLUMNS)
+        elif export_format == 'CSV (gzip)':
+            with gzip.GzipFile(fileobj=f, mode='wb') as gz:
+                rows = write_csv_chunks(chunks, gz, rename=DETAIL_COLUMNS)
+        else:
+            rows = write_csv_chunks(chunks, f, rename=DETAIL_COLUMNS)
+    return f.name, rows
+
+# 이전에 만든 내보내기 파일 삭제 (새 검색/내보내기, 다운로드 후)
+def remove_export_file():
+    export = st.session_state.pop('export', None)
+    if export and os.path.exists(export['path']):
+        os.remove(export['path'])
+
+# 상세 데이터 페이지 이동 (direction: -1 이전, 1 다음)
+def move_detail_page(direction):
+    pager = st.session_state['detail_pager']
+    if direction < 0 and len(pager['cursors']) > 1:
+        pager['cursors'].pop()
+    elif direction > 0 and pager['next_cursor']:
+        pager['cursors'].append(pager['next_cursor'])
 
 # 메인 함수
 def main():
@@ -494,6 +743,10 @@ def main():
     connection_successful = check_db_connection()
     if not connection_successful:
         st.warning("데이터베이스에 연결할 수 없습니다. 샘플 데이터를 사용합니다.")
+    elif rollup_available() and rollup_pending_rows():
+        # 자동 갱신이 꺼져 있거나 실패한 경우 - 통계 탭이 최신 등록 데이터보다 뒤처져 있음
+        st.warning(f"집계 테이블에 아직 반영되지 않은 등록 데이터가 {rollup_pending_rows():,}건 있습니다. "
+                   "`python -m database.rollup` 으로 갱신하면 통계 탭에 반영됩니다.")
         
     # 데이터 로드
     regions, region_dict = load_regions()
@@ -508,18 +761,20 @@ def main():
         col1, col2 = st.columns(2)
         
         with col1:
-            # 지역 선택
-            selected_region = st.selectbox(
+            # 지역 선택 (여러 개 선택하면 비교, 선택하지 않으면 전체 지역)
+            selected_regions = st.multiselect(
                 "지역 선택",
-                options=[None] + [region['id'] for region in regions],
-                format_func=lambda x: "전체 지역" if x is None else region_dict.get(x, "")
+                options=[region['id'] for region in regions],
+                format_func=lambda x: region_dict.get(x, ""),
+                placeholder="전체 지역"
             )
             
             # 차종 선택
-            selected_car_type = st.selectbox(
+            selected_car_types = st.multiselect(
                 "차종 선택",
-                options=[None] + [car_type['id'] for car_type in car_types],
-                format_func=lambda x: "전체 차종" if x is None else car_type_dict.get(x, "")
+                options=[car_type['id'] for car_type in car_types],
+                format_func=lambda x: car_type_dict.get(x, ""),
+                placeholder="전체 차종"
             )
         
         with col2:
@@ -545,62 +800,115 @@ def main():
         
         st.markdown('</div>', unsafe_allow_html=True)
     
-    # 검색 결과 표시
+    # 검색 결과는 세션에 저장하여 페이지 이동 등으로 다시 실행될 때도 유지
     if search_button:
-        st.markdown('<div class="sub-header">검색 결과</div>', unsafe_allow_html=True)
-        
-        # 등록 현황 데이터 로드
-        registration_data = load_registration_data(
-            region_id=selected_region,
-            car_type_id=selected_car_type,
+        filters = dict(
+            region_ids=normalize_ids(selected_regions),
+            car_type_ids=normalize_ids(selected_car_types),
             start_date=start_date,
             end_date=end_date
         )
+        # 등록 현황 및 탭별 통계 데이터 로드
+        results, timings = load_search_results(**filters)
+        st.session_state['search'] = {'filters': filters, 'results': results, 'timings': timings}
+        st.session_state['detail_pager'] = {'page_size': None, 'cursors': [None], 'next_cursor': None}
+        remove_export_file()
+    
+    # 검색 결과 표시
+    search = st.session_state.get('search')
+    if search:
+        st.markdown('<div class="sub-header">검색 결과</div>', unsafe_allow_html=True)
         
-        if registration_data.empty:
+        filters = search['filters']
+        results = search['results']
+        timings = search['timings']
+        registration_totals = results['registration_totals']
+        
+        # 쿼리별 소요 시간
+        with st.expander("쿼리 실행 시간"):
+            timing_df = pd.DataFrame(
+                [(name, seconds * 1000) for name, seconds in timings.items()],
+                columns=['조회', '소요 시간(ms)']
+            )
+            st.dataframe(timing_df, use_container_width=True)
+        
+        if registration_totals['rows'] == 0:
             st.warning("검색 조건에 맞는 데이터가 없습니다.")
         else:
             # 총 등록 대수 표시
-            total_count = registration_data['registration_count'].sum()
+            total_count = registration_totals['total_count']
             st.markdown(f"### 총 등록 대수: {total_count:,}대")
             
-            # 탭 생성
-            tab1, tab2, tab3, tab4, tab5 = st.tabs([
-                "상세 데이터", "지역별 현황", "차종별 현황", "제조사별 현황", "월별 추이"
-            ])
+            # 탭 생성 (지역/차종을 여러 개 선택했으면 비교 탭 추가)
+            split_by = comparison_dimension(filters['region_ids'], filters['car_type_ids'])
+            tab_names = ["상세 데이터", "지역별 현황", "차종별 현황", "제조사별 현황", "월별 추이", "지역×차종"]
+            if split_by:
+                tab_names.append(f"{COMPARE_LABELS[split_by]} 비교")
+            tab1, tab2, tab3, tab4, tab5, tab6, *compare_tab = st.tabs(tab_names)
             
-            # 탭 1: 상세 데이터
+            # 탭 1: 상세 데이터 (현재 페이지만 DB 에서 조회하여 표시)
             with tab1:
-                # 데이터 표시 전 포맷팅
-                display_df = registration_data.copy()
-                display_df['registration_date'] = pd.to_datetime(display_df['registration_date']).dt.strftime('%Y-%m-%d')
-                display_df = display_df.rename(columns={
-                    'registration_date': '등록일',
-                    'region_name': '지역',
-                    'car_type_name': '차종',
-                    'car_model_name': '모델명',
-                    'manufacturer_name': '제조사',
-                    'registration_count': '등록대수'
-                })
+                pager = st.session_state['detail_pager']
+                page_size = st.selectbox("페이지 크기", options=DETAIL_PAGE_SIZES, index=1, key='detail_page_size')
+                if pager['page_size'] != page_size:
+                    pager.update(page_size=page_size, cursors=[None], next_cursor=None)
                 
-                st.dataframe(display_df[['등록일', '지역', '차종', '제조사', '모델명', '등록대수']], use_container_width=True)
+                page_df = load_registration_page(**filters, page_size=page_size, after=pager['cursors'][-1])
+                has_next = len(page_df) > page_size
+                page_df = page_df.head(page_size)
+                if has_next:
+                    last_row = page_df.iloc[-1]
+                    pager['next_cursor'] = (
+                        pd.Timestamp(last_row['registration_date']).strftime('%Y-%m-%d'),
+                        int(last_row['id'])
+                    )
+                else:
+                    pager['next_cursor'] = None
                 
-                # CSV 다운로드 버튼
-                csv = display_df.to_csv(index=False).encode('utf-8-sig')
-                st.download_button(
-                    label="CSV 다운로드",
-                    data=csv,
-                    file_name=f"car_registration_data_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv"
+                # 보이는 행만 날짜 포맷팅
+                display_df = page_df.copy()
+                display_df['registration_date'] = pd.to_datetime(display_df['registration_date']).dt.strftime('%Y-%m-%d')
+                display_df = display_df.rename(columns=DETAIL_COLUMNS)
+                st.dataframe(
+                    display_df[[column for column in DETAIL_COLUMNS.values() if column in display_df.columns]],
+                    use_container_width=True
                 )
+                
+                # 페이지 이동 (콜백에서 커서를 바꾸므로 다음 실행에서 바로 해당 페이지를 조회)
+                col_prev, col_page, col_next = st.columns([1, 2, 1])
+                with col_prev:
+                    st.button("이전", on_click=move_detail_page, args=(-1,), disabled=len(pager['cursors']) == 1)
+                with col_page:
+                    st.markdown(f"{len(pager['cursors'])} 페이지 / 총 {registration_totals['rows']:,}건")
+                with col_next:
+                    st.button("다음", on_click=move_detail_page, args=(1,), disabled=not has_next)
+                
+                # 내보내기 - 버튼을 눌렀을 때만 DB 에서 청크 단위로 파일 생성
+                col_format, col_export = st.columns([1, 1])
+                with col_format:
+                    export_format = st.selectbox("내보내기 형식", options=list(EXPORT_FORMATS), key='export_format')
+                with col_export:
+                    if st.button("내보내기 파일 생성"):
+                        remove_export_file()
+                        with st.spinner("내보내기 파일 생성 중..."):
+                            path, rows = export_registration_data(filters, export_format)
+                        st.session_state['export'] = {'path': path, 'format': export_format, 'rows': rows}
+                
+                export = st.session_state.get('export')
+                if export and os.path.exists(export['path']):
+                    extension, mime = EXPORT_FORMATS[export['format']]
+                    with open(export['path'], 'rb') as f:
+                        st.download_button(
+                            label=f"{export['format']} 다운로드 ({export['rows']:,}건)",
+                            data=f,
+                            file_name=f"car_registration_data_{datetime.now().strftime('%Y%m%d')}.{extension}",
+                            mime=mime,
+                            on_click=remove_export_file
+                        )
             
             # 탭 2: 지역별 현황
             with tab2:
-                region_stats = load_region_stats(
-                    car_type_id=selected_car_type,
-                    start_date=start_date,
-                    end_date=end_date
-                )
+                region_stats = results['region_stats']
                 
                 if not region_stats.empty:
                     # 막대 차트
@@ -622,11 +930,7 @@ def main():
             
             # 탭 3: 차종별 현황
             with tab3:
-                car_type_stats = load_car_type_stats(
-                    region_id=selected_region,
-                    start_date=start_date,
-                    end_date=end_date
-                )
+                car_type_stats = results['car_type_stats']
                 
                 if not car_type_stats.empty:
                     # 파이 차트
@@ -646,12 +950,7 @@ def main():
             
             # 탭 4: 제조사별 현황
             with tab4:
-                manufacturer_stats = load_manufacturer_stats(
-                    region_id=selected_region,
-                    car_type_id=selected_car_type,
-                    start_date=start_date,
-                    end_date=end_date
-                )
+                manufacturer_stats = results['manufacturer_stats']
                 
                 if not manufacturer_stats.empty:
                     # 막대 차트
@@ -673,10 +972,7 @@ def main():
             
             # 탭 5: 월별 추이
             with tab5:
-                monthly_trend = load_monthly_trend(
-                    region_id=selected_region,
-                    car_type_id=selected_car_type
-                )
+                monthly_trend = results['monthly_trend']
                 
                 if not monthly_trend.empty:
                     # 라인 차트
@@ -694,6 +990,82 @@ def main():
                     # 데이터 테이블
                     display_df = monthly_trend.reset_index(drop=True)
                     st.dataframe(display_df, use_container_width=True)
+            
+            # 탭 6: 지역 × 차종 히트맵 (지역/차종 조건과 관계없이 기간 전체)
+            with tab6:
+                region_names, car_type_names, matrix = results['region_car_type_matrix']
+                
+                if matrix.sum() > 0:
+                    # 히트맵
+                    fig = px.imshow(
+                        matrix,
+                        x=car_type_names,
+                        y=region_names,
+                        title='지역 × 차종 등록 현황',
+                        labels={'x': '차종', 'y': '지역', 'color': '등록 대수'},
+                        color_continuous_scale='Blues',
+                        text_auto=True,
+                        aspect='auto'
+                    )
+                    fig.update_layout(height=700)
+                    st.plotly_chart(fig, use_container_width=True)
+                    
+                    # 데이터 테이블
+                    display_df = pd.DataFrame(matrix, index=region_names, columns=car_type_names)
+                    st.dataframe(display_df, use_container_width=True)
+            
+            # 탭 7: 선택한 지역/차종 비교 (추가 조회 없이 이미 받은 집계 결과를 메모리에서 피벗)
+            if split_by:
+                with compare_tab[0]:
+                    name_column = COMPARE_COLUMNS[split_by]
+                    compare_label = COMPARE_LABELS[split_by]
+                    monthly_comparison = results['monthly_comparison']
+                    
+                    if not monthly_comparison.empty:
+                        # 월별 추이 비교 (기준별 라인)
+                        fig = px.line(
+                            monthly_comparison,
+                            x='month',
+                            y='total_count',
+                            color=name_column,
+                            title=f'{compare_label}별 월별 등록 추이',
+                            labels={'month': '월', 'total_count': '등록 대수', name_column: compare_label},
+                            markers=True
+                        )
+                        fig.update_layout(height=500)
+                        st.plotly_chart(fig, use_container_width=True)
+                        
+                        # 월 × 기준 피벗 테이블
+                        pivot_df = monthly_comparison.pivot_table(
+                            index='month', columns=name_column, values='total_count', aggfunc='sum', observed=True
+                        )
+                        st.dataframe(pivot_df, use_container_width=True)
+                    
+                    # 선택한 지역의 차종 구성 (또는 선택한 차종의 지역 분포) - 지역 × 차종 행렬에서 선택한 행/열만 사용
+                    selected_regions = {region_dict[region_id] for region_id in filters['region_ids'] if region_id in region_dict}
+                    selected_car_types = {car_type_dict[car_type_id] for car_type_id in filters['car_type_ids'] if car_type_id in car_type_dict}
+                    row_mask = np.array([not selected_regions or name in selected_regions for name in region_names], dtype=bool)
+                    column_mask = np.array([not selected_car_types or name in selected_car_types for name in car_type_names], dtype=bool)
+                    composition = pd.DataFrame(
+                        matrix[np.ix_(row_mask, column_mask)],
+                        index=pd.Index(np.array(region_names, dtype=object)[row_mask], name='region_name'),
+                        columns=pd.Index(np.array(car_type_names, dtype=object)[column_mask], name='car_type')
+                    )
+                    composition = composition.stack().rename('total_count').reset_index()
+                    
+                    if composition['total_count'].sum() > 0:
+                        x_column, color_column = ('region_name', 'car_type') if split_by == 'region' else ('car_type', 'region_name')
+                        fig = px.bar(
+                            composition,
+                            x=x_column,
+                            y='total_count',
+                            color=color_column,
+                            barmode='group',
+                            title=f'선택한 {compare_label}별 {"차종 구성" if split_by == "region" else "지역 분포"}',
+                            labels={'region_name': '지역', 'car_type': '차종', 'total_count': '등록 대수'}
+                        )
+                        fig.update_layout(height=500)
+                        st.plotly_chart(fig, use_container_width=True)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
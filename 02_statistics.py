@@ -11,6 +11,9 @@ from datetime import datetime, timedelta
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from database.db_connector import db
+from database.filters import append_date_range
+from database.rollup import load_registration_base
+from database.ranking import manufacturer_share_trend, SHARE_TREND_QUERY
 from database.models import (
     Region, CarType, Manufacturer, CarModel, CarRegistration
 )
@@ -57,28 +60,38 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# 친환경 차종과 분류 이름 (분류 코드 0: 일반, 1: 친환경)
+ECO_FRIENDLY_CAR_TYPES = ['전기차', '하이브리드', '수소차']
+CAR_CATEGORIES = ['일반 차량', '친환경 차량']
+
+# 연도별 상위 제조사 순위를 DB 윈도 함수로 계산할지 여부
+RANK_PUSHDOWN = os.getenv('STATISTICS_RANK_PUSHDOWN', '0') == '1'
+
+# 기본 집계(연도 × 월 × 지역 × 차종 × 제조사 × 국가)를 keys 기준으로 다시 묶은 등록 대수 합계
+# 범주형 이름은 문자열로 바꾸고 기준 정보에 없는 그룹(NaN)은 제외
+def sum_registrations(df, keys, value_name='total_count'):
+    result = df.groupby(keys, observed=True)['total_count'].sum().reset_index()
+    for key in keys:
+        result[key] = result[key].astype('int64') if key in ('year', 'month') else result[key].astype(str)
+    return result.rename(columns={'total_count': value_name})
+
+# 연도 조건 (year 가 없으면 전체)
+def filter_year(df, year=None):
+    return df[df['year'] == int(year)] if year else df
+
 # 연도별 등록 현황 데이터 로드
-@st.cache_data(ttl=3600)
 def load_yearly_stats():
     try:
-        # 데이터베이스 연결 상태 확인
+        # 데이터베이스 연결 상태 확인 (재연결은 헬스 모니터가 백그라운드에서 처리)
         if not db.is_connected():
-            st.warning("데이터베이스 연결이 끊어졌습니다. 다시 연결을 시도합니다.")
-            db.connect()
-        
-        query = """
-            SELECT 
-                YEAR(registration_date) AS year,
-                SUM(registration_count) AS total_count
-            FROM 
-                car_registration
-            GROUP BY 
-                YEAR(registration_date)
-            ORDER BY 
-                year
-        """
+            st.warning("데이터베이스 연결이 끊어졌습니다. 샘플 데이터를 표시합니다.")
+            return pd.DataFrame({
+                'year': [2020, 2021, 2022, 2023],
+                'total_count': [1250000, 1320000, 1450000, 1560000]
+            })
         
-        df = db.query_to_dataframe(query)
+        # 기본 집계에서 계산
+        df = sum_registrations(load_registration_base(), ['year']).sort_values('year', ignore_index=True)
         
         # 데이터가 비어있는 경우 샘플 데이터 반환
         if df.empty:
@@ -99,143 +112,58 @@ def load_yearly_stats():
         })
 
 # 연도별 차종 등록 현황 데이터 로드
-@st.cache_data(ttl=3600)
 def load_yearly_car_type_stats():
-    query = """
-        SELECT 
-            YEAR(cr.registration_date) AS year,
-            ct.name AS car_type,
-            SUM(cr.registration_count) AS total_count
-        FROM 
-            car_registration cr
-        JOIN 
-            car_types ct ON cr.car_type_id = ct.id
-        GROUP BY 
-            YEAR(cr.registration_date), ct.name
-        ORDER BY 
-            year, ct.name
-    """
-    
-    df = db.query_to_dataframe(query)
-    return df
+    df = sum_registrations(load_registration_base(), ['year', 'car_type'])
+    return df.sort_values(['year', 'car_type'], ignore_index=True)
 
 # 연도별 지역 등록 현황 데이터 로드
-@st.cache_data(ttl=3600)
 def load_yearly_region_stats():
-    query = """
-        SELECT 
-            YEAR(cr.registration_date) AS year,
-            r.name AS region,
-            SUM(cr.registration_count) AS total_count
-        FROM 
-            car_registration cr
-        JOIN 
-            regions r ON cr.region_id = r.id
-        GROUP BY 
-            YEAR(cr.registration_date), r.name
-        ORDER BY 
-            year, r.name
-    """
-    
-    df = db.query_to_dataframe(query)
-    return df
+    df = sum_registrations(load_registration_base(), ['year', 'region'])
+    return df.sort_values(['year', 'region'], ignore_index=True)
 
 # 연도별 제조사 등록 현황 데이터 로드
-@st.cache_data(ttl=3600)
 def load_yearly_manufacturer_stats():
-    query = """
-        SELECT 
-            YEAR(cr.registration_date) AS year,
-            m.name AS manufacturer,
-            SUM(cr.registration_count) AS total_count
-        FROM 
-            car_registration cr
-        JOIN 
-            car_models cm ON cr.car_model_id = cm.id
-        JOIN 
-            manufacturers m ON cm.manufacturer_id = m.id
-        GROUP BY 
-            YEAR(cr.registration_date), m.name
-        ORDER BY 
-            year, m.name
-    """
-    
-    df = db.query_to_dataframe(query)
-    return df
+    df = sum_registrations(load_registration_base(), ['year', 'manufacturer'])
+    return df.sort_values(['year', 'manufacturer'], ignore_index=True)
 
 # 전기차 등록 현황 데이터 로드
-@st.cache_data(ttl=3600)
 def load_ev_stats():
-    query = """
-        SELECT 
-            YEAR(cr.registration_date) AS year,
-            r.name AS region,
-            SUM(cr.registration_count) AS ev_count
-        FROM 
-            car_registration cr
-        JOIN 
-            regions r ON cr.region_id = r.id
-        JOIN 
-            car_types ct ON cr.car_type_id = ct.id
-        WHERE 
-            ct.name = '전기차'
-        GROUP BY 
-            YEAR(cr.registration_date), r.name
-        ORDER BY 
-            year, r.name
-    """
-    
-    df = db.query_to_dataframe(query)
-    return df
+    base = load_registration_base()
+    df = sum_registrations(base[base['car_type'] == '전기차'], ['year', 'region'], 'ev_count')
+    return df.sort_values(['year', 'region'], ignore_index=True)
 
 # 친환경 차량 등록 비율 데이터 로드
-@st.cache_data(ttl=3600)
+# 차종 범주마다 분류를 한 번만 정하고(범주 수 크기의 배열) 행에는 범주 코드로 조회하여 적용
+# 연도 × 분류 한 번의 집계에서 연도별 합계는 transform 으로 계산
 def load_eco_friendly_ratio():
-    query = """
-        SELECT 
-            YEAR(cr.registration_date) AS year,
-            ct.name AS car_type,
-            SUM(cr.registration_count) AS count
-        FROM 
-            car_registration cr
-        JOIN 
-            car_types ct ON cr.car_type_id = ct.id
-        WHERE 
-            ct.name IN ('전기차', '하이브리드', '수소차')
-            OR ct.name NOT IN ('전기차', '하이브리드', '수소차')
-        GROUP BY 
-            YEAR(cr.registration_date), ct.name
-        ORDER BY 
-            year, ct.name
-    """
-    
-    df = db.query_to_dataframe(query)
-    
-    # 친환경 차량과 일반 차량으로 분류
-    df['category'] = df['car_type'].apply(lambda x: '친환경 차량' if x in ['전기차', '하이브리드', '수소차'] else '일반 차량')
-    
-    # 연도별 카테고리별 합계 계산
-    df_summary = df.groupby(['year', 'category'])['count'].sum().reset_index()
-    
-    # 연도별 총합 계산
-    df_total = df_summary.groupby('year')['count'].sum().reset_index()
-    df_total.rename(columns={'count': 'total'}, inplace=True)
-    
-    # 비율 계산을 위해 데이터 병합
-    df_result = pd.merge(df_summary, df_total, on='year')
+    base = load_registration_base()
+    car_type_codes = base['car_type'].cat.codes.to_numpy()
+    category_lookup = np.isin(base['car_type'].cat.categories, ECO_FRIENDLY_CAR_TYPES).astype(np.int8)
+    
+    # 기준 정보에 없는 차종은 제외
+    known = car_type_codes >= 0
+    df = pd.DataFrame({
+        'year': base['year'].to_numpy()[known],
+        'category': pd.Categorical.from_codes(category_lookup[car_type_codes[known]], categories=CAR_CATEGORIES),
+        'count': base['total_count'].to_numpy()[known],
+    })
+    
+    df_result = df.groupby(['year', 'category'], observed=True)['count'].sum().reset_index()
+    df_result['year'] = df_result['year'].astype('int64')
+    df_result['category'] = df_result['category'].astype(str)
+    df_result['total'] = df_result.groupby('year')['count'].transform('sum')
     df_result['ratio'] = df_result['count'] / df_result['total'] * 100
     
     return df_result
 
 # 상위 10개 모델 데이터 로드
-@st.cache_data(ttl=3600)
 def load_top_models(year=None):
     params = []
-    where_clause = ""
+    where_clauses = []
     
-    if year:
-        where_clause = "WHERE YEAR(cr.registration_date) = %s"
-        params.append(year)
+    # 연도 조건은 registration_date 반열린 범위로 (인덱스 사용 가능)
+    append_date_range(where_clauses, params, "cr.registration_date", year)
+    where_clause = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
     
     query = f"""
         SELECT 
@@ -256,72 +184,31 @@ def load_top_models(year=None):
         LIMIT 10
     """
     
-    df = db.query_to_dataframe(query, tuple(params) if params else None)
+    df = db.query_to_dataframe(query, tuple(params) if params else None, label='load_top_models', cached=True)
     return df
 
 # 연도별 월별 등록 추이 데이터 로드
-@st.cache_data(ttl=3600)
 def load_monthly_trend_by_year(year=None):
-    params = []
-    where_clause = ""
-    
-    if year:
-        where_clause = "WHERE YEAR(registration_date) = %s"
-        params.append(year)
-    
-    query = f"""
-        SELECT 
-            YEAR(registration_date) AS year,
-            MONTH(registration_date) AS month,
-            SUM(registration_count) AS total_count
-        FROM 
-            car_registration
-        {where_clause}
-        GROUP BY 
-            YEAR(registration_date), MONTH(registration_date)
-        ORDER BY 
-            year, month
-    """
-    
-    df = db.query_to_dataframe(query, tuple(params) if params else None)
-    return df
+    df = sum_registrations(filter_year(load_registration_base(), year), ['year', 'month'])
+    return df.sort_values(['year', 'month'], ignore_index=True)
 
 # 지역별 차종 선호도 데이터 로드
-@st.cache_data(ttl=3600)
 def load_region_car_type_preference():
-    query = """
-        SELECT 
-            r.name AS region,
-            ct.name AS car_type,
-            SUM(cr.registration_count) AS total_count
-        FROM 
-            car_registration cr
-        JOIN 
-            regions r ON cr.region_id = r.id
-        JOIN 
-            car_types ct ON cr.car_type_id = ct.id
-        GROUP BY 
-            r.name, ct.name
-        ORDER BY 
-            r.name, total_count DESC
-    """
-    
-    df = db.query_to_dataframe(query)
+    df = sum_registrations(load_registration_base(), ['region', 'car_type'])
+    df = df.sort_values(['region', 'total_count'], ascending=[True, False], ignore_index=True)
     
     # 각 지역별로 가장 선호하는 차종 찾기
-    top_preferences = df.loc[df.groupby('region')['total_count'].idxmax()]
+    top_preferences = df.loc[df.groupby('region', observed=True)['total_count'].idxmax()]
     
     return df, top_preferences
 
 # 제조사별 상위 모델 데이터 로드
-@st.cache_data(ttl=3600)
 def load_top_models_by_manufacturer(year=None, manufacturer_id=None):
     params = []
     where_clauses = []
     
-    if year:
-        where_clauses.append("YEAR(cr.registration_date) = %s")
-        params.append(year)
+    # 연도 조건은 registration_date 반열린 범위로 (인덱스 사용 가능)
+    append_date_range(where_clauses, params, "cr.registration_date", year)
     
     if manufacturer_id:
         where_clauses.append("m.id = %s")
@@ -348,11 +235,10 @@ def load_top_models_by_manufacturer(year=None, manufacturer_id=None):
         LIMIT 20
     """
     
-    df = db.query_to_dataframe(query, tuple(params) if params else None)
+    df = db.query_to_dataframe(query, tuple(params) if params else None, label='load_top_models_by_manufacturer', cached=True)
     return df
 
 # 제조사 데이터 로드
-@st.cache_data(ttl=3600)
 def load_manufacturers():
     query = """
         SELECT id, name
@@ -360,97 +246,26 @@ def load_manufacturers():
         ORDER BY name
     """
     
-    df = db.query_to_dataframe(query)
+    df = db.query_to_dataframe(query, label='load_manufacturers', cached=True)
     return df
 
-# 국산차 vs 수입차 비교 데이터 로드
-@st.cache_data(ttl=3600)
+# 국산차 vs 수입차 비교 데이터 로드 (제조사가 확인되는 등록 건만)
 def load_domestic_vs_import_data():
-    query = """
-        SELECT 
-            YEAR(cr.registration_date) AS year,
-            CASE 
-                WHEN m.country = '대한민국' THEN '국산차'
-                ELSE '수입차'
-            END AS car_origin,
-            SUM(cr.registration_count) AS total_count
-        FROM 
-            car_registration cr
-        JOIN 
-            car_models cm ON cr.car_model_id = cm.id
-        JOIN 
-            manufacturers m ON cm.manufacturer_id = m.id
-        GROUP BY 
-            YEAR(cr.registration_date),
-            CASE 
-                WHEN m.country = '대한민국' THEN '국산차'
-                ELSE '수입차'
-            END
-        ORDER BY 
-            year, car_origin
-    """
-    
-    df = db.query_to_dataframe(query)
-    return df
+    base = load_registration_base()
+    base = base[base['manufacturer'].notna().to_numpy()]
+    origin = np.where(base['country'] == '대한민국', '국산차', '수입차')
+    df = sum_registrations(base.assign(car_origin=origin), ['year', 'car_origin'])
+    return df.sort_values(['year', 'car_origin'], ignore_index=True)
 
 # 국가별 등록 데이터 로드
-@st.cache_data(ttl=3600)
 def load_country_registration_data(year=None):
-    params = []
-    where_clause = ""
-    
-    if year:
-        where_clause = "WHERE YEAR(cr.registration_date) = %s"
-        params.append(year)
-    
-    query = f"""
-        SELECT 
-            m.country,
-            SUM(cr.registration_count) AS total_count
-        FROM 
-            car_registration cr
-        JOIN 
-            car_models cm ON cr.car_model_id = cm.id
-        JOIN 
-            manufacturers m ON cm.manufacturer_id = m.id
-        {where_clause}
-        GROUP BY 
-            m.country
-        ORDER BY 
-            total_count DESC
-    """
-    
-    df = db.query_to_dataframe(query, tuple(params) if params else None)
-    return df
+    df = sum_registrations(filter_year(load_registration_base(), year), ['country'])
+    return df.sort_values('total_count', ascending=False, ignore_index=True)
 
 # 제조사 시장점유율 데이터 로드
-@st.cache_data(ttl=3600)
 def load_manufacturer_market_share(year=None):
-    params = []
-    where_clause = ""
-    
-    if year:
-        where_clause = "WHERE YEAR(cr.registration_date) = %s"
-        params.append(year)
-    
-    query = f"""
-        SELECT 
-            m.name AS manufacturer,
-            SUM(cr.registration_count) AS total_count
-        FROM 
-            car_registration cr
-        JOIN 
-            car_models cm ON cr.car_model_id = cm.id
-        JOIN 
-            manufacturers m ON cm.manufacturer_id = m.id
-        {where_clause}
-        GROUP BY 
-            m.name
-        ORDER BY 
-            total_count DESC
-    """
-    
-    df = db.query_to_dataframe(query, tuple(params) if params else None)
+    df = sum_registrations(filter_year(load_registration_base(), year), ['manufacturer'])
+    df = df.sort_values('total_count', ascending=False, ignore_index=True)
     
     # 총 등록대수 계산
     total = df['total_count'].sum()
@@ -469,48 +284,14 @@ def load_manufacturer_market_share(year=None):
     
     return result
 
-# 연도별 제조사 점유율 추이 데이터
-@st.cache_data(ttl=3600)
+# 연도별 제조사 점유율 추이 데이터 (연도별 상위 top_n 에 든 제조사)
+# 기본은 기본 집계에서 groupby 순위로 계산하고, STATISTICS_RANK_PUSHDOWN=1 이면 윈도 함수 쿼리로 DB 에서 계산
 def load_manufacturer_share_trend(top_n=5):
-    query = f"""
-        SELECT 
-            YEAR(cr.registration_date) AS year,
-            m.name AS manufacturer,
-            SUM(cr.registration_count) AS total_count
-        FROM 
-            car_registration cr
-        JOIN 
-            car_models cm ON cr.car_model_id = cm.id
-        JOIN 
-            manufacturers m ON cm.manufacturer_id = m.id
-        GROUP BY 
-            YEAR(cr.registration_date), m.name
-        ORDER BY 
-            year, total_count DESC
-    """
+    if RANK_PUSHDOWN:
+        return db.query_to_dataframe(SHARE_TREND_QUERY, (top_n,), label='load_manufacturer_share_trend', cached=True)
     
-    df = db.query_to_dataframe(query)
-    
-    # 각 연도별 총 등록대수 계산
-    yearly_total = df.groupby('year')['total_count'].sum().reset_index()
-    yearly_total.rename(columns={'total_count': 'yearly_total'}, inplace=True)
-    
-    # 연도별 데이터와 총합 병합
-    df = pd.merge(df, yearly_total, on='year')
-    
-    # 점유율 계산
-    df['share'] = df['total_count'] / df['yearly_total'] * 100
-    
-    # 연도별 상위 제조사 구하기
-    top_manufacturers = set()
-    for year in df['year'].unique():
-        year_data = df[df['year'] == year].sort_values('total_count', ascending=False)
-        top_manufacturers.update(year_data.head(top_n)['manufacturer'].tolist())
-    
-    # 상위 제조사만 필터링
-    df_filtered = df[df['manufacturer'].isin(top_manufacturers)]
-    
-    return df_filtered
+    df = sum_registrations(load_registration_base(), ['year', 'manufacturer'])
+    return manufacturer_share_trend(df, top_n)
 
 # 메인 함수
 def main():
@@ -521,7 +302,20 @@ def main():
         "분석 유형 선택",
         ["연도별 등록 추이", "차종별 분석", "지역별 분석", "제조사/모델 분석", "친환경 차량 분석", "국산차 vs 수입차 분석", "제조사 시장점유율 분석"]
     )
-    
+
+    # 사이드바 - 조회 결과 캐시 사용 현황 (로더별 hit/miss/eviction, 상주 메모리)
+    with st.sidebar.expander("캐시 사용 현황"):
+        cache_stats = db.cache_stats()
+        st.caption(f"{cache_stats['entries']}개 항목, {cache_stats['resident_bytes'] / 1e6:.1f} / {cache_stats['max_bytes'] / 1e6:.0f} MB")
+        if cache_stats['loaders']:
+            st.dataframe(pd.DataFrame.from_dict(cache_stats['loaders'], orient='index'), use_container_width=True)
+        # 로더별 dtype 정리(Categorical/작은 정수형/datetime64) 전/후 결과 크기
+        memory_stats = db.memory_stats()
+        if memory_stats:
+            st.caption("dtype 정리 전/후 메모리")
+            memory_df = pd.DataFrame.from_dict(memory_stats, orient='index')
+            st.dataframe(memory_df[['calls', 'before_bytes', 'after_bytes', 'ratio']], use_container_width=True)
+
     # 연도별 등록 추이 분석
     if analysis_type == "연도별 등록 추이":
         st.markdown('<div class="sub-header">연도별 등록 추이 분석</div>', unsafe_allow_html=True)
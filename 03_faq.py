@@ -9,7 +9,7 @@ import re
 # 상위 디렉토리 추가하여 database 모듈 import 가능하게 설정
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from database.db_connector import DatabaseConnector
+from database.db_connector import db
 from database.models import (
     Industry, Company, FAQCategory, CompanyFAQ
 )
@@ -104,13 +104,10 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# 데이터베이스 연결 확인
-@st.cache_resource
+# 데이터베이스 연결 확인 (헬스 모니터의 마지막 상태를 바로 반환하므로 장애가 복구되면 자동으로 다시 연결됨)
 def check_db_connection():
     try:
-        db = DatabaseConnector()
-        db.connect()
-        return db.is_connected()
+        return db.connect()
     except Exception as e:
         st.warning(f"데이터베이스 연결에 실패했습니다: {e}")
         st.info("샘플 데이터로 실행됩니다. 일부 기능이 제한됩니다.")
@@ -219,33 +216,30 @@ def create_sample_recent_faqs(limit=10):
     return all_faqs.sort_values('created_at', ascending=False).head(limit)
 
 # 기업 데이터 로드
-@st.cache_data(ttl=3600)
 def load_companies():
     connection_successful = check_db_connection()
     if connection_successful:
-        companies = Company.get_all()
+        companies = Company.get_all(cached=True)
         return companies, {company['id']: company['name'] for company in companies}
     else:
         companies = create_sample_companies()
         return companies, {company['id']: company['name'] for company in companies}
 
 # 산업 데이터 로드
-@st.cache_data(ttl=3600)
 def load_industries():
     connection_successful = check_db_connection()
     if connection_successful:
-        industries = Industry.get_all()
+        industries = Industry.get_all(cached=True)
         return industries, {industry['id']: industry['name'] for industry in industries}
     else:
         industries = create_sample_industries()
         return industries, {industry['id']: industry['name'] for industry in industries}
 
 # FAQ 카테고리 데이터 로드
-@st.cache_data(ttl=3600)
 def load_faq_categories():
     connection_successful = check_db_connection()
     if connection_successful:
-        categories = FAQCategory.get_all()
+        categories = FAQCategory.get_all(cached=True)
         return categories, {category['id']: category['name'] for category in categories}
     else:
         categories = create_sample_faq_categories()
@@ -295,13 +289,12 @@ def load_company_faqs(company_id=None, category_id=None, keyword=None):
                 cf.view_count DESC
         """
         
-        df = DatabaseConnector().query_to_dataframe(query, tuple(params))
+        df = db.query_to_dataframe(query, tuple(params), label='load_company_faqs', cached=True)
         return df
     else:
         return create_sample_faqs(company_id, category_id, keyword)
 
 # 산업별 FAQ 통계 데이터 로드
-@st.cache_data(ttl=3600)
 def load_industry_faq_stats():
     connection_successful = check_db_connection()
     if connection_successful:
@@ -321,13 +314,12 @@ def load_industry_faq_stats():
                 faq_count DESC
         """
         
-        df = DatabaseConnector().query_to_dataframe(query)
+        df = db.query_to_dataframe(query, label='load_industry_faq_stats', cached=True)
         return df
     else:
         return create_sample_industry_faq_stats()
 
 # 카테고리별 FAQ 통계 데이터 로드
-@st.cache_data(ttl=3600)
 def load_category_faq_stats():
     connection_successful = check_db_connection()
     if connection_successful:
@@ -345,13 +337,12 @@ def load_category_faq_stats():
                 faq_count DESC
         """
         
-        df = DatabaseConnector().query_to_dataframe(query)
+        df = db.query_to_dataframe(query, label='load_category_faq_stats', cached=True)
         return df
     else:
         return create_sample_category_faq_stats()
 
 # 인기 FAQ 데이터 로드
-@st.cache_data(ttl=3600)
 def load_popular_faqs(limit=10):
     connection_successful = check_db_connection()
     if connection_successful:
@@ -375,13 +366,12 @@ def load_popular_faqs(limit=10):
             LIMIT {limit}
         """
         
-        df = DatabaseConnector().query_to_dataframe(query)
+        df = db.query_to_dataframe(query, label='load_popular_faqs', cached=True)
         return df
     else:
         return create_sample_popular_faqs(limit)
 
 # 최근 FAQ 데이터 로드
-@st.cache_data(ttl=3600)
 def load_recent_faqs(limit=10):
     connection_successful = check_db_connection()
     if connection_successful:
@@ -405,7 +395,7 @@ def load_recent_faqs(limit=10):
             LIMIT {limit}
         """
         
-        df = DatabaseConnector().query_to_dataframe(query)
+        df = db.query_to_dataframe(query, label='load_recent_faqs', cached=True)
         return df
     else:
         return create_sample_recent_faqs(limit)
@@ -442,12 +432,8 @@ def display_faq_card(faq, keyword=None):
     """, unsafe_allow_html=True)
 
 # FAQ 데이터 로드
-@st.cache_data(ttl=3600)
 def load_faq_data():
     try:
-        db = DatabaseConnector()
-        db.connect()
-        
         if not db.is_connected():
             st.warning("데이터베이스 연결이 활성화되지 않았습니다. 샘플 데이터를 생성합니다.")
             return create_sample_faqs(), pd.DataFrame(create_sample_companies())
@@ -469,10 +455,8 @@ def load_faq_data():
             ORDER BY name
         """
         
-        faq_df = db.query_to_dataframe(query)
-        company_df = db.query_to_dataframe(company_query)
-        
-        db.disconnect()
+        faq_df = db.query_to_dataframe(query, label='load_faq_data', cached=True)
+        company_df = db.query_to_dataframe(company_query, label='load_faq_companies', cached=True)
         
         if faq_df.empty:
             st.warning("FAQ 데이터를 찾을 수 없습니다.")
@@ -592,9 +576,6 @@ def main():
         
         if submitted and new_question and new_answer:
             try:
-                db = DatabaseConnector()
-                db.connect()
-                
                 if db.is_connected():
                     # FAQ 추가 쿼리
                     query = """
@@ -603,7 +584,6 @@ def main():
                         VALUES (%s, %s, %s)
                     """
                     db.execute_update(query, (selected_company_id, new_question, new_answer))
-                    db.disconnect()
                     
                     st.success("FAQ가 성공적으로 추가되었습니다!")
                     st.rerun()  # 페이지 새로고침
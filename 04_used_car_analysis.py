@@ -6,7 +6,6 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
-import mysql.connector
 from dotenv import load_dotenv
 
 # 상위 디렉토리 추가하여 database 모듈 import 가능하게 설정
@@ -69,16 +68,6 @@ st.markdown("""
 @st.cache_data(ttl=3600)
 def load_used_car_data():
     try:
-        # 실제 데이터베이스 연결 코드
-        # 여기서는 car_registration_db 데이터베이스에 접속
-        conn = mysql.connector.connect(
-            host=os.getenv('DB_HOST', 'localhost'),
-            port=int(os.getenv('DB_PORT', '3306')),
-            user=os.getenv('DB_USER', 'root'),
-            password=os.getenv('DB_PASSWORD', '1234'),
-            database='car_registration_db'
-        )
-        
         # 데이터 쿼리
         query = """
         SELECT u.id, u.car_name as model, u.car_year as year, u.car_km as mileage, 
@@ -89,8 +78,7 @@ def load_used_car_data():
         LIMIT 5000
         """
         
-        df = pd.read_sql(query, conn)
-        conn.close()
+        df = db.query_to_dataframe(query, label='load_used_car_data')
         
         if not df.empty:
             return df
@@ -346,7 +334,7 @@ def analyze_price_distribution(df):
 # 인기 중고차 모델 분석
 def analyze_popular_models(df):
     model_counts = df.groupby(['car_brand', 'model']).size().reset_index(name='count')
-    model_counts['brand_model'] = model_counts['car_brand'] + ' ' + model_counts['model']
+    model_counts['brand_model'] = model_counts['car_brand'].astype(str) + ' ' + model_counts['model'].astype(str)
     
     # 상위 10개 모델
     top_models = model_counts.sort_values('count', ascending=False).head(10)
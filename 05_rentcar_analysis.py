@@ -1,13 +1,12 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import mysql.connector
 import sys
 import os
 
 # 상위 디렉토리를 경로에 추가하여 다른 모듈 임포트 가능하게 함
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-from database.db_connector import DatabaseConnector
+from database.db_connector import db
 
 # 페이지 설정
 st.set_page_config(
@@ -56,9 +55,6 @@ st.markdown("""
 @st.cache_data(ttl=3600)
 def load_rentcar_companies():
     try:
-        db = DatabaseConnector()
-        db.connect()
-        
         if not db.is_connected():
             st.warning("데이터베이스 연결이 활성화되지 않았습니다. 샘플 데이터를 생성합니다.")
             return generate_sample_rentcar_data()
@@ -81,8 +77,7 @@ def load_rentcar_companies():
         """
         
         try:
-            df = pd.read_sql(query, db.connection)
-            db.disconnect()
+            df = db.query_to_dataframe(query, label='load_rentcar_companies')
             
             if df.empty:
                 st.warning("데이터베이스에서 렌트카 회사 데이터를 찾을 수 없습니다. 샘플 데이터를 생성합니다.")
@@ -96,7 +91,7 @@ def load_rentcar_companies():
             try:
                 st.info("테이블 구조를 확인합니다...")
                 table_info_query = "DESCRIBE rent_car_companies_table"
-                table_info = pd.read_sql(table_info_query, db.connection)
+                table_info = db.query_to_dataframe(table_info_query)
                 st.write("rent_car_companies_table 구조:", table_info)
             except:
                 pass
@@ -111,9 +106,6 @@ def load_rentcar_companies():
 @st.cache_data(ttl=3600)
 def load_regions():
     try:
-        db = DatabaseConnector()
-        db.connect()
-        
         if not db.is_connected():
             st.warning("데이터베이스 연결이 활성화되지 않았습니다. 샘플 데이터를 생성합니다.")
             return generate_sample_regions()
@@ -121,8 +113,7 @@ def load_regions():
         query = "SELECT * FROM regions_table"
         
         try:
-            df = pd.read_sql(query, db.connection)
-            db.disconnect()
+            df = db.query_to_dataframe(query, label='load_regions')
             
             if df.empty:
                 st.warning("데이터베이스에서 지역 데이터를 찾을 수 없습니다. 샘플 데이터를 생성합니다.")
@@ -0,0 +1,177 @@
+"""
+query_to_dataframe 의 기존(행 튜플) 방식과 컬럼 방식(columnar=True) 비교 벤치마크
+
+사용법:
+    python benchmarks/bench_columnar.py            # car_registration 형태의 합성 결과셋 사용
+    python benchmarks/bench_columnar.py --db       # 실제 DB 의 car_registration 조회
+"""
+import os
+import sys
+import time
+import argparse
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+from mysql.connector.constants import FieldType
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.columnar import build_columnar_frame
+
+ROW_COUNTS = [100_000, 1_000_000]
+
+# load_registration_data 와 같은 컬럼 구성
+DESCRIPTION = [
+    ('id', FieldType.LONG),
+    ('registration_date', FieldType.DATE),
+    ('region_name', FieldType.VAR_STRING),
+    ('car_type_name', FieldType.VAR_STRING),
+    ('car_model_name', FieldType.VAR_STRING),
+    ('manufacturer_name', FieldType.VAR_STRING),
+    ('registration_count', FieldType.LONG),
+]
+
+REGISTRATION_QUERY = """
+    SELECT
+        cr.id,
+        cr.registration_date,
+        r.name AS region_name,
+        ct.name AS car_type_name,
+        cm.name AS car_model_name,
+        m.name AS manufacturer_name,
+        cr.registration_count
+    FROM
+        car_registration cr
+    JOIN
+        regions r ON cr.region_id = r.id
+    JOIN
+        car_types ct ON cr.car_type_id = ct.id
+    JOIN
+        car_models cm ON cr.car_model_id = cm.id
+    JOIN
+        manufacturers m ON cm.manufacturer_id = m.id
+    LIMIT %s
+"""
+
+
+# fetchall/fetchmany 만 흉내내는 메모리 커서
+class MemoryCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.position = 0
+        self.description = [(name, type_code, None, None, None, None, True) for name, type_code in DESCRIPTION]
+
+    def fetchall(self):
+        rows = self.rows[self.position:]
+        self.position = len(self.rows)
+        return rows
+
+    def fetchmany(self, size):
+        rows = self.rows[self.position:self.position + size]
+        self.position += len(rows)
+        return rows
+
+
+# DB 드라이버가 반환하는 것과 같은 Python 객체 행 튜플 생성
+def make_rows(n, seed=42):
+    rng = np.random.default_rng(seed)
+    regions = ['서울', '부산', '대구', '인천', '광주', '대전', '울산', '경기', '강원', '충북']
+    car_types = ['승용차', 'SUV', '승합차', '화물차', '특수차']
+    models = [f'모델{i}' for i in range(48)]
+    manufacturers = [f'제조사{i}' for i in range(20)]
+    start = date(2020, 1, 1)
+    days = rng.integers(0, 365 * 5, n)
+    region_idx = rng.integers(0, len(regions), n)
+    type_idx = rng.integers(0, len(car_types), n)
+    model_idx = rng.integers(0, len(models), n)
+    counts = rng.integers(50, 1000, n)
+    return [
+        (
+            i + 1,
+            start + timedelta(days=int(days[i])),
+            regions[region_idx[i]],
+            car_types[type_idx[i]],
+            models[model_idx[i]],
+            manufacturers[model_idx[i] % len(manufacturers)],
+            int(counts[i]),
+        )
+        for i in range(n)
+    ]
+
+
+def row_path(cursor):
+    rows = cursor.fetchall()
+    return pd.DataFrame(rows, columns=[desc[0] for desc in cursor.description])
+
+
+# 기존 방식으로 받은 뒤 같은 dtype 으로 변환하는 경우 (페이지에서 후처리하는 비용 포함)
+def row_path_typed(cursor):
+    df = row_path(cursor)
+    df['registration_date'] = pd.to_datetime(df['registration_date'])
+    for column in ['region_name', 'car_type_name', 'car_model_name', 'manufacturer_name']:
+        df[column] = df[column].astype('category')
+    for column in ['id', 'registration_count']:
+        df[column] = df[column].astype(np.int32)
+    return df
+
+
+def measure(build, make_cursor, repeat=3):
+    best = float('inf')
+    df = None
+    for _ in range(repeat):
+        cursor = make_cursor()
+        started = time.perf_counter()
+        df = build(cursor)
+        best = min(best, time.perf_counter() - started)
+    return best, int(df.memory_usage(index=True, deep=True).sum())
+
+
+def report(n, row_result, columnar_result, typed_result=None):
+    row_time, row_bytes = row_result
+    col_time, col_bytes = columnar_result
+    line = (f"{n:>9,}행 | 기존 {row_time:7.3f}s {row_bytes / 1e6:8.1f}MB "
+            f"| columnar {col_time:7.3f}s {col_bytes / 1e6:8.1f}MB "
+            f"| 속도 x{row_time / col_time:4.1f} 메모리 x{row_bytes / col_bytes:4.1f}")
+    if typed_result:
+        line += f" | 기존+타입변환 {typed_result[0]:7.3f}s"
+    print(line)
+
+
+def run_synthetic():
+    for n in ROW_COUNTS:
+        rows = make_rows(n)
+        row_result = measure(row_path, lambda: MemoryCursor(rows))
+        columnar_result = measure(build_columnar_frame, lambda: MemoryCursor(rows))
+        typed_result = measure(row_path_typed, lambda: MemoryCursor(rows))
+        report(n, row_result, columnar_result, typed_result)
+
+
+def run_database():
+    from database.db_connector import db
+
+    for n in ROW_COUNTS:
+        results = []
+        for columnar in (False, True):
+            best = float('inf')
+            for _ in range(3):
+                started = time.perf_counter()
+                df = db.query_to_dataframe(REGISTRATION_QUERY, (n,), columnar=columnar)
+                best = min(best, time.perf_counter() - started)
+            results.append((best, int(df.memory_usage(index=True, deep=True).sum())))
+        report(len(df), results[0], results[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--db', action='store_true', help='실제 데이터베이스의 car_registration 으로 측정')
+    args = parser.parse_args()
+
+    if args.db:
+        run_database()
+    else:
+        run_synthetic()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+로더별 조회 결과의 dtype 정리(database.dtypes.normalize_dtypes) 전/후 메모리 보고
+
+합성 데이터(database.synthetic)로 만든 SQLite 파일에서 01/02 페이지 로더(database.indexes.loader_calls)와
+04/05 페이지의 데이터 로더를 호출한 뒤, 커넥터가 기록한 로더별 정리 전/후 결과 크기(db.memory_stats())를 출력한다.
+(페이지 모듈을 불러오므로 streamlit 이 설치되어 있어야 함)
+
+사용법:
+    python benchmarks/bench_dtypes.py                      # 합성 데이터 30만 행
+    python benchmarks/bench_dtypes.py --rows 1000000
+    python benchmarks/bench_dtypes.py --path /tmp/bench.sqlite3 --reuse
+"""
+import os
+import sys
+import time
+import tempfile
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 01/02 외에 호출할 페이지 로더
+PAGE_LOADERS = [
+    ('04_used_car_analysis.py', 'load_used_car_data'),
+    ('05_rentcar_analysis.py', 'load_rentcar_companies'),
+]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='로더별 dtype 정리 전/후 메모리')
+    parser.add_argument('--rows', type=int, default=300_000, help='합성 car_registration 행 수')
+    parser.add_argument('--path', default=os.path.join(tempfile.gettempdir(), 'bench_dtypes.sqlite3'))
+    parser.add_argument('--reuse', action='store_true', help='이미 있는 합성 데이터 파일 재사용')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # 커넥터가 import 시점에 설정을 읽으므로 먼저 합성 데이터 파일을 가리키도록 지정
+    os.environ['DB_BACKEND'] = 'sqlite'
+    os.environ['DB_LOCAL_PATH'] = args.path
+    os.environ['DB_NORMALIZE_DTYPES'] = '1'
+
+    from database.synthetic import generate_all
+
+    if not (args.reuse and os.path.exists(args.path)):
+        if os.path.exists(args.path):
+            os.remove(args.path)
+        started = time.perf_counter()
+        generate_all(args.path, registrations=args.rows)
+        print(f"합성 데이터 {args.rows:,}행 생성 ({time.perf_counter() - started:.1f}초)")
+
+    from database.db_connector import db
+    from database.indexes import collect_loader_queries, _load_page
+
+    collect_loader_queries()
+    for page, func_name in PAGE_LOADERS:
+        getattr(_load_page(page), func_name)()
+
+    print(f"{'로더':34} {'호출':>5} {'정리 전':>12} {'정리 후':>12} {'배율':>7}")
+    for label, item in sorted(db.memory_stats().items(), key=lambda entry: -entry[1]['total_before_bytes']):
+        print(f"{label:34} {item['calls']:5} {item['total_before_bytes'] / 1e6:10.2f}MB {item['total_after_bytes'] / 1e6:10.2f}MB"
+              f" x{item['ratio']:6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+car_registration 인덱스(database.indexes.INDEXES) 적용 전/후 로더 쿼리 실행 시간 비교 벤치마크
+
+합성 데이터(database.synthetic)로 만든 별도의 SQLite 파일에서 01/02 로더가 보내는 쿼리를 수집한 뒤
+인덱스를 제거한 상태와 적용한 상태에서 같은 쿼리를 반복 실행하여 가장 빠른 시간을 비교한다.
+(로더 쿼리를 수집하기 위해 페이지 모듈을 불러오므로 streamlit 이 설치되어 있어야 함)
+
+사용법:
+    python benchmarks/bench_indexes.py                      # 합성 데이터 100만 행
+    python benchmarks/bench_indexes.py --rows 10000000
+    python benchmarks/bench_indexes.py --path /tmp/bench.sqlite3 --reuse
+"""
+import os
+import sys
+import time
+import tempfile
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='인덱스 적용 전/후 로더 쿼리 비교')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='합성 car_registration 행 수')
+    parser.add_argument('--path', default=os.path.join(tempfile.gettempdir(), 'bench_indexes.sqlite3'))
+    parser.add_argument('--reuse', action='store_true', help='이미 있는 합성 데이터 파일 재사용')
+    parser.add_argument('--repeat', type=int, default=3)
+    return parser.parse_args()
+
+
+def measure(db, query, params, label, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        db.query_to_dataframe(query, params, label=label, columnar=True)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    args = parse_args()
+
+    # 커넥터가 import 시점에 설정을 읽으므로 먼저 합성 데이터 파일을 가리키도록 지정
+    os.environ['DB_BACKEND'] = 'sqlite'
+    os.environ['DB_LOCAL_PATH'] = args.path
+
+    from database.synthetic import generate_all
+
+    if not (args.reuse and os.path.exists(args.path)):
+        if os.path.exists(args.path):
+            os.remove(args.path)
+        started = time.perf_counter()
+        generate_all(args.path, registrations=args.rows, used_cars=0, rent_companies=0, faqs=0)
+        print(f"합성 데이터 {args.rows:,}행 생성 ({time.perf_counter() - started:.1f}초)")
+
+    from database.db_connector import db
+    from database.indexes import apply_indexes, drop_indexes, collect_loader_queries
+
+    drop_indexes()
+    queries = collect_loader_queries()
+
+    before = [measure(db, query, params, label, args.repeat) for label, query, params in queries]
+    started = time.perf_counter()
+    apply_indexes()
+    print(f"인덱스 생성 {time.perf_counter() - started:.1f}초\n")
+    after = [measure(db, query, params, label, args.repeat) for label, query, params in queries]
+
+    print(f"{'로더':34} {'적용 전':>10} {'적용 후':>10} {'배율':>7}")
+    for (label, _, _), before_time, after_time in zip(queries, before, after):
+        print(f"{label:34} {before_time * 1000:8.1f}ms {after_time * 1000:8.1f}ms x{before_time / after_time:6.1f}")
+    print(f"{'합계':34} {sum(before) * 1000:8.1f}ms {sum(after) * 1000:8.1f}ms x{sum(before) / sum(after):6.1f}")
+
+
+if __name__ == "__main__":
+    main()
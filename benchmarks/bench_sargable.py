@@ -0,0 +1,110 @@
+"""
+02 페이지 연도별 로더의 날짜 조건 비교 벤치마크 - YEAR(날짜 컬럼) = %s 와 반열린 범위 조건
+
+합성 데이터(database.synthetic)로 만든 SQLite 파일에 인덱스(database.indexes.INDEXES)를 적용한 뒤
+연도 필터가 있는 로더가 보내는 쿼리(범위 조건)를 수집하고, 같은 쿼리를 YEAR() 조건으로 되돌린 형태와
+실행 계획(인덱스 사용 여부)과 실행 시간을 비교한다.
+월별 추이/국가별 현황/제조사 점유율의 연도 필터는 통계 기본 집계(database.rollup.load_registration_base)의
+정수 year 키로 메모리에서 거르므로 날짜 컬럼 조건이 없어 비교 대상이 아니다.
+(로더 쿼리를 수집하기 위해 페이지 모듈을 불러오므로 streamlit 이 설치되어 있어야 함)
+
+사용법:
+    python benchmarks/bench_sargable.py                      # 합성 데이터 100만 행
+    python benchmarks/bench_sargable.py --rows 5000000
+    python benchmarks/bench_sargable.py --path /tmp/bench.sqlite3 --reuse
+"""
+import os
+import re
+import sys
+import time
+import tempfile
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 날짜 컬럼의 연도 필터로 조회하는 02 페이지 로더 (모델 단위 상위 목록은 기본 집계에 없어 원본 테이블을 조회)
+YEAR_LOADERS = [
+    'load_top_models',
+    'load_top_models_by_manufacturer',
+]
+
+# 실행 계획을 요약할 테이블
+PLAN_TABLES = ('car_registration',)
+
+RANGE_PATTERN = re.compile(r'([\w.]+) >= %s AND \1 < %s')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='YEAR() 조건과 날짜 범위 조건 비교')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='합성 car_registration 행 수')
+    parser.add_argument('--path', default=os.path.join(tempfile.gettempdir(), 'bench_sargable.sqlite3'))
+    parser.add_argument('--reuse', action='store_true', help='이미 있는 합성 데이터 파일 재사용')
+    parser.add_argument('--repeat', type=int, default=3)
+    return parser.parse_args()
+
+
+# 범위 조건 쿼리 -> 같은 연도의 YEAR(column) = %s 쿼리 (파라미터도 시작일 두 개 대신 연도 하나로)
+def to_year_query(query, params):
+    match = RANGE_PATTERN.search(query)
+    position = query[:match.start()].count('%s')
+    params = list(params)
+    year = int(params[position][:4])
+    params[position:position + 2] = [year]
+    return query[:match.start()] + f"YEAR({match.group(1)}) = %s" + query[match.end():], tuple(params)
+
+
+def measure(db, query, params, label, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        db.query_to_dataframe(query, params, label=label, columnar=True)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+# 실행 계획에서 원본/월별 시계열 테이블을 읽는 방식 요약 (예: 'index_lookup(idx_cr_date)', 'full_scan')
+def access_summary(explain_query, query, params):
+    steps = [step for step in explain_query(query, params) if step['table'] in PLAN_TABLES]
+    return ', '.join(f"{step['access']}({step['index']})" if step['index'] else step['access'] for step in steps)
+
+
+def main():
+    args = parse_args()
+
+    # 커넥터가 import 시점에 설정을 읽으므로 먼저 합성 데이터 파일을 가리키도록 지정
+    os.environ['DB_BACKEND'] = 'sqlite'
+    os.environ['DB_LOCAL_PATH'] = args.path
+
+    from database.synthetic import generate_all
+
+    if not (args.reuse and os.path.exists(args.path)):
+        if os.path.exists(args.path):
+            os.remove(args.path)
+        started = time.perf_counter()
+        generate_all(args.path, registrations=args.rows, used_cars=0, rent_companies=0, faqs=0)
+        print(f"합성 데이터 {args.rows:,}행 생성 ({time.perf_counter() - started:.1f}초)")
+
+    from database.db_connector import db
+    from database.indexes import apply_indexes, collect_loader_queries, explain_query
+
+    apply_indexes()
+    queries = [
+        (label, query, params) for label, query, params in collect_loader_queries(['02_statistics.py'])
+        if label in YEAR_LOADERS and RANGE_PATTERN.search(query)
+    ]
+
+    print(f"{'로더':34} {'YEAR()':>10} {'범위 조건':>10} {'배율':>7}  실행 계획 (YEAR() -> 범위 조건)")
+    total_year = total_range = 0.0
+    for label, query, params in queries:
+        year_query, year_params = to_year_query(query, params)
+        year_time = measure(db, year_query, year_params, label, args.repeat)
+        range_time = measure(db, query, params, label, args.repeat)
+        total_year += year_time
+        total_range += range_time
+        plans = f"{access_summary(explain_query, year_query, year_params)} -> {access_summary(explain_query, query, params)}"
+        print(f"{label:34} {year_time * 1000:8.1f}ms {range_time * 1000:8.1f}ms x{year_time / range_time:6.1f}  {plans}")
+    print(f"{'합계':34} {total_year * 1000:8.1f}ms {total_range * 1000:8.1f}ms x{total_year / total_range:6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+연도별 상위 N 개 제조사 점유율 추이 계산 방식 비교 벤치마크
+
+연도 × 제조사 합계(기본 20년 × 500개 제조사, 등록 대수는 Zipf 분포)에 대해
+기존 방식(연도마다 프레임을 거르고 정렬하는 반복문 + pd.merge), groupby transform/rank 방식
+(database.ranking.manufacturer_share_trend), 윈도 함수 쿼리(SHARE_TREND_QUERY, 임시 SQLite 파일)를 비교한다.
+
+사용법:
+    python benchmarks/bench_top_n.py
+    python benchmarks/bench_top_n.py --years 50 --manufacturers 2000 --top-n 10
+"""
+import os
+import sys
+import time
+import sqlite3
+import tempfile
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='연도별 상위 N 개 제조사 점유율 추이 계산 비교')
+    parser.add_argument('--years', type=int, default=20)
+    parser.add_argument('--manufacturers', type=int, default=500)
+    parser.add_argument('--top-n', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    return parser.parse_args()
+
+
+# 연도 × 제조사 합계 (연도마다 순위가 조금씩 바뀌도록 Zipf 가중치에 잡음을 곱함)
+def make_yearly_counts(rng, years, manufacturers):
+    from database.synthetic import zipf_weights
+
+    weights = zipf_weights(manufacturers)
+    noise = rng.lognormal(0, 0.3, size=(years, manufacturers))
+    totals = rng.integers(1_000_000, 2_000_000, size=(years, 1))
+    counts = np.maximum((weights * noise / (weights * noise).sum(axis=1, keepdims=True) * totals).astype(np.int64), 1)
+    return pd.DataFrame({
+        'year': np.repeat(np.arange(2000, 2000 + years), manufacturers),
+        'manufacturer': np.tile([f"제조사{i:04d}" for i in range(manufacturers)], years),
+        'total_count': counts.ravel(),
+    })
+
+
+# 기존 load_manufacturer_share_trend 의 계산 (비교 기준)
+def legacy_share_trend(df, top_n):
+    df = df.sort_values(['year', 'total_count'], ascending=[True, False], ignore_index=True)
+    yearly_total = df.groupby('year')['total_count'].sum().reset_index()
+    yearly_total.rename(columns={'total_count': 'yearly_total'}, inplace=True)
+    df = pd.merge(df, yearly_total, on='year')
+    df['share'] = df['total_count'] / df['yearly_total'] * 100
+    top_manufacturers = set()
+    for year in df['year'].unique():
+        year_data = df[df['year'] == year].sort_values('total_count', ascending=False)
+        top_manufacturers.update(year_data.head(top_n)['manufacturer'].tolist())
+    return df[df['manufacturer'].isin(top_manufacturers)]
+
+
+# 연도 × 제조사 합계를 rollup 형태(연도마다 1월 한 행)로 임시 SQLite 파일에 기록
+def write_rollup(path, df):
+    from database.rollup import CREATE_ROLLUP_TABLE, ROLLUP_TABLE, ROLLUP_COLUMNS
+
+    names = df['manufacturer'].unique()
+    ids = {name: i + 1 for i, name in enumerate(names)}
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("CREATE TABLE manufacturers (id INTEGER PRIMARY KEY, name TEXT, country TEXT)")
+        conn.executemany("INSERT INTO manufacturers (id, name) VALUES (?, ?)", [(i, name) for name, i in ids.items()])
+        conn.execute(CREATE_ROLLUP_TABLE)
+        conn.executemany(
+            f"INSERT INTO {ROLLUP_TABLE} ({ROLLUP_COLUMNS}) VALUES (?, 1, 1, ?, ?, 1)",
+            [(f"{year}-01-01", ids[name], int(count)) for year, name, count in df.itertuples(index=False)],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def best_time(func, repeat):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def normalize(df):
+    df = df[['year', 'manufacturer', 'total_count', 'share']].astype({'year': 'int64', 'manufacturer': str, 'total_count': 'int64'})
+    return df.sort_values(['year', 'manufacturer'], ignore_index=True)
+
+
+def main():
+    args = parse_args()
+    path = os.path.join(tempfile.mkdtemp(), 'bench_top_n.sqlite3')
+
+    # 커넥터가 import 시점에 설정을 읽으므로 먼저 임시 파일을 가리키도록 지정
+    os.environ['DB_BACKEND'] = 'sqlite'
+    os.environ['DB_LOCAL_PATH'] = path
+
+    from database.db_connector import db
+    from database.ranking import manufacturer_share_trend, SHARE_TREND_QUERY
+
+    df = make_yearly_counts(np.random.default_rng(args.seed), args.years, args.manufacturers)
+    write_rollup(path, df)
+    print(f"{args.years}년 × {args.manufacturers}개 제조사 ({len(df):,}행), 상위 {args.top_n}개\n")
+
+    results = {}
+    timings = {}
+    timings['기존 반복문'], results['기존 반복문'] = best_time(lambda: legacy_share_trend(df, args.top_n), args.repeat)
+    timings['groupby rank'], results['groupby rank'] = best_time(lambda: manufacturer_share_trend(df, args.top_n), args.repeat)
+    timings['SQL ROW_NUMBER()'], results['SQL ROW_NUMBER()'] = best_time(
+        lambda: db.query_to_dataframe(SHARE_TREND_QUERY, (args.top_n,), label='bench_top_n'), args.repeat
+    )
+
+    baseline = normalize(results['기존 반복문'])
+    for name, seconds in timings.items():
+        result = normalize(results[name])
+        same = result[['year', 'manufacturer', 'total_count']].equals(baseline[['year', 'manufacturer', 'total_count']])
+        same = same and np.allclose(result['share'], baseline['share'])
+        print(f"{name:16} {seconds * 1000:9.2f}ms  x{timings['기존 반복문'] / seconds:6.1f}  {len(result):,}행  결과 일치={same}")
+
+
+if __name__ == "__main__":
+    main()
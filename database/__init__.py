@@ -0,0 +1 @@
+# 데이터베이스 접근 모듈 (커넥션 풀, 모델)
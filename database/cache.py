@@ -0,0 +1,184 @@
+import os
+import re
+import time
+import threading
+from collections import OrderedDict
+
+
+# 공백/줄바꿈 차이만 있는 쿼리가 같은 키를 갖도록 정규화 (문자열 리터럴 내부는 유지)
+def normalize_sql(query):
+    parts = []
+    quote = None
+    pending_space = False
+    for ch in query.strip().rstrip(';').strip():
+        if quote:
+            parts.append(ch)
+            if ch == quote:
+                quote = None
+            continue
+        if ch.isspace():
+            pending_space = True
+            continue
+        if pending_space and parts:
+            parts.append(' ')
+        pending_space = False
+        if ch in ("'", '"'):
+            quote = ch
+        parts.append(ch)
+    return ''.join(parts)
+
+
+def make_cache_key(query, params=None, kind='rows'):
+    return (kind, normalize_sql(query), tuple(params) if params else ())
+
+
+TABLE_PATTERN = re.compile(r'\b(?:FROM|JOIN|INTO|UPDATE)\s+`?(\w+)`?', re.IGNORECASE)
+
+
+# 쿼리가 읽거나 쓰는 테이블 이름 (소문자 집합)
+def referenced_tables(query):
+    return {name.lower() for name in TABLE_PATTERN.findall(query)}
+
+
+# 캐시 키에 들어 있는 SQL 이 읽는 테이블 (SQL 이 없는 키는 빈 집합)
+def key_tables(key):
+    tables = set()
+    for part in key:
+        if isinstance(part, str):
+            tables |= referenced_tables(part)
+    return tables
+
+
+class CacheEntry:
+    def __init__(self, value, nbytes, label, ttl=None, tables=()):
+        self.value = value
+        self.nbytes = nbytes
+        self.labels = {label}
+        self.ttl = ttl
+        self.tables = frozenset(table.lower() for table in tables)
+        self.created_at = time.monotonic()
+
+
+# 바이트 한도가 있는 LRU 결과 캐시
+# 키는 정규화된 SQL + 파라미터이므로 같은 쿼리를 보내는 로더끼리 항목을 공유
+# 항목마다 읽은 테이블을 기억하여 갱신된 테이블의 항목만 비움 (SQL 이 없는 키는 저장할 때 tables 로 지정)
+# 로더(label)별 hit/miss/eviction 과 상주 바이트를 집계
+class ResultCache:
+    def __init__(self, max_bytes=256 * 1024 * 1024, ttl=3600):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def _label_stats(self, label):
+        return self._stats.setdefault(label, {'hits': 0, 'misses': 0, 'evictions': 0})
+
+    # lock 보유 상태에서 호출
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.nbytes
+        for label in entry.labels:
+            self._label_stats(label)['evictions'] += 1
+
+    def _lookup(self, key, label):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.created_at > (entry.ttl or self.ttl):
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        entry.labels.add(label)
+        return entry
+
+    def _store(self, key, value, nbytes, label, ttl=None, tables=None):
+        if nbytes > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = CacheEntry(value, nbytes, label, ttl, key_tables(key) if tables is None else tables)
+        self._bytes += nbytes
+        # 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+        while self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    # 캐시에 있으면 복사본을 반환하고, 없으면 load() -> (값, 바이트) 로 채움
+    # 같은 키를 동시에 요청하면 먼저 온 요청의 조회 결과를 기다려 함께 사용
+    def get_or_load(self, key, label, load, copy=lambda value: value, tables=None):
+        while True:
+            with self._lock:
+                entry = self._lookup(key, label)
+                if entry is not None:
+                    self._label_stats(label)['hits'] += 1
+                    return copy(entry.value)
+                event = self._inflight.get(key)
+                if event is None:
+                    self._label_stats(label)['misses'] += 1
+                    event = self._inflight[key] = threading.Event()
+                    break
+            event.wait()
+
+        try:
+            value, nbytes = load()
+            with self._lock:
+                self._store(key, value, nbytes, label, tables=tables)
+            return copy(value)
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            event.set()
+
+    # 여러 키를 한 번에 채우는 호출자(월 구간 캐시 등)를 위한 단순 조회/저장
+    def get(self, key, label, copy=lambda value: value):
+        with self._lock:
+            entry = self._lookup(key, label)
+            self._label_stats(label)['hits' if entry is not None else 'misses'] += 1
+            return copy(entry.value) if entry is not None else None
+
+    def put(self, key, value, nbytes, label, ttl=None, tables=None):
+        with self._lock:
+            self._store(key, value, nbytes, label, ttl, tables)
+
+    # tables 중 하나라도 읽은 항목만 제거 (제거한 항목 수 반환)
+    def invalidate(self, tables):
+        tables = {table.lower() for table in tables}
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry.tables & tables]
+            for key in stale:
+                self._remove(key)
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def stats(self):
+        with self._lock:
+            resident = {}
+            for entry in self._entries.values():
+                for label in entry.labels:
+                    resident[label] = resident.get(label, 0) + entry.nbytes
+            by_label = {}
+            for label, item in self._stats.items():
+                lookups = item['hits'] + item['misses']
+                by_label[label] = dict(
+                    item,
+                    hit_rate=item['hits'] / lookups if lookups else 0.0,
+                    resident_bytes=resident.get(label, 0),
+                )
+            return {
+                'entries': len(self._entries),
+                'resident_bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'loaders': by_label,
+            }
+
+
+result_cache = ResultCache(
+    max_bytes=int(os.getenv('DB_CACHE_MAX_MB', '256')) * 1024 * 1024,
+    ttl=int(os.getenv('DB_CACHE_TTL', '3600')),
+)
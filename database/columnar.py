@@ -0,0 +1,117 @@
+import gc
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from mysql.connector.constants import FieldType
+
+# MySQL 컬럼 타입 분류
+INTEGER_TYPES = {
+    FieldType.TINY, FieldType.SHORT, FieldType.LONG,
+    FieldType.INT24, FieldType.LONGLONG, FieldType.YEAR,
+}
+FLOAT_TYPES = {FieldType.FLOAT, FieldType.DOUBLE}
+DECIMAL_TYPES = {FieldType.DECIMAL, FieldType.NEWDECIMAL}
+DATE_TYPES = {FieldType.DATE, FieldType.NEWDATE}
+DATETIME_TYPES = {FieldType.DATETIME, FieldType.TIMESTAMP}
+STRING_TYPES = {FieldType.VARCHAR, FieldType.VAR_STRING, FieldType.STRING, FieldType.ENUM}
+
+INT32_MIN = np.iinfo(np.int32).min
+INT32_MAX = np.iinfo(np.int32).max
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# 고유값 비율이 이 값 이하인 문자열 컬럼만 사전 인코딩(Categorical)
+CATEGORY_MAX_RATIO = 0.5
+
+
+# 커서 결과를 행 단위가 아닌 컬럼 단위 리스트로 수집
+def fetch_columns(cursor, batch_size=10000):
+    columns = [[] for _ in cursor.description]
+    # 대량의 행 튜플이 생겼다 사라지는 동안 GC 가 반복 실행되지 않도록 잠시 중지
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for column, values in zip(columns, zip(*rows)):
+                column.extend(values)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return columns
+
+
+def _integer_array(values):
+    arr = np.fromiter(values, dtype=np.int64, count=len(values))
+    if arr.size == 0 or (arr.min() >= INT32_MIN and arr.max() <= INT32_MAX):
+        return arr.astype(np.int32)
+    return arr
+
+
+def _string_array(values):
+    codes, uniques = pd.factorize(np.array(values, dtype=object))
+    if len(values) and len(uniques) <= len(values) * CATEGORY_MAX_RATIO:
+        return pd.Categorical.from_codes(codes, categories=uniques)
+    return np.array(values, dtype=object)
+
+
+# 컬럼 하나를 MySQL 타입에 맞는 NumPy 배열로 변환
+def to_typed_array(values, type_code):
+    has_null = None in values
+
+    if type_code in INTEGER_TYPES:
+        if has_null:
+            return np.array(values, dtype=np.float64)
+        return _integer_array(values)
+
+    if type_code in DECIMAL_TYPES:
+        # SUM() 결과는 DECIMAL 로 내려오므로 정수로 떨어지면 정수형으로 변환
+        arr = np.array(values, dtype=np.float64)
+        if not has_null and arr.size and np.array_equal(arr, np.floor(arr)) and np.abs(arr).max() < 2 ** 53:
+            return _integer_array(arr.astype(np.int64))
+        return arr
+
+    if type_code in FLOAT_TYPES:
+        return np.array(values, dtype=np.float64)
+
+    if type_code in DATE_TYPES:
+        if has_null:
+            return np.array(values, dtype='datetime64[D]').astype('datetime64[ns]')
+        # date 객체를 하나씩 파싱하지 않고 서수(ordinal)로 바로 변환
+        days = np.fromiter(map(date.toordinal, values), dtype=np.int64, count=len(values))
+        return (days - EPOCH_ORDINAL).astype('datetime64[D]').astype('datetime64[ns]')
+
+    if type_code in DATETIME_TYPES:
+        return np.array(values, dtype='datetime64[us]').astype('datetime64[ns]')
+
+    if type_code in STRING_TYPES:
+        return _string_array(values)
+
+    return np.array(values, dtype=object)
+
+
+# 컬럼 리스트를 타입이 지정된 DataFrame 으로 변환
+def columns_to_frame(description, columns):
+    names = [desc[0] for desc in description]
+    data = {
+        desc[0]: to_typed_array(values, desc[1])
+        for desc, values in zip(description, columns)
+    }
+    return pd.DataFrame(data, columns=names)
+
+
+# 행 튜플 묶음(청크)을 타입이 지정된 DataFrame 으로 변환
+def rows_to_frame(description, rows):
+    if not rows:
+        return pd.DataFrame(columns=[desc[0] for desc in description])
+    return columns_to_frame(description, [list(values) for values in zip(*rows)])
+
+
+# 컬럼 단위로 타입을 지정하여 DataFrame 생성
+# (int32 정수, datetime64 날짜, 반복되는 이름은 Categorical)
+def build_columnar_frame(cursor, batch_size=10000):
+    if not cursor.description:
+        return pd.DataFrame()
+    return columns_to_frame(cursor.description, fetch_columns(cursor, batch_size))
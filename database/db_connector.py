@@ -0,0 +1,588 @@
+import os
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+import pandas as pd
+import mysql.connector
+from dotenv import load_dotenv
+
+from database.columnar import build_columnar_frame, rows_to_frame
+from database.health import HealthMonitor, DatabaseUnavailableError
+from database.cache import result_cache, make_cache_key, referenced_tables
+from database.dtypes import normalize_dtypes, frame_nbytes, memory_profile
+
+# .env 파일에서 환경 변수 로드
+load_dotenv()
+
+
+# 환경 변수에서 접속 정보 로드
+# DB_BACKEND=sqlite 이면 저장소의 덤프로 만든 로컬 SQLite 파일을 사용 (database.local_backend)
+def get_db_config():
+    if os.getenv('DB_BACKEND', 'mysql') == 'sqlite':
+        return {
+            'backend': 'sqlite',
+            'path': os.getenv('DB_LOCAL_PATH', ''),
+        }
+    return {
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'port': int(os.getenv('DB_PORT', '3306')),
+        'user': os.getenv('DB_USER', 'root'),
+        'password': os.getenv('DB_PASSWORD', '1234'),
+        'database': os.getenv('DB_NAME', 'car_registration_db'),
+        'connection_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', '5')),
+        'query_timeout': int(os.getenv('DB_QUERY_TIMEOUT', '0')),
+    }
+
+
+# 설정의 backend 에 맞는 드라이버로 새 커넥션 생성
+def connect_backend(config):
+    if config.get('backend') == 'sqlite':
+        from database.local_backend import connect_local
+        return connect_local(config.get('path') or None)
+    query_timeout = config.get('query_timeout')
+    raw = mysql.connector.connect(**{k: v for k, v in config.items() if k not in ('backend', 'query_timeout')})
+    if query_timeout:
+        # 서버에서 SELECT 실행 시간 제한 (초 -> 밀리초)
+        cursor = raw.cursor()
+        cursor.execute("SET SESSION MAX_EXECUTION_TIME = %s", (int(query_timeout * 1000),))
+        cursor.close()
+    return raw
+
+
+# 접속 장애로 판단하는 예외 (문법 오류 등은 제외)
+CONNECTION_ERRORS = (mysql.connector.errors.InterfaceError, mysql.connector.errors.OperationalError)
+
+
+# 풀과 별개의 커넥션으로 접속 가능 여부 확인 (풀이 모두 사용 중이어도 영향 없음)
+def probe_backend(config, timeout):
+    if config.get('backend') != 'sqlite':
+        config = dict(config, connection_timeout=min(config.get('connection_timeout', timeout), timeout))
+    raw = connect_backend(config)
+    try:
+        raw.ping(reconnect=False)
+        return True
+    finally:
+        raw.close()
+
+
+# 풀에서 관리되는 커넥션 (생성 시각, 마지막 사용 시각 기록)
+class PooledConnection:
+    def __init__(self, raw):
+        self.raw = raw
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+    def age(self, now):
+        return now - self.created_at
+
+    def idle_time(self, now):
+        return now - self.last_used
+
+    def ping(self):
+        try:
+            self.raw.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def close(self):
+        try:
+            self.raw.close()
+        except Exception:
+            pass
+
+
+class PoolTimeoutError(Exception):
+    pass
+
+
+# 프로세스 단위로 공유되는 커넥션 풀
+class ConnectionPool:
+    def __init__(self, config, pool_size=5, idle_timeout=300, max_lifetime=1800,
+                 checkout_timeout=10, ping_interval=30):
+        self.config = config
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.checkout_timeout = checkout_timeout
+        self.ping_interval = ping_interval
+
+        self._idle = []
+        self._in_use = 0
+        self._waiters = 0
+        self._cond = threading.Condition()
+
+        # 통계
+        self._checkouts = 0
+        self._created = 0
+        self._evicted = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _create(self):
+        raw = connect_backend(self.config)
+        self._created += 1
+        return PooledConnection(raw)
+
+    # 유휴 시간/최대 수명이 지난 커넥션 정리 (lock 보유 상태에서 호출)
+    def _evict_expired(self, now):
+        alive = []
+        for conn in self._idle:
+            if conn.idle_time(now) > self.idle_timeout or conn.age(now) > self.max_lifetime:
+                conn.close()
+                self._evicted += 1
+            else:
+                alive.append(conn)
+        self._idle = alive
+
+    def acquire(self, timeout=None):
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        with self._cond:
+            waited = False
+            while True:
+                now = time.monotonic()
+                self._evict_expired(now)
+
+                if self._idle:
+                    conn = self._idle.pop()
+                    self._in_use += 1
+                    break
+
+                if self._in_use < self.pool_size:
+                    # 자리만 먼저 확보하고 실제 접속은 lock 밖에서 수행
+                    self._in_use += 1
+                    conn = None
+                    break
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    raise PoolTimeoutError(
+                        f"커넥션 풀 대기 시간 초과 ({timeout}초, 사용 중 {self._in_use}/{self.pool_size})"
+                    )
+                self._waiters += 1
+                waited = True
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiters -= 1
+
+            wait_time = time.monotonic() - started if waited else 0.0
+            self._checkouts += 1
+            self._wait_total += wait_time
+            self._wait_max = max(self._wait_max, wait_time)
+
+        try:
+            if conn is not None and conn.idle_time(time.monotonic()) > self.ping_interval:
+                # 오래 쉬었던 커넥션은 사용 전에 상태 확인
+                if not conn.ping():
+                    conn.close()
+                    with self._cond:
+                        self._evicted += 1
+                    conn = None
+            if conn is None:
+                conn = self._create()
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        return conn
+
+    def release(self, conn, broken=False):
+        with self._cond:
+            self._in_use -= 1
+            now = time.monotonic()
+            if broken or conn.age(now) > self.max_lifetime:
+                conn.close()
+                self._evicted += 1
+            else:
+                conn.last_used = now
+                self._idle.append(conn)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self, timeout=None):
+        conn = self.acquire(timeout)
+        broken = False
+        try:
+            yield conn.raw
+        except Exception:
+            broken = not conn.ping()
+            raise
+        finally:
+            if not broken:
+                try:
+                    # 다음 사용자를 위해 열린 트랜잭션 정리
+                    conn.raw.rollback()
+                except Exception:
+                    broken = True
+            self.release(conn, broken=broken)
+
+    # 풀에서 커넥션을 하나 꺼내 상태 확인
+    def ping(self, timeout=None):
+        try:
+            with self.connection(timeout) as raw:
+                raw.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def stats(self):
+        with self._cond:
+            return {
+                'pool_size': self.pool_size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'waiters': self._waiters,
+                'checkouts': self._checkouts,
+                'created': self._created,
+                'evicted': self._evicted,
+                'wait_time_total': self._wait_total,
+                'wait_time_max': self._wait_max,
+                'wait_time_avg': self._wait_total / self._checkouts if self._checkouts else 0.0,
+            }
+
+    def close_all(self):
+        with self._cond:
+            for conn in self._idle:
+                conn.close()
+            self._idle = []
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+# 접속 정보별로 하나의 풀만 생성하여 프로세스 전체에서 공유
+def get_pool(config=None):
+    config = config or get_db_config()
+    key = tuple(sorted(config.items()))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(
+                config,
+                pool_size=int(os.getenv('DB_POOL_SIZE', '5')),
+                idle_timeout=int(os.getenv('DB_POOL_IDLE_TIMEOUT', '300')),
+                max_lifetime=int(os.getenv('DB_POOL_MAX_LIFETIME', '1800')),
+                checkout_timeout=int(os.getenv('DB_POOL_CHECKOUT_TIMEOUT', '10')),
+            )
+            _pools[key] = pool
+        return pool
+
+
+_monitors = {}
+
+
+# 접속 정보별로 하나의 헬스 모니터만 생성
+def get_health_monitor(config=None):
+    config = config or get_db_config()
+    key = tuple(sorted(config.items()))
+    with _pools_lock:
+        monitor = _monitors.get(key)
+        if monitor is None:
+            monitor = HealthMonitor(
+                lambda timeout: probe_backend(config, timeout),
+                interval=int(os.getenv('DB_HEALTH_INTERVAL', '15')),
+                ping_timeout=int(os.getenv('DB_HEALTH_TIMEOUT', '3')),
+                backoff_max=int(os.getenv('DB_HEALTH_BACKOFF_MAX', '60')),
+            )
+            _monitors[key] = monitor
+        return monitor
+
+
+# 쿼리 1건의 실행 기록
+class QueryRecord:
+    def __init__(self, label, query, elapsed, rows, nbytes, error=None, params=None):
+        self.label = label
+        self.query = query
+        self.params = tuple(params) if params else ()
+        self.elapsed = elapsed
+        self.rows = rows
+        self.nbytes = nbytes
+        self.error = error
+        self.timestamp = time.time()
+
+    def to_dict(self):
+        return {
+            'label': self.label,
+            'elapsed_ms': self.elapsed * 1000,
+            'rows': self.rows,
+            'bytes': self.nbytes,
+            'error': self.error,
+            'timestamp': self.timestamp,
+        }
+
+
+# 모든 쿼리의 지연 시간/행 수/결과 크기 수집 (최근 N건 보관)
+class QueryMetrics:
+    def __init__(self, max_records=1000):
+        self._records = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    def record(self, record):
+        with self._lock:
+            self._records.append(record)
+
+    def recent(self, limit=None):
+        with self._lock:
+            records = list(self._records)
+        if limit:
+            records = records[-limit:]
+        return [r.to_dict() for r in records]
+
+    # 쿼리 문과 파라미터까지 포함한 원본 기록 (실행 계획 점검 등에 사용)
+    def records(self):
+        with self._lock:
+            return list(self._records)
+
+    # label 별 호출 수, 평균/최대 지연 시간, 누적 행 수와 바이트
+    def summary(self):
+        summary = {}
+        with self._lock:
+            records = list(self._records)
+        for r in records:
+            item = summary.setdefault(r.label, {
+                'calls': 0, 'errors': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0, 'bytes': 0,
+            })
+            item['calls'] += 1
+            item['errors'] += 1 if r.error else 0
+            item['total_ms'] += r.elapsed * 1000
+            item['max_ms'] = max(item['max_ms'], r.elapsed * 1000)
+            item['rows'] += r.rows
+            item['bytes'] += r.nbytes
+        for item in summary.values():
+            item['avg_ms'] = item['total_ms'] / item['calls']
+        return summary
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+
+# 쿼리 문자열에서 기록용 label 생성 (공백 정리 후 앞부분만 사용)
+def make_query_label(query, max_length=80):
+    normalized = ' '.join(query.split())
+    return normalized if len(normalized) <= max_length else normalized[:max_length] + '...'
+
+
+query_metrics = QueryMetrics()
+
+
+class DatabaseConnector:
+    def __init__(self, config=None):
+        self.config = config or get_db_config()
+        self.pool = get_pool(self.config)
+        self.health = get_health_monitor(self.config)
+        self.metrics = query_metrics
+        self.cache = result_cache
+        # 조회 결과 DataFrame 의 dtype 정리 기본값 (Categorical/작은 정수형/datetime64)
+        # 모든 조회에 적용하고 로더별 정리 전/후 메모리를 기록, DB_NORMALIZE_DTYPES=0 이면 끔 (로더는 normalize=False 로 제외 가능)
+        self.normalize_dtypes = os.getenv('DB_NORMALIZE_DTYPES', '1') != '0'
+        self.memory_profile = memory_profile
+
+    # 헬스 모니터의 마지막 상태를 반환 (첫 확인 외에는 대기하지 않음)
+    def connect(self):
+        return self.health.is_available()
+
+    # 공유 풀은 프로세스 종료 시까지 유지되므로 개별 페이지에서는 닫지 않음
+    def disconnect(self):
+        pass
+
+    def is_connected(self):
+        return self.health.is_available()
+
+    def health_status(self):
+        return self.health.status()
+
+    # 차단 상태이면 접속을 시도하지 않고 즉시 실패
+    def _check_available(self):
+        if not self.health.allow_request():
+            raise DatabaseUnavailableError("데이터베이스에 연결할 수 없습니다 (재연결 대기 중)")
+
+    @contextmanager
+    def get_connection(self, timeout=None):
+        with self.pool.connection(timeout) as conn:
+            yield conn
+
+    # 모든 조회/갱신이 거치는 단일 실행 경로 (실행 시간, 행 수, 결과 크기 기록)
+    def _run(self, query, params, handler, label=None):
+        label = label or make_query_label(query)
+        started = time.perf_counter()
+        rows, nbytes, error = 0, 0, None
+        try:
+            self._check_available()
+            with self.get_connection() as conn:
+                result, rows, nbytes = handler(conn)
+            return result
+        except Exception as e:
+            error = str(e)
+            if isinstance(e, CONNECTION_ERRORS):
+                self.health.record_failure(error)
+            raise
+        finally:
+            self.metrics.record(QueryRecord(label, query, time.perf_counter() - started, rows, nbytes, error, params))
+
+    # cached=True 이면 공유 결과 캐시를 거침 (반환값은 복사본이므로 수정해도 캐시에 영향 없음)
+    def execute_query(self, query, params=None, label=None, cached=False):
+        if cached:
+            return self.cache.get_or_load(
+                make_cache_key(query, params, 'rows'),
+                label or make_query_label(query),
+                lambda: self._load_rows(query, params, label),
+                copy=lambda rows: [dict(row) for row in rows],
+            )
+
+        def handler(conn):
+            cursor = conn.cursor(dictionary=True)
+            try:
+                cursor.execute(query, params or ())
+                result = cursor.fetchall()
+            finally:
+                cursor.close()
+            nbytes = sum(len(str(value)) for row in result for value in row.values())
+            return result, len(result), nbytes
+
+        return self._run(query, params, handler, label)
+
+    def _load_rows(self, query, params, label):
+        rows = self.execute_query(query, params, label)
+        return rows, sum(len(str(value)) for row in rows for value in row.values())
+
+    # 데이터가 바뀌므로 갱신한 테이블을 읽은 캐시 항목만 비움 (다른 테이블의 결과는 TTL 까지 유지)
+    def execute_update(self, query, params=None, label=None):
+        def handler(conn):
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, params or ())
+                conn.commit()
+                return cursor.lastrowid or cursor.rowcount, cursor.rowcount, 0
+            finally:
+                cursor.close()
+
+        try:
+            return self._run(query, params, handler, label)
+        finally:
+            self.cache.invalidate(referenced_tables(query))
+
+    # 여러 문장을 하나의 트랜잭션으로 실행 - handler(conn) 은 (결과, 처리 행 수) 를 반환
+    # 결과 캐시는 정리하지 않으므로 필요하면 호출하는 쪽에서 정리
+    def execute_transaction(self, handler, label):
+        def run(conn):
+            result, rows = handler(conn)
+            conn.commit()
+            return result, rows, 0
+
+        return self._run(label, None, run, label)
+
+    # columnar=True 이면 행 튜플 대신 컬럼별 타입 배열로 결과를 구성
+    # cached=True 이면 공유 결과 캐시를 거침
+    # normalize=True 이면 결과의 dtype 을 정리하고 로더별 정리 전/후 메모리를 memory_profile 에 기록
+    # (None 이면 DB_NORMALIZE_DTYPES 설정을 따름)
+    def query_to_dataframe(self, query, params=None, label=None, columnar=False, cached=False, normalize=None):
+        normalize = self.normalize_dtypes if normalize is None else normalize
+        if cached:
+            kind = 'columnar' if columnar else 'frame'
+            return self.cache.get_or_load(
+                make_cache_key(query, params, f"{kind}:normalized" if normalize else kind),
+                label or make_query_label(query),
+                lambda: self._load_frame(query, params, label, columnar, normalize),
+                copy=lambda df: df.copy(),
+            )
+
+        def handler(conn):
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, params or ())
+                if columnar:
+                    df = build_columnar_frame(cursor)
+                else:
+                    rows = cursor.fetchall()
+                    columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                    df = pd.DataFrame(rows, columns=columns)
+            finally:
+                cursor.close()
+            return df, len(df), int(df.memory_usage(index=False, deep=True).sum())
+
+        df = self._run(query, params, handler, label)
+        if normalize and not df.empty:
+            before = frame_nbytes(df)
+            df = normalize_dtypes(df)
+            self.memory_profile.record(label or make_query_label(query), before, frame_nbytes(df))
+        return df
+
+    def _load_frame(self, query, params, label, columnar, normalize):
+        df = self.query_to_dataframe(query, params, label, columnar, normalize=normalize)
+        return df, int(df.memory_usage(index=True, deep=True).sum())
+
+    # 서버 측(비버퍼) 커서에서 chunk_size 행씩 DataFrame 으로 나누어 반환
+    # 전체 결과를 한 번에 메모리에 올리지 않으므로 대용량 조회/집계/내보내기에 사용
+    def iter_dataframes(self, query, params=None, chunk_size=50000, label=None, columnar=True):
+        label = label or make_query_label(query)
+        started = time.perf_counter()
+        rows_total, nbytes, error = 0, 0, None
+        self._check_available()
+        try:
+            conn = self.pool.acquire()
+        except CONNECTION_ERRORS as e:
+            self.health.record_failure(str(e))
+            raise
+        cursor = None
+        finished = False
+        try:
+            cursor = conn.raw.cursor(buffered=False)
+            cursor.execute(query, params or ())
+            description = cursor.description or []
+            columns = [desc[0] for desc in description]
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                if columnar:
+                    chunk = rows_to_frame(description, rows)
+                else:
+                    chunk = pd.DataFrame(rows, columns=columns)
+                rows_total += len(chunk)
+                nbytes += int(chunk.memory_usage(index=False, deep=True).sum())
+                yield chunk
+            finished = True
+        except Exception as e:
+            error = str(e)
+            if isinstance(e, CONNECTION_ERRORS):
+                self.health.record_failure(error)
+            raise
+        finally:
+            if finished:
+                try:
+                    cursor.close()
+                    conn.raw.rollback()
+                except Exception:
+                    finished = False
+            # 중간에 소비를 멈추면 남은 결과를 읽어 버리는 대신 커넥션을 폐기
+            self.pool.release(conn, broken=not finished)
+            self.metrics.record(QueryRecord(label, query, time.perf_counter() - started, rows_total, nbytes, error, params))
+
+    def query_stats(self):
+        return self.metrics.summary()
+
+    def recent_queries(self, limit=None):
+        return self.metrics.recent(limit)
+
+    def pool_stats(self):
+        return self.pool.stats()
+
+    def cache_stats(self):
+        return self.cache.stats()
+
+    def memory_stats(self):
+        return self.memory_profile.summary()
+
+
+# 모든 페이지에서 공유하는 기본 커넥터
+db = DatabaseConnector()
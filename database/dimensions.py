@@ -0,0 +1,120 @@
+import os
+import time
+import threading
+
+import numpy as np
+import pandas as pd
+
+from database.models import Region, CarType, Manufacturer, CarModel
+
+# 기준 정보(지역/차종/모델/제조사)를 다시 읽는 주기(초)
+DIMENSION_TTL = int(os.getenv('DB_DIMENSION_TTL', '3600'))
+# 사전에 없는 id 를 만나 다시 읽을 때의 최소 간격(초) - 잘못된 id 가 계속 다시 읽기를 일으키지 않도록
+DIMENSION_REFRESH_INTERVAL = 10
+
+
+# id -> 이름 사전 (이름은 범주형 코드로 변환하여 보관)
+class Dimension:
+    def __init__(self, ids, names):
+        ids = np.asarray(ids, dtype=np.int64)
+        codes, self.categories = pd.factorize(pd.Series(list(names), dtype=object))
+        self.lookup = np.full(int(ids.max()) + 1 if len(ids) else 0, -1, dtype=np.int32)
+        self.lookup[ids] = codes
+
+    # id 배열 -> 범주 코드 배열 (사전에 없는 id 와 NULL 은 -1)
+    def codes(self, ids):
+        ids = pd.Series(ids).fillna(-1).to_numpy(dtype=np.int64)
+        valid = (ids >= 0) & (ids < len(self.lookup))
+        codes = np.full(len(ids), -1, dtype=np.int32)
+        codes[valid] = self.lookup[ids[valid]]
+        return codes
+
+
+# car_registration 의 정수 id 를 메모리의 기준 정보로 이름에 매핑
+# 조회 쿼리에서 기준 정보 테이블 조인을 빼고 id 만 받아 범주형으로 변환하므로 DB 조인과 전송되는 문자열이 줄어듦
+class DimensionCache:
+    def __init__(self, ttl=DIMENSION_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._dimensions = None
+        self._loaded_at = 0.0
+
+    def _build(self):
+        models = CarModel.get_all()
+        model_manufacturer = np.full(max((m['id'] for m in models), default=-1) + 1, -1, dtype=np.int64)
+        for model in models:
+            if model['manufacturer_id'] is not None:
+                model_manufacturer[model['id']] = model['manufacturer_id']
+        manufacturers = Manufacturer.get_all()
+        return {
+            'region': Dimension(*self._columns(Region.get_all())),
+            'car_type': Dimension(*self._columns(CarType.get_all())),
+            'car_model': Dimension(*self._columns(models)),
+            'manufacturer': Dimension(*self._columns(manufacturers)),
+            # 제조사 id -> 국가 (국가가 없는 제조사는 -1)
+            'country': Dimension([row['id'] for row in manufacturers], [row.get('country') for row in manufacturers]),
+            'model_manufacturer': model_manufacturer,
+        }
+
+    @staticmethod
+    def _columns(rows):
+        return [row['id'] for row in rows], [row['name'] for row in rows]
+
+    # refresh=True 이면 TTL 과 관계없이 다시 읽음 (새로 추가된 id 를 만났을 때)
+    def load(self, refresh=False):
+        with self._lock:
+            age = time.monotonic() - self._loaded_at
+            if self._dimensions is None or age > self.ttl or (refresh and age > DIMENSION_REFRESH_INTERVAL):
+                self._dimensions = self._build()
+                self._loaded_at = time.monotonic()
+            return self._dimensions
+
+    def clear(self):
+        with self._lock:
+            self._dimensions = None
+
+    # 모델 id -> 제조사 id
+    @staticmethod
+    def _manufacturer_ids(dimensions, model_ids):
+        model_ids = pd.Series(model_ids).fillna(-1).to_numpy(dtype=np.int64)
+        lookup = dimensions['model_manufacturer']
+        valid = (model_ids >= 0) & (model_ids < len(lookup))
+        manufacturer_ids = np.full(len(model_ids), -1, dtype=np.int64)
+        manufacturer_ids[valid] = lookup[model_ids[valid]]
+        return manufacturer_ids
+
+    def _codes(self, dimensions, df):
+        return {
+            'region_name': dimensions['region'].codes(df['region_id']),
+            'car_type_name': dimensions['car_type'].codes(df['car_type_id']),
+            'car_model_name': dimensions['car_model'].codes(df['car_model_id']),
+            'manufacturer_name': dimensions['manufacturer'].codes(
+                self._manufacturer_ids(dimensions, df['car_model_id'])),
+        }
+
+    # region_id/car_type_id/car_model_id 컬럼을 이름(범주형) 컬럼으로 바꾼 DataFrame 반환
+    # 기준 정보에 없는 id 의 행은 기존 조인(INNER JOIN)과 같이 제외
+    # dimensions: 미리 읽은 기준 정보 (스트리밍 커서를 연 채로 호출할 때 - 커넥션을 하나 더 잡지 않도록 다시 읽지 않음)
+    def decode_registrations(self, df, dimensions=None):
+        refresh = dimensions is None
+        dimensions = dimensions or self.load()
+        codes = self._codes(dimensions, df)
+        if refresh and any((column_codes < 0).any() for column_codes in codes.values()):
+            dimensions = self.load(refresh=True)
+            codes = self._codes(dimensions, df)
+
+        keep = np.logical_and.reduce([column_codes >= 0 for column_codes in codes.values()])
+        result = df.loc[keep, ['id', 'registration_date']].reset_index(drop=True)
+        categories = {
+            'region_name': dimensions['region'].categories,
+            'car_type_name': dimensions['car_type'].categories,
+            'car_model_name': dimensions['car_model'].categories,
+            'manufacturer_name': dimensions['manufacturer'].categories,
+        }
+        for column, column_codes in codes.items():
+            result[column] = pd.Categorical.from_codes(column_codes[keep], categories=categories[column])
+        result['registration_count'] = df['registration_count'].to_numpy()[keep]
+        return result
+
+
+dimension_cache = DimensionCache()
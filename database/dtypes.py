@@ -0,0 +1,128 @@
+import threading
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from database.columnar import CATEGORY_MAX_RATIO
+
+# 정수 컬럼은 값 범위의 이 배수까지 담을 수 있는 가장 작은 폭으로 줄임
+# (페이지에서 컬럼끼리 더하거나 곱해도 넘치지 않도록 여유를 둠)
+INT_HEADROOM = 16
+INT_DTYPES = [np.int8, np.int16, np.int32]
+
+# 행 수가 이보다 적으면 Categorical 의 범주 목록 비용이 더 커서 변환하지 않음
+CATEGORY_MIN_ROWS = 100
+
+ISO_DATE_PATTERN = r'\d{4}-\d{2}-\d{2}(?:[ T]\d{2}:\d{2}:\d{2}(?:\.\d+)?)?'
+
+
+def smallest_int_dtype(low, high, headroom=INT_HEADROOM):
+    for dtype in INT_DTYPES:
+        info = np.iinfo(dtype)
+        if low * headroom >= info.min and high * headroom <= info.max:
+            return dtype
+    return np.int64
+
+
+def _downcast_integers(values):
+    if values.size == 0:
+        return values
+    return values.astype(smallest_int_dtype(int(values.min()), int(values.max())))
+
+
+# 수치 컬럼 -> 정수로 떨어지면 가장 작은 정수형, 아니면 float64 (NULL 이 있으면 그대로)
+def _normalize_numeric(series):
+    if series.isna().any():
+        return series
+    values = series.to_numpy()
+    if np.issubdtype(values.dtype, np.integer):
+        return pd.Series(_downcast_integers(values), index=series.index)
+    values = values.astype(np.float64)
+    if values.size and np.array_equal(values, np.floor(values)) and np.abs(values).max() < 2 ** 53:
+        return pd.Series(_downcast_integers(values.astype(np.int64)), index=series.index)
+    return pd.Series(values, index=series.index)
+
+
+# 문자열/객체 컬럼 -> 날짜, 수치(Decimal 등), 반복되는 이름은 Categorical
+def _normalize_object(series):
+    codes, uniques = pd.factorize(series)
+    if len(uniques) == 0:
+        return series
+    first = uniques[0]
+
+    if isinstance(first, (date, pd.Timestamp)):
+        return pd.to_datetime(series)
+    if isinstance(first, (int, float, Decimal, np.number)) and not isinstance(first, bool):
+        return _normalize_numeric(pd.to_numeric(series))
+    if not isinstance(first, str):
+        return series
+
+    if pd.Series(uniques).str.fullmatch(ISO_DATE_PATTERN).all():
+        return pd.to_datetime(series)
+    if len(series) >= CATEGORY_MIN_ROWS and len(uniques) <= len(series) * CATEGORY_MAX_RATIO:
+        return pd.Series(pd.Categorical.from_codes(codes, categories=uniques), index=series.index)
+    return series
+
+
+def normalize_column(series):
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        # 날짜를 문자열로 돌려주는 백엔드(SQLite)의 날짜 컬럼
+        categories = dtype.categories
+        if len(categories) and pd.api.types.is_string_dtype(categories.dtype) and categories.str.fullmatch(ISO_DATE_PATTERN).all():
+            return pd.to_datetime(series.astype(object))
+        return series
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return series
+    if pd.api.types.is_bool_dtype(dtype):
+        return series
+    if pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype):
+        return _normalize_numeric(series)
+    if dtype == object or pd.api.types.is_string_dtype(dtype):
+        return _normalize_object(series)
+    return series
+
+
+# 조회 결과의 dtype 정리: 반복되는 이름은 Categorical, 정수는 가장 작은 폭, 날짜는 datetime64
+def normalize_dtypes(df):
+    if df.empty:
+        return df
+    return pd.DataFrame({column: normalize_column(df[column]) for column in df.columns}, index=df.index)
+
+
+def frame_nbytes(df):
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+# 로더(label)별 dtype 정리 전/후 메모리 (마지막 조회 기준, 누적 바이트 포함)
+class MemoryProfile:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaders = {}
+
+    def record(self, label, before, after):
+        with self._lock:
+            item = self._loaders.setdefault(label, {
+                'calls': 0, 'before_bytes': 0, 'after_bytes': 0, 'total_before_bytes': 0, 'total_after_bytes': 0,
+            })
+            item['calls'] += 1
+            item['before_bytes'] = before
+            item['after_bytes'] = after
+            item['total_before_bytes'] += before
+            item['total_after_bytes'] += after
+
+    def summary(self):
+        with self._lock:
+            return {
+                label: dict(item, ratio=item['total_before_bytes'] / item['total_after_bytes'] if item['total_after_bytes'] else 1.0)
+                for label, item in self._loaders.items()
+            }
+
+    def clear(self):
+        with self._lock:
+            self._loaders.clear()
+
+
+memory_profile = MemoryProfile()
@@ -0,0 +1,58 @@
+"""
+여러 개 선택 가능한 id 필터 (지역/차종 multiselect) 를 쿼리 조건으로 변환
+
+선택한 id 목록은 하나의 파라미터화된 IN (...) 조건으로 보내므로 N 개를 비교해도 왕복 횟수는 하나를 조회할 때와 같다.
+연도/월 필터는 인덱스를 사용할 수 있는 반열린 날짜 범위 조건으로 변환한다.
+"""
+from datetime import date
+
+
+# None/빈 목록 -> () (조건 없음), 단일 id -> (id,), 목록 -> 중복을 제거하고 정렬한 튜플
+# 튜플은 해시 가능하므로 캐시 키에 그대로 사용
+def normalize_ids(value):
+    if value is None:
+        return ()
+    if isinstance(value, (int, str)):
+        value = [value]
+    return tuple(sorted({int(item) for item in value if item is not None}))
+
+
+# column IN (%s, ...) 조건과 파라미터 -> (조건, 파라미터 튜플), id 가 없으면 (None, ())
+def id_in_clause(column, ids):
+    ids = normalize_ids(ids)
+    if not ids:
+        return None, ()
+    if len(ids) == 1:
+        return f"{column} = %s", ids
+    return f"{column} IN ({', '.join(['%s'] * len(ids))})", ids
+
+
+# 여러 id 조건을 AND 로 묶은 목록에 추가 - clauses/params 는 호출한 쪽의 리스트
+def append_id_filters(clauses, params, filters):
+    for column, ids in filters:
+        clause, clause_params = id_in_clause(column, ids)
+        if clause:
+            clauses.append(clause)
+            params.extend(clause_params)
+
+
+# 연도(및 월) 필터 -> 반열린 구간 (column >= 시작일 AND column < 다음 구간 시작일), 없으면 (None, ())
+# YEAR(column) = %s 처럼 컬럼을 함수로 감싸면 registration_date 인덱스를 쓰지 못하므로 범위 조건으로 변환
+def date_range_clause(column, year=None, month=None):
+    if not year:
+        return None, ()
+    year = int(year)
+    if month:
+        start = date(year, int(month), 1)
+        end = date(year + 1, 1, 1) if start.month == 12 else date(year, start.month + 1, 1)
+    else:
+        start, end = date(year, 1, 1), date(year + 1, 1, 1)
+    return f"{column} >= %s AND {column} < %s", (start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'))
+
+
+# 연도/월 조건을 clauses/params 리스트에 추가
+def append_date_range(clauses, params, column, year=None, month=None):
+    clause, clause_params = date_range_clause(column, year, month)
+    if clause:
+        clauses.append(clause)
+        params.extend(clause_params)
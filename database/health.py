@@ -0,0 +1,103 @@
+import time
+import threading
+
+# 서킷 브레이커 상태
+STATE_UNKNOWN = 'unknown'   # 첫 확인 전
+STATE_CLOSED = 'closed'     # 정상 - 쿼리 허용
+STATE_OPEN = 'open'         # 장애 - 쿼리를 즉시 실패 처리하고 백오프 간격으로 재확인
+
+
+class DatabaseUnavailableError(Exception):
+    pass
+
+
+# 백그라운드 스레드에서 DB 상태를 주기적으로 확인하는 헬스 모니터
+# 페이지는 is_available() 로 마지막 상태만 읽으므로 장애 중에도 렌더링이 막히지 않음
+class HealthMonitor:
+    def __init__(self, probe, interval=15, ping_timeout=3, failure_threshold=2,
+                 backoff_base=1, backoff_max=60):
+        self.probe = probe
+        self.interval = interval
+        self.ping_timeout = ping_timeout
+        self.failure_threshold = failure_threshold
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._state = STATE_UNKNOWN
+        self._failures = 0
+        self._last_error = None
+        self._last_check = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        self._checked = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name='db-health-monitor', daemon=True)
+                self._thread.start()
+
+    def _loop(self):
+        while True:
+            self.check()
+            delay = max(self._next_check - time.monotonic(), 0)
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+
+    # 연속 실패 횟수에 따른 다음 확인까지의 대기 시간 (지수 백오프)
+    def _backoff(self):
+        return min(self.backoff_base * (2 ** (self._failures - 1)), self.backoff_max)
+
+    def check(self):
+        started = time.monotonic()
+        try:
+            ok = self.probe(self.ping_timeout)
+            error = None if ok else '상태 확인 실패'
+        except Exception as e:
+            ok, error = False, str(e)
+        if ok:
+            self.record_success()
+        else:
+            self.record_failure(error)
+        with self._lock:
+            self._last_check = time.time()
+            self._next_check = started + (self.interval if ok else self._backoff())
+        self._checked.set()
+        return ok
+
+    def record_success(self):
+        with self._lock:
+            self._state = STATE_CLOSED
+            self._failures = 0
+            self._last_error = None
+
+    # 쿼리 실행 중 접속 오류가 나면 호출 - 임계치를 넘으면 차단하고 즉시 재확인 예약
+    def record_failure(self, error=None):
+        with self._lock:
+            self._failures += 1
+            self._last_error = error
+            if self._failures >= self.failure_threshold or self._state == STATE_UNKNOWN:
+                self._state = STATE_OPEN
+        self._wakeup.set()
+
+    # 첫 확인 결과는 최대 wait 초까지만 기다리고 이후에는 마지막 상태를 즉시 반환
+    def is_available(self, wait=None):
+        self.start()
+        if self._state == STATE_UNKNOWN:
+            self._checked.wait(self.ping_timeout if wait is None else wait)
+        return self._state == STATE_CLOSED
+
+    def allow_request(self):
+        return self._state != STATE_OPEN
+
+    def status(self):
+        with self._lock:
+            return {
+                'state': self._state,
+                'failures': self._failures,
+                'last_error': self._last_error,
+                'last_check': self._last_check,
+                'next_check_in': max(self._next_check - time.monotonic(), 0),
+            }
@@ -0,0 +1,264 @@
+"""
+car_registration 조회 경로에 맞춘 인덱스 마이그레이션과 실행 계획 점검 도구
+
+01/02 페이지의 로더는 car_registration 을 registration_date 범위, region_id, car_type_id 로 거르고
+car_model_id 로 car_models 와 조인한다. 테이블 정의(산출물/TableSpecification.md)에는 기본 키만 있으므로
+아래 INDEXES 로 복합/커버링 인덱스를 추가하고, 로더가 실제로 보내는 쿼리의 EXPLAIN 결과에서
+큰 테이블의 전체 스캔을 찾아 보고한다.
+
+사용법:
+    python -m database.indexes --apply     # 인덱스 생성 (이미 있으면 건너뜀)
+    python -m database.indexes --drop      # 인덱스 제거 (비교 측정용)
+    python -m database.indexes --explain   # 01/02 로더 쿼리의 실행 계획 점검
+    python benchmarks/bench_indexes.py     # 합성 데이터로 인덱스 적용 전/후 비교
+    python benchmarks/bench_sargable.py    # 02 연도 조건 YEAR() 와 날짜 범위 조건 비교
+"""
+import os
+import re
+import argparse
+import importlib.util
+from datetime import date, timedelta
+
+from database.db_connector import db
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (테이블, 인덱스 이름, 컬럼, 용도)
+INDEXES = [
+    ('car_registration', 'idx_cr_date', ('registration_date',),
+     '기간 조건 조회, (registration_date, id) 역순 keyset 페이지 (보조 인덱스 끝에 기본 키가 붙어 순서가 일치)'),
+    ('car_registration', 'idx_cr_region_covering',
+     ('region_id', 'registration_date', 'car_type_id', 'car_model_id', 'registration_count'),
+     '지역 필터 + 기간 조회/집계를 인덱스만으로 처리'),
+    ('car_registration', 'idx_cr_type_covering',
+     ('car_type_id', 'registration_date', 'region_id', 'car_model_id', 'registration_count'),
+     '차종 필터 + 기간 조회/집계를 인덱스만으로 처리'),
+    ('car_registration', 'idx_cr_model_date', ('car_model_id', 'registration_date', 'registration_count'),
+     '모델/제조사 기준 조인과 모델별 순위'),
+    ('car_models', 'idx_cm_manufacturer', ('manufacturer_id', 'id'),
+     '제조사 필터에서 모델 목록 조회'),
+]
+
+# 이 행 수보다 작은 테이블(지역/차종 등 기준 정보)의 전체 스캔은 보고하지 않음
+FULL_SCAN_MIN_ROWS = int(os.getenv('INDEX_ADVISOR_MIN_ROWS', '10000'))
+
+# 실행 계획 점검 대상 페이지
+LOADER_PAGES = ['01_car_registration.py', '02_statistics.py']
+
+ALIAS_PATTERN = re.compile(r'\b(?:FROM|JOIN)\s+`?(\w+)`?(?:\s+(?:AS\s+)?(?!ON\b|WHERE\b|JOIN\b|LEFT\b|INNER\b|GROUP\b|ORDER\b|LIMIT\b)(\w+))?',
+                           re.IGNORECASE)
+
+
+def _is_sqlite():
+    return db.config.get('backend') == 'sqlite'
+
+
+def index_exists(table, name):
+    if _is_sqlite():
+        query = "SELECT COUNT(*) AS cnt FROM sqlite_master WHERE type = 'index' AND tbl_name = %s AND name = %s"
+    else:
+        query = """
+            SELECT COUNT(*) AS cnt FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+        """
+    return db.execute_query(query, (table, name), label='index_exists')[0]['cnt'] > 0
+
+
+# INDEXES 를 생성하고 생성한 인덱스 이름 목록 반환
+def apply_indexes(indexes=INDEXES):
+    created = []
+    for table, name, columns, _ in indexes:
+        if index_exists(table, name):
+            continue
+        db.execute_update(f"CREATE INDEX {name} ON {table} ({', '.join(columns)})", label='apply_indexes')
+        created.append(name)
+    if created:
+        # 옵티마이저가 새 인덱스의 분포를 알도록 통계 갱신
+        # SQLite 는 ANALYZE 한 번으로 모든 테이블, MySQL 의 ANALYZE TABLE 은 결과 행을 돌려주므로 읽어서 버림
+        if _is_sqlite():
+            db.execute_update("ANALYZE", label='apply_indexes')
+        else:
+            for table in sorted({table for table, *_ in indexes}):
+                db.execute_query(f"ANALYZE TABLE {table}", label='apply_indexes')
+    return created
+
+
+def drop_indexes(indexes=INDEXES):
+    dropped = []
+    for table, name, _, _ in indexes:
+        if not index_exists(table, name):
+            continue
+        db.execute_update(f"DROP INDEX {name}" if _is_sqlite() else f"DROP INDEX {name} ON {table}", label='drop_indexes')
+        dropped.append(name)
+    return dropped
+
+
+# 쿼리의 별칭 -> 테이블 이름
+def table_aliases(query):
+    aliases = {}
+    for table, alias in ALIAS_PATTERN.findall(query):
+        aliases[table] = table
+        if alias:
+            aliases[alias] = table
+    return aliases
+
+
+# 실행 계획 -> [{'table', 'access', 'index', 'detail'}]
+# access: 'full_scan'(테이블 전체), 'index_scan'(인덱스 전체), 'index_lookup'(인덱스 범위/동등 조회)
+def explain_query(query, params=None):
+    aliases = table_aliases(query)
+    steps = []
+    if _is_sqlite():
+        for row in db.execute_query(f"EXPLAIN QUERY PLAN {query}", params, label='explain'):
+            detail = row['detail']
+            match = re.match(r'(SCAN|SEARCH)\s+(?:TABLE\s+)?(\w+)(?:\s+AS\s+(\w+))?', detail)
+            if not match:
+                continue
+            operation, name, alias = match.groups()
+            index = re.search(r'USING (?:COVERING )?INDEX (\w+)', detail)
+            index = index.group(1) if index else None
+            if operation == 'SEARCH':
+                access = 'index_lookup'
+            else:
+                access = 'index_scan' if 'INDEX' in detail else 'full_scan'
+            steps.append({'table': aliases.get(alias or name, name), 'access': access, 'index': index, 'detail': detail})
+    else:
+        for row in db.execute_query(f"EXPLAIN {query}", params, label='explain'):
+            access = {'ALL': 'full_scan', 'index': 'index_scan'}.get(row['type'], 'index_lookup')
+            name = row['table'] or ''
+            steps.append({
+                'table': aliases.get(name, name), 'access': access, 'index': row['key'],
+                'detail': f"type={row['type']} key={row['key']} rows={row['rows']} {row['Extra'] or ''}".strip(),
+            })
+    return steps
+
+
+_row_counts = {}
+
+
+def table_rows(table):
+    if table not in _row_counts:
+        try:
+            _row_counts[table] = db.execute_query(f"SELECT COUNT(*) AS cnt FROM {table}", label='table_rows')[0]['cnt']
+        except Exception:
+            _row_counts[table] = 0
+    return _row_counts[table]
+
+
+# 큰 테이블을 전체(또는 인덱스 전체) 스캔하는 단계만 골라냄
+def find_full_scans(steps, min_rows=FULL_SCAN_MIN_ROWS):
+    return [
+        step for step in steps
+        if step['access'] in ('full_scan', 'index_scan') and table_rows(step['table']) >= min_rows
+    ]
+
+
+def _load_page(filename):
+    spec = importlib.util.spec_from_file_location(os.path.splitext(filename)[0], os.path.join(BASE_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# 페이지별로 점검할 로더와 대표 인자 (조건 유무에 따라 쿼리가 달라지는 경우 모두 포함)
+def loader_calls():
+    today = date.today()
+    start, year = today - timedelta(days=365), today.year - 1
+    period = dict(start_date=start, end_date=today)
+    return {
+        '01_car_registration.py': [
+            ('load_registration_summary', period),
+            ('load_registration_summary', dict(period, region_ids=[1], car_type_ids=[1])),
+            ('load_registration_summary', dict(period, region_ids=[1, 2, 3])),
+            ('load_registration_totals', dict(period, region_ids=[1, 2])),
+            ('load_registration_page', period),
+            ('load_registration_page', dict(period, region_ids=[1], after=(today - timedelta(days=30), 1))),
+            ('iter_registration_data', dict(period, car_type_ids=[1])),
+            ('load_region_stats', period),
+            ('load_car_type_stats', dict(period, region_ids=[1])),
+            ('load_manufacturer_stats', dict(period, region_ids=[1, 2], car_type_ids=[1])),
+            ('load_monthly_trend', dict(region_ids=[1])),
+            ('load_monthly_trend', dict(region_ids=[1, 2, 3], split_by='region')),
+            ('load_region_car_type_matrix', period),
+        ],
+        '02_statistics.py': [
+            ('load_yearly_stats', {}),
+            ('load_yearly_car_type_stats', {}),
+            ('load_yearly_region_stats', {}),
+            ('load_yearly_manufacturer_stats', {}),
+            ('load_ev_stats', {}),
+            ('load_eco_friendly_ratio', {}),
+            ('load_top_models', dict(year=year)),
+            ('load_monthly_trend_by_year', dict(year=year)),
+            ('load_region_car_type_preference', {}),
+            ('load_top_models_by_manufacturer', dict(year=year, manufacturer_id=1)),
+            ('load_domestic_vs_import_data', {}),
+            ('load_country_registration_data', dict(year=year)),
+            ('load_manufacturer_market_share', dict(year=year)),
+            ('load_manufacturer_share_trend', {}),
+        ],
+    }
+
+
+# 로더를 실제로 호출하여 보낸 SELECT 쿼리를 수집 -> [(label, query, params)] (중복 제거)
+# 페이지 모듈을 불러오므로 streamlit 이 설치되어 있어야 함
+def collect_loader_queries(pages=LOADER_PAGES):
+    collected = {}
+    calls = loader_calls()
+    for page in pages:
+        module = _load_page(page)
+        for func_name, kwargs in calls.get(page, []):
+            # 캐시에 있으면 쿼리가 나가지 않으므로 호출마다 비움
+            db.cache.clear()
+            before = len(db.metrics.records())
+            result = getattr(module, func_name)(**kwargs)
+            if hasattr(result, '__next__'):
+                for _ in result:
+                    pass
+            for record in db.metrics.records()[before:]:
+                if record.error or not record.query.lstrip().upper().startswith('SELECT'):
+                    continue
+                key = (record.label, ' '.join(record.query.split()))
+                collected.setdefault(key, (record.label, record.query, record.params))
+    return list(collected.values())
+
+
+# 수집한 로더 쿼리마다 실행 계획을 확인 -> [(label, query, params, steps, full_scans)]
+def advise(queries=None, min_rows=FULL_SCAN_MIN_ROWS):
+    queries = queries if queries is not None else collect_loader_queries()
+    report = []
+    for label, query, params in queries:
+        steps = explain_query(query, params)
+        report.append((label, query, params, steps, find_full_scans(steps, min_rows)))
+    return report
+
+
+def print_report(report):
+    flagged = 0
+    for label, query, params, steps, full_scans in report:
+        status = '전체 스캔' if full_scans else 'OK'
+        flagged += 1 if full_scans else 0
+        print(f"[{status}] {label}")
+        for step in steps:
+            marker = '  !!' if step in full_scans else '    '
+            print(f"{marker} {step['table']:20} {step['access']:13} {step['detail']}")
+    print(f"\n{len(report)}개 쿼리 중 {flagged}개에서 큰 테이블 전체 스캔")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='car_registration 인덱스 마이그레이션 / 실행 계획 점검')
+    parser.add_argument('--apply', action='store_true', help='인덱스 생성')
+    parser.add_argument('--drop', action='store_true', help='인덱스 제거')
+    parser.add_argument('--explain', action='store_true', help='로더 쿼리 실행 계획 점검')
+    args = parser.parse_args()
+
+    if args.drop:
+        print("제거:", ', '.join(drop_indexes()) or '없음')
+    if args.apply:
+        print("생성:", ', '.join(apply_indexes()) or '없음 (이미 적용됨)')
+    if args.explain or not (args.apply or args.drop):
+        print_report(advise())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,541 @@
+"""
+MySQL 없이 실행하기 위한 내장(SQLite) 백엔드
+
+저장소에 포함된 MySQL 덤프(used_car, imported_car, domestic_car, faq)와
+used_car_data.json 을 하나의 SQLite 파일로 적재하고, 페이지 쿼리에서 사용하는
+MySQL 전용 함수(YEAR, MONTH, DATE_FORMAT, CURDATE 등)를 SQLite 문법으로 바꿔 실행한다.
+
+사용법:
+    DB_BACKEND=sqlite streamlit run 01_car_registration.py
+    python -m database.local_backend --rebuild      # 덤프에서 로컬 DB 다시 생성
+"""
+import os
+import re
+import glob
+import json
+import math
+import random
+import sqlite3
+import argparse
+import tempfile
+import contextlib
+from datetime import date, datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from mysql.connector.constants import FieldType
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_LOCAL_DB_PATH = os.path.join(BASE_DIR, 'local_data', 'car_registration.sqlite3')
+
+# 적재 대상 덤프 (mysqldump 출력 파일만 사용)
+DUMP_PATTERNS = [
+    'used_car/*.sql',
+    'imported_car/*.sql',
+    'domestic_car/*.sql',
+    'rent_car_and_faq/faq data.sql',
+]
+USED_CAR_JSON = 'used_car/used_car_data.json'
+
+# 덤프에 포함되지 않은 테이블 (산출물/TableSpecification.md 및 페이지 쿼리 기준)
+BASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS regions (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    code TEXT,
+    description TEXT,
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS car_types (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS manufacturers (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    country TEXT,
+    description TEXT,
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS car_models (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    manufacturer_id INTEGER,
+    car_type_id INTEGER,
+    year INTEGER,
+    description TEXT,
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS car_registration (
+    id INTEGER PRIMARY KEY,
+    registration_date DATE,
+    region_id INTEGER,
+    car_type_id INTEGER,
+    car_model_id INTEGER,
+    registration_count INTEGER,
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS regions_table (
+    id INTEGER PRIMARY KEY,
+    region_name TEXT
+);
+CREATE TABLE IF NOT EXISTS rent_car_companies_table (
+    id INTEGER PRIMARY KEY,
+    company_name TEXT,
+    region_id INTEGER,
+    sedan_vehicle_count INTEGER,
+    van_vehicle_count INTEGER,
+    electric_sedan_vehicle_count INTEGER,
+    electric_van_vehicle_count INTEGER
+);
+CREATE TABLE IF NOT EXISTS industries (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS companies (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    industry_id INTEGER
+);
+CREATE TABLE IF NOT EXISTS faq_categories (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS company_faqs (
+    id INTEGER PRIMARY KEY,
+    company_id INTEGER,
+    category_id INTEGER,
+    question TEXT,
+    answer TEXT,
+    view_count INTEGER DEFAULT 0,
+    created_at TIMESTAMP
+);
+"""
+
+# DATE/TIMESTAMP 로 선언된 컬럼은 Python date/datetime 으로 변환
+sqlite3.register_converter('DATE', lambda value: date.fromisoformat(value.decode()))
+sqlite3.register_converter('TIMESTAMP', lambda value: datetime.fromisoformat(value.decode()))
+
+
+# ---------------------------------------------------------------------------
+# MySQL -> SQLite 쿼리 변환
+# ---------------------------------------------------------------------------
+
+# MySQL DATE_FORMAT 지정자 -> strftime 지정자
+DATE_FORMAT_SPECIFIERS = {'%i': '%M', '%s': '%S'}
+
+FUNCTION_PATTERN = re.compile(r'\b(YEAR|MONTH|DAY|DATE_FORMAT|CURDATE|NOW)\s*\(', re.IGNORECASE)
+
+
+# 여는 괄호 위치부터 짝이 맞는 닫는 괄호를 찾고 최상위 쉼표 기준으로 인자를 분리
+def _split_call(sql, open_index):
+    depth = 0
+    args = []
+    current = open_index + 1
+    i = open_index
+    quote = None
+    while i < len(sql):
+        ch = sql[i]
+        if quote:
+            if ch == '\\':
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch in ("'", '"'):
+            quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+            if depth == 0:
+                args.append(sql[current:i].strip())
+                return [arg for arg in args if arg], i
+        elif ch == ',' and depth == 1:
+            args.append(sql[current:i].strip())
+            current = i + 1
+        i += 1
+    raise ValueError(f"괄호가 맞지 않는 쿼리입니다: {sql[open_index:open_index + 50]}")
+
+
+def _convert_date_format(fmt_literal):
+    fmt = fmt_literal.strip("'\"")
+    fmt = re.sub(r'%.', lambda m: DATE_FORMAT_SPECIFIERS.get(m.group(0), m.group(0)), fmt)
+    return f"'{fmt}'"
+
+
+def _translate_function(name, args):
+    name = name.upper()
+    if name == 'YEAR':
+        return f"CAST(strftime('%Y', {args[0]}) AS INTEGER)"
+    if name == 'MONTH':
+        return f"CAST(strftime('%m', {args[0]}) AS INTEGER)"
+    if name == 'DAY':
+        return f"CAST(strftime('%d', {args[0]}) AS INTEGER)"
+    if name == 'DATE_FORMAT':
+        return f"strftime({_convert_date_format(args[1])}, {args[0]})"
+    if name == 'CURDATE':
+        return "date('now', 'localtime')"
+    if name == 'NOW':
+        return "datetime('now', 'localtime')"
+    raise ValueError(name)
+
+
+def _translate_functions(sql):
+    match = FUNCTION_PATTERN.search(sql)
+    while match:
+        open_index = match.end() - 1
+        args, close_index = _split_call(sql, open_index)
+        args = [_translate_functions(arg) for arg in args]
+        replacement = _translate_function(match.group(1), args)
+        sql = sql[:match.start()] + replacement + sql[close_index + 1:]
+        match = FUNCTION_PATTERN.search(sql, match.start() + len(replacement))
+    return sql
+
+
+# 페이지에서 사용하는 MySQL 쿼리를 SQLite 에서 실행 가능한 형태로 변환
+def translate_query(sql):
+    describe = re.match(r'\s*DESCRIBE\s+`?(\w+)`?\s*;?\s*$', sql, re.IGNORECASE)
+    if describe:
+        return f"PRAGMA table_info({describe.group(1)})"
+    sql = _translate_functions(sql)
+    return sql.replace('%s', '?')
+
+
+# ---------------------------------------------------------------------------
+# DB-API 어댑터 (풀과 DatabaseConnector 가 사용하는 mysql.connector 인터페이스 일부)
+# ---------------------------------------------------------------------------
+
+def _field_type(value):
+    if value is None:
+        return FieldType.NULL
+    if isinstance(value, bool) or isinstance(value, int):
+        return FieldType.LONGLONG
+    if isinstance(value, float):
+        return FieldType.DOUBLE
+    if isinstance(value, datetime):
+        return FieldType.DATETIME
+    if isinstance(value, date):
+        return FieldType.DATE
+    if isinstance(value, (bytes, bytearray)):
+        return FieldType.BLOB
+    return FieldType.VAR_STRING
+
+
+# 컬럼 타입 추정에 미리 읽는 최대 행 수 (앞쪽 행이 모두 NULL 인 컬럼용)
+TYPE_SCAN_ROWS = 1000
+
+
+class LocalCursor:
+    def __init__(self, cursor, dictionary=False):
+        self._cursor = cursor
+        self._dictionary = dictionary
+        self._pending = []
+        self.description = None
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    def execute(self, query, params=None):
+        self._cursor.execute(translate_query(query), tuple(params or ()))
+        self._pending = []
+        self.description = None
+        if self._cursor.description:
+            # SQLite 는 컬럼 타입을 알려주지 않으므로 컬럼마다 처음 나온 NULL 이 아닌 값으로 MySQL 타입 코드를 추정
+            # (NULL 인 컬럼이 남아 있는 동안만 TYPE_SCAN_ROWS 행까지 미리 읽어 둠)
+            types = [FieldType.NULL] * len(self._cursor.description)
+            while len(self._pending) < TYPE_SCAN_ROWS and FieldType.NULL in types:
+                row = self._cursor.fetchone()
+                if row is None:
+                    break
+                self._pending.append(row)
+                types = [_field_type(value) if field_type == FieldType.NULL else field_type
+                         for field_type, value in zip(types, row)]
+            self.description = [
+                (desc[0], field_type, None, None, None, None, True)
+                for desc, field_type in zip(self._cursor.description, types)
+            ]
+
+    def _format(self, rows):
+        if self._dictionary and self.description:
+            names = [desc[0] for desc in self.description]
+            return [dict(zip(names, row)) for row in rows]
+        return rows
+
+    def fetchone(self):
+        if self._pending:
+            row = self._pending.pop(0)
+        else:
+            row = self._cursor.fetchone()
+        return self._format([row])[0] if row is not None else None
+
+    def fetchmany(self, size=1):
+        rows, self._pending = self._pending[:size], self._pending[size:]
+        if len(rows) < size:
+            rows += self._cursor.fetchmany(size - len(rows))
+        return self._format(rows)
+
+    def fetchall(self):
+        rows = self._pending + self._cursor.fetchall()
+        self._pending = []
+        return self._format(rows)
+
+    def close(self):
+        self._cursor.close()
+
+
+class LocalConnection:
+    def __init__(self, path):
+        # 풀에서 스레드 간에 주고받으므로 check_same_thread 비활성화 (동시에 한 스레드만 사용)
+        self._conn = sqlite3.connect(path, check_same_thread=False, detect_types=sqlite3.PARSE_DECLTYPES)
+        self._conn.create_function('RAND', 0, random.random)
+        self._conn.create_function('FLOOR', 1, lambda x: None if x is None else math.floor(x))
+
+    def cursor(self, dictionary=False, buffered=True):
+        return LocalCursor(self._conn.cursor(), dictionary)
+
+    def ping(self, reconnect=False):
+        self._conn.execute('SELECT 1')
+
+    def is_connected(self):
+        try:
+            self.ping()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def close(self):
+        self._conn.close()
+
+
+# 로컬 DB 파일이 없으면 덤프에서 생성한 뒤 연결
+# (헬스 확인과 풀 스레드가 동시에 연결해도 build_local_database 의 파일 잠금으로 한 번만 생성)
+def connect_local(path=None):
+    path = path or DEFAULT_LOCAL_DB_PATH
+    if not os.path.exists(path):
+        build_local_database(path, if_missing=True)
+    return LocalConnection(path)
+
+
+# ---------------------------------------------------------------------------
+# mysqldump 적재
+# ---------------------------------------------------------------------------
+
+CREATE_TABLE_PATTERN = re.compile(r'CREATE TABLE `(\w+)` \((.*?)\n\)[^;]*;', re.DOTALL)
+COLUMN_PATTERN = re.compile(r'^\s*`(\w+)`\s+(\w+)')
+PRIMARY_KEY_PATTERN = re.compile(r'^\s*PRIMARY KEY \(([^)]*)\)')
+INDEX_PATTERN = re.compile(r'^\s*(UNIQUE )?KEY `(\w+)` \(([^)]*)\)')
+INSERT_PATTERN = re.compile(r'^INSERT INTO `(\w+)` VALUES (.*);\s*$', re.MULTILINE)
+VALUE_TOKEN_PATTERN = re.compile(
+    r"'((?:[^'\\]|\\.|'')*)'|(NULL)|([-+]?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)|([(),])"
+)
+MYSQL_ESCAPES = {'0': '\0', 'b': '\b', 'n': '\n', 'r': '\r', 't': '\t', 'Z': '\x1a'}
+
+TYPE_MAP = {
+    'int': 'INTEGER', 'tinyint': 'INTEGER', 'smallint': 'INTEGER', 'mediumint': 'INTEGER', 'bigint': 'INTEGER',
+    'float': 'REAL', 'double': 'REAL', 'decimal': 'REAL',
+    'date': 'DATE', 'datetime': 'TIMESTAMP', 'timestamp': 'TIMESTAMP',
+}
+
+
+def is_mysql_dump(text):
+    return text.lstrip().startswith('-- MySQL dump') or '-- MySQL dump' in text[:500]
+
+
+def _unescape(value):
+    return re.sub(r"\\(.)", lambda m: MYSQL_ESCAPES.get(m.group(1), m.group(1)), value).replace("''", "'")
+
+
+# CREATE TABLE 문을 SQLite DDL 로 변환 (엔진/문자셋/외래키 제약은 제외)
+def convert_create_table(name, body):
+    columns = []
+    primary_key = None
+    indexes = []
+    for line in body.splitlines():
+        line = line.rstrip(',')
+        column = COLUMN_PATTERN.match(line)
+        if column:
+            columns.append(f'"{column.group(1)}" {TYPE_MAP.get(column.group(2).lower(), "TEXT")}')
+            continue
+        pk = PRIMARY_KEY_PATTERN.match(line)
+        if pk:
+            primary_key = pk.group(1).replace('`', '"')
+            continue
+        index = INDEX_PATTERN.match(line)
+        if index:
+            unique = 'UNIQUE ' if index.group(1) else ''
+            indexes.append(
+                f'CREATE {unique}INDEX IF NOT EXISTS "{name}_{index.group(2)}" '
+                f'ON "{name}" ({index.group(3).replace("`", chr(34))})'
+            )
+    if primary_key:
+        columns.append(f'PRIMARY KEY ({primary_key})')
+    ddl = f'CREATE TABLE "{name}" (\n    ' + ',\n    '.join(columns) + '\n)'
+    return ddl, indexes
+
+
+# INSERT ... VALUES (...),(...) 의 값 목록을 행 튜플로 변환
+def parse_insert_values(values_sql):
+    rows = []
+    row = None
+    for match in VALUE_TOKEN_PATTERN.finditer(values_sql):
+        string, null, number, punct = match.groups()
+        if punct == '(':
+            row = []
+        elif punct == ')':
+            rows.append(tuple(row))
+            row = None
+        elif punct == ',':
+            continue
+        elif null:
+            row.append(None)
+        elif number is not None:
+            row.append(float(number) if any(c in number for c in '.eE') else int(number))
+        else:
+            row.append(_unescape(string))
+    return rows
+
+
+def load_dump(conn, path):
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    if not is_mysql_dump(text):
+        return []
+
+    loaded = []
+    for match in CREATE_TABLE_PATTERN.finditer(text):
+        name = match.group(1)
+        ddl, indexes = convert_create_table(name, match.group(2))
+        conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+        conn.execute(ddl)
+        for index in indexes:
+            conn.execute(index)
+        loaded.append(name)
+
+    for match in INSERT_PATTERN.finditer(text):
+        name = match.group(1)
+        rows = parse_insert_values(match.group(2))
+        if rows:
+            placeholders = ', '.join('?' * len(rows[0]))
+            conn.executemany(f'INSERT INTO "{name}" VALUES ({placeholders})', rows)
+    return loaded
+
+
+# used_car_data.json (크롤링 원본)으로 used_car_table 채우기 (덤프가 비어 있는 경우)
+def load_used_car_json(conn, path):
+    count = conn.execute('SELECT COUNT(*) FROM used_car_table').fetchone()[0]
+    if count:
+        return 0
+    with open(path, encoding='utf-8') as f:
+        cars = json.load(f)
+    brands = {
+        name.replace(' ', '').lower(): brand_num
+        for brand_num, name in conn.execute('SELECT brand_num, car_brand FROM car_brands')
+    }
+    rows = [
+        (
+            int(key.split('_')[-1]),
+            car['car_name'], car['car_year'], car['car_km'], car['car_price'], car['car_cate'], car['car_brand'],
+            brands.get(car['car_brand'].replace(' ', '').lower()),
+        )
+        for key, car in cars.items()
+    ]
+    conn.executemany('INSERT INTO used_car_table VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+    return len(rows)
+
+
+# path.lock 파일에 대한 프로세스 간 배타 잠금 (같은 프로세스의 다른 스레드도 기다림)
+@contextlib.contextmanager
+def _file_lock(path):
+    with open(f"{path}.lock", 'a+b') as f:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+# 덤프에서 로컬 DB 생성 - 같은 디렉터리의 임시 파일에 만든 뒤 os.replace 로 교체하므로
+# 다른 연결은 생성 중인 파일을 보지 않고, 기존 파일을 열어 둔 연결은 교체 전 내용을 계속 읽음
+# if_missing=True 이면 잠금을 얻은 뒤 다시 확인하여 다른 스레드/프로세스가 이미 만들었으면 그대로 둠
+def build_local_database(path=None, base_dir=BASE_DIR, if_missing=False):
+    path = path or DEFAULT_LOCAL_DB_PATH
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    with _file_lock(path):
+        if if_missing and os.path.exists(path):
+            return path
+        fd, temp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix='.tmp', dir=directory)
+        os.close(fd)
+        try:
+            conn = sqlite3.connect(temp_path)
+            try:
+                tables = []
+                for pattern in DUMP_PATTERNS:
+                    for dump_path in sorted(glob.glob(os.path.join(base_dir, pattern))):
+                        tables.extend(load_dump(conn, dump_path))
+                conn.executescript(BASE_SCHEMA)
+                json_path = os.path.join(base_dir, USED_CAR_JSON)
+                if 'used_car_table' in tables and os.path.exists(json_path):
+                    load_used_car_json(conn, json_path)
+                conn.commit()
+            finally:
+                conn.close()
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='저장소의 SQL 덤프로 로컬 SQLite DB 생성')
+    parser.add_argument('--path', default=DEFAULT_LOCAL_DB_PATH, help='생성할 SQLite 파일 경로')
+    parser.add_argument('--rebuild', action='store_true', help='이미 있어도 다시 생성')
+    args = parser.parse_args()
+
+    if args.rebuild or not os.path.exists(args.path):
+        build_local_database(args.path)
+
+    conn = sqlite3.connect(args.path)
+    try:
+        for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name"):
+            count = conn.execute(f'SELECT COUNT(*) FROM "{name}"').fetchone()[0]
+            print(f"{name:30} {count:>10,}")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+from database.db_connector import db
+
+
+# 테이블별 기본 조회 기능
+class BaseModel:
+    table_name = None
+    order_by = 'id'
+
+    # cached=True 이면 공유 결과 캐시 사용 (기준 정보 테이블 조회용)
+    @classmethod
+    def get_all(cls, cached=False):
+        query = f"SELECT * FROM {cls.table_name} ORDER BY {cls.order_by}"
+        return db.execute_query(query, label=f"{cls.__name__}.get_all", cached=cached)
+
+    @classmethod
+    def get_by_id(cls, record_id):
+        query = f"SELECT * FROM {cls.table_name} WHERE id = %s"
+        rows = db.execute_query(query, (record_id,))
+        return rows[0] if rows else None
+
+
+class Region(BaseModel):
+    table_name = 'regions'
+
+
+class CarType(BaseModel):
+    table_name = 'car_types'
+
+
+class Manufacturer(BaseModel):
+    table_name = 'manufacturers'
+
+
+class CarModel(BaseModel):
+    table_name = 'car_models'
+
+    @classmethod
+    def get_by_manufacturer(cls, manufacturer_id):
+        query = f"SELECT * FROM {cls.table_name} WHERE manufacturer_id = %s ORDER BY id"
+        return db.execute_query(query, (manufacturer_id,))
+
+
+class CarRegistration(BaseModel):
+    table_name = 'car_registration'
+    order_by = 'registration_date'
+
+
+class Industry(BaseModel):
+    table_name = 'industries'
+
+
+class Company(BaseModel):
+    table_name = 'companies'
+
+
+class FAQCategory(BaseModel):
+    table_name = 'faq_categories'
+
+
+class CompanyFAQ(BaseModel):
+    table_name = 'company_faqs'
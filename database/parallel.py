@@ -0,0 +1,34 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+# 작업 하나를 실행하고 소요 시간(초)을 함께 반환
+def _timed_call(func, kwargs):
+    started = time.perf_counter()
+    result = func(**kwargs)
+    return result, time.perf_counter() - started
+
+
+# 서로 독립적인 조회를 스레드 풀에서 동시에 실행 (전체 지연 시간 = 가장 느린 조회)
+# tasks: {이름: (함수, kwargs)}
+# 반환: ({이름: 결과}, {이름: 소요 시간}) - 실패한 작업이 있으면 모든 작업이 끝난 뒤 첫 예외를 다시 발생
+def run_concurrently(tasks, max_workers=None, initializer=None):
+    if not tasks:
+        return {}, {}
+    max_workers = max_workers or len(tasks)
+    results = {}
+    timings = {}
+    first_error = None
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks)), initializer=initializer) as executor:
+        futures = {
+            name: executor.submit(_timed_call, func, kwargs)
+            for name, (func, kwargs) in tasks.items()
+        }
+        for name, future in futures.items():
+            try:
+                results[name], timings[name] = future.result()
+            except Exception as e:
+                first_error = first_error or e
+    if first_error:
+        raise first_error
+    return results, timings
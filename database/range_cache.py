@@ -0,0 +1,103 @@
+import os
+from datetime import date, datetime
+
+import pandas as pd
+
+from database.cache import result_cache
+
+# 아직 데이터가 들어오는 월(이번 달 이후)은 짧게만 보관
+OPEN_MONTH_TTL = int(os.getenv('RANGE_CACHE_OPEN_MONTH_TTL', '60'))
+
+
+def to_date(value):
+    return value.date() if isinstance(value, datetime) else value
+
+
+def next_month(month):
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+# offset 개월 이동한 월의 시작일 (음수면 이전 달)
+def shift_month(month, offset):
+    index = month.year * 12 + month.month - 1 + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+
+# 기간 [start_date, end_date] 에 걸치는 달력 월의 시작일 목록
+def month_starts(start_date, end_date):
+    month = to_date(start_date).replace(day=1)
+    end_date = to_date(end_date)
+    months = []
+    while month <= end_date:
+        months.append(month)
+        month = next_month(month)
+    return months
+
+
+# 월 목록을 연속 구간으로 묶어 날짜 범위 조건 생성 -> (조건문, 파라미터)
+def month_range_clause(column, months):
+    ranges = []
+    for month in sorted(months):
+        if ranges and ranges[-1][1] == month:
+            ranges[-1][1] = next_month(month)
+        else:
+            ranges.append([month, next_month(month)])
+    clauses = [f"({column} >= %s AND {column} < %s)" for _ in ranges]
+    params = tuple(value.strftime('%Y-%m-%d') for start, end in ranges for value in (start, end))
+    return "(" + " OR ".join(clauses) + ")", params
+
+
+# 월 구간별로 나누어 캐시 (기간을 옮기거나 넓히면 새로 걸친 월만 조회)
+class MonthSegmentCache:
+    def __init__(self, cache=result_cache, open_month_ttl=OPEN_MONTH_TTL):
+        self.cache = cache
+        self.open_month_ttl = open_month_ttl
+
+    # namespace: 쿼리 종류와 날짜 외 조건, fetch(빠진 월 목록) -> period_column 을 가진 DataFrame (1회 조회)
+    # tables: fetch 가 읽는 테이블 (그 테이블이 갱신되면 구간 캐시도 비워짐)
+    # 반환: months 순서의 월별 DataFrame 목록
+    def load(self, namespace, months, fetch, label, period_column='period', tables=()):
+        segments = {}
+        missing = []
+        for month in months:
+            segment = self.cache.get(('month_segment',) + tuple(namespace) + (month,), label)
+            if segment is None:
+                missing.append(month)
+            else:
+                segments[month] = segment
+
+        if missing:
+            fetched = fetch(missing)
+            periods = pd.to_datetime(fetched[period_column]).dt.to_period('M')
+            this_month = date.today().replace(day=1)
+            for month in missing:
+                segment = fetched[(periods == pd.Period(month, 'M')).to_numpy()].reset_index(drop=True)
+                self.cache.put(
+                    ('month_segment',) + tuple(namespace) + (month,),
+                    segment,
+                    int(segment.memory_usage(index=True, deep=True).sum()),
+                    label,
+                    ttl=self.open_month_ttl if month >= this_month else None,
+                    tables=tables,
+                )
+                segments[month] = segment
+
+        return [segments[month] for month in months]
+
+
+# 월별 DataFrame 을 하나로 합침 (월마다 범주가 달라 풀린 Categorical 컬럼은 다시 범주형으로)
+def concat_segments(segments):
+    categorical = {
+        column
+        for segment in segments
+        for column in segment.columns
+        if isinstance(segment[column].dtype, pd.CategoricalDtype)
+    }
+    df = pd.concat(segments, ignore_index=True)
+    for column in categorical:
+        if not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('category')
+    return df
+
+
+month_segment_cache = MonthSegmentCache()
@@ -0,0 +1,64 @@
+"""
+연도별 상위 N 개 제조사 점유율 추이 (02 페이지 load_manufacturer_share_trend)
+
+연도별 합계와 순위를 groupby transform/rank 로 한 번에 계산하므로 연도마다 프레임을 거르고 정렬하지 않는다.
+같은 계산을 DB 에서 하는 윈도 함수 쿼리(SHARE_TREND_QUERY, ROW_NUMBER() OVER (PARTITION BY year ...))도 제공한다.
+연도마다 정확히 N 개를 고르며, 등록 대수가 같으면 제조사 이름 순으로 앞선 쪽을 골라 결과가 실행마다 같다.
+
+사용법:
+    python benchmarks/bench_top_n.py     # 20년 × 500개 제조사 기준 기존 반복문 / pandas / SQL 비교
+"""
+from database.rollup import ROLLUP_TABLE
+
+
+# df(year, manufacturer, total_count) -> 연도별 상위 top_n 에 한 번이라도 든 제조사의 전체 연도 점유율
+# 결과 컬럼: year, manufacturer, total_count, yearly_total, share (연도 오름차순, 등록 대수 내림차순, 제조사 이름순)
+def manufacturer_share_trend(df, top_n=5):
+    df = df.sort_values(['year', 'total_count', 'manufacturer'], ascending=[True, False, True], ignore_index=True)
+    by_year = df.groupby('year', sort=False)['total_count']
+    df['yearly_total'] = by_year.transform('sum')
+    df['share'] = df['total_count'] / df['yearly_total'] * 100
+
+    # 정렬된 순서대로 순위를 매기므로 동률은 제조사 이름순으로 나뉨 (연도마다 top_n 개)
+    ranks = by_year.rank(method='first', ascending=False)
+    top_manufacturers = df.loc[(ranks <= top_n).to_numpy(), 'manufacturer'].unique()
+    return df[df['manufacturer'].isin(top_manufacturers).to_numpy()].reset_index(drop=True)
+
+
+# 같은 결과를 DB 에서 계산하는 쿼리 (파라미터: top_n) - 윈도 함수 지원 필요 (MySQL 8.0+, SQLite 3.25+)
+SHARE_TREND_QUERY = f"""
+    WITH yearly AS (
+        SELECT
+            YEAR(ru.month) AS year,
+            m.name AS manufacturer,
+            SUM(ru.total_count) AS total_count
+        FROM
+            {ROLLUP_TABLE} ru
+        JOIN
+            manufacturers m ON ru.manufacturer_id = m.id
+        GROUP BY
+            YEAR(ru.month), m.name
+    ),
+    ranked AS (
+        SELECT
+            year,
+            manufacturer,
+            total_count,
+            SUM(total_count) OVER (PARTITION BY year) AS yearly_total,
+            ROW_NUMBER() OVER (PARTITION BY year ORDER BY total_count DESC, manufacturer) AS year_rank
+        FROM
+            yearly
+    )
+    SELECT
+        year,
+        manufacturer,
+        total_count,
+        yearly_total,
+        total_count * 100.0 / yearly_total AS share
+    FROM
+        ranked
+    WHERE
+        manufacturer IN (SELECT manufacturer FROM ranked WHERE year_rank <= %s)
+    ORDER BY
+        year, total_count DESC, manufacturer
+"""
@@ -0,0 +1,543 @@
+"""
+월 × 지역 × 차종 × 제조사 단위로 미리 집계한 등록 현황 테이블 (registration_rollup)
+
+car_registration 의 id 를 기준으로 마지막으로 반영한 위치(rollup_state.last_id)를 기억하고,
+새로 들어온 행만 집계하여 기존 값에 더한다. 통계 조회는 기간 안의 온전한 월은 rollup 에서,
+기간 양 끝의 일부 월만 원본 테이블에서 읽으므로 비용이 원본 행 수가 아닌 그룹 수에 비례한다.
+월 단위 결과는 월 구간 캐시(database.range_cache)에 보관되어 기간을 옮기면 새로 걸친 월만 조회한다.
+
+월별 추이는 달력 월 × 지역 × 차종 단위의 월별 시계열(registration_monthly)로 따로 보관한다.
+rollup 과 같은 last_id 구간의 새 행을 같은 트랜잭션에서 더하므로, 지난 달 날짜로 뒤늦게 들어온 행도 그 달에 반영되고
+추이 조회는 원본 테이블을 읽지 않는다.
+
+통계 분석(02 페이지)은 rollup 전체를 한 번 읽어 연도 × 월 × 지역 × 차종 × 제조사 × 국가 단위의 기본 집계
+(load_registration_base)로 만들어 결과 캐시에 두고, 모든 분석(월별 추이 포함)은 이 프레임을 pandas 로 다시 묶어 계산한다.
+캐시가 만료되거나 rollup 갱신으로 비워질 때만 다시 읽으며, rollup 이 없으면 같은 단위로 원본 테이블을 그룹 조회한다.
+
+테이블 생성은 아래 명령으로 한다. 갱신은 페이지가 읽을 때 자동으로 한다(rollup_available):
+STATE_CHECK_INTERVAL 마다 car_registration 의 MAX(id) 와 rollup_state.last_id 를 비교하여 뒤처져 있으면 새 행만 반영하고,
+다른 프로세스가 먼저 반영해 last_id 가 바뀐 것을 보면 이 프로세스의 결과 캐시에서 집계 테이블을 읽은 결과를 비운다.
+DB 계정에 쓰기 권한이 없으면 ROLLUP_AUTO_REFRESH=0 으로 끄고 아래 명령을 cron 등 주기 작업으로 실행한다
+(이때 페이지는 반영되지 않은 행이 있으면 경고를 표시 - rollup_pending_rows).
+여러 프로세스가 동시에 갱신해도 rollup_state.last_id 를 비교 후 교체(compare-and-set)하므로 같은 구간이 두 번 더해지지 않는다.
+
+사용법:
+    python -m database.rollup            # 테이블이 없으면 생성, 새로 들어온 행을 rollup 과 월별 시계열에 반영
+    python -m database.rollup --rebuild  # 전체 다시 집계 (기존 행 수정/삭제 후)
+"""
+import os
+import time
+import argparse
+import threading
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from database.db_connector import db
+from database.local_backend import LocalConnection
+from database.cache import make_cache_key, referenced_tables
+from database.dtypes import frame_nbytes
+from database.dimensions import dimension_cache
+from database.filters import normalize_ids, append_id_filters
+from database.range_cache import (
+    month_segment_cache, month_starts, month_range_clause, next_month, shift_month, to_date, concat_segments
+)
+
+ROLLUP_TABLE = 'registration_rollup'
+ROLLUP_NAME = 'registration_rollup'
+MONTHLY_TABLE = 'registration_monthly'
+
+# 이 간격(초) 안에는 rollup 존재 여부와 반영 위치를 다시 확인하지 않음 (검색 1회에 여러 로더가 동시에 호출)
+STATE_CHECK_INTERVAL = int(os.getenv('ROLLUP_STATE_CHECK_INTERVAL', '10'))
+# 읽을 때 뒤처진 행을 자동으로 반영할지 여부 (0: 읽기 전용 - 주기 작업으로 갱신)
+AUTO_REFRESH = os.getenv('ROLLUP_AUTO_REFRESH', '1') != '0'
+
+CREATE_ROLLUP_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS {ROLLUP_TABLE} (
+        month DATE NOT NULL,
+        region_id INT NOT NULL,
+        car_type_id INT NOT NULL,
+        manufacturer_id INT NOT NULL,
+        total_count BIGINT NOT NULL,
+        row_count INT NOT NULL,
+        PRIMARY KEY (month, region_id, car_type_id, manufacturer_id)
+    )
+"""
+
+CREATE_STATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS rollup_state (
+        name VARCHAR(64) NOT NULL PRIMARY KEY,
+        last_id BIGINT NOT NULL
+    )
+"""
+
+CREATE_MONTHLY_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS {MONTHLY_TABLE} (
+        month DATE NOT NULL,
+        region_id INT NOT NULL,
+        car_type_id INT NOT NULL,
+        total_count BIGINT NOT NULL,
+        row_count INT NOT NULL,
+        PRIMARY KEY (month, region_id, car_type_id)
+    )
+"""
+
+# 모델 정보가 없는 등록 건도 지역/차종 합계에는 포함되도록 제조사 0 으로 집계
+DELTA_SELECT = f"""
+    SELECT
+        DATE_FORMAT(cr.registration_date, '%Y-%m-01') AS month,
+        cr.region_id,
+        cr.car_type_id,
+        COALESCE(cm.manufacturer_id, 0) AS manufacturer_id,
+        SUM(cr.registration_count) AS total_count,
+        COUNT(*) AS row_count
+    FROM
+        car_registration cr
+    LEFT JOIN
+        car_models cm ON cr.car_model_id = cm.id
+    WHERE
+        cr.id > %s AND cr.id <= %s
+    GROUP BY
+        DATE_FORMAT(cr.registration_date, '%Y-%m-01'), cr.region_id, cr.car_type_id, COALESCE(cm.manufacturer_id, 0)
+"""
+
+ROLLUP_COLUMNS = "month, region_id, car_type_id, manufacturer_id, total_count, row_count"
+
+# 같은 id 구간을 월 × 지역 × 차종 으로 집계 (월별 시계열)
+MONTHLY_DELTA_SELECT = """
+    SELECT
+        DATE_FORMAT(registration_date, '%Y-%m-01') AS month,
+        region_id,
+        car_type_id,
+        SUM(registration_count) AS total_count,
+        COUNT(*) AS row_count
+    FROM
+        car_registration
+    WHERE
+        id > %s AND id <= %s
+    GROUP BY
+        DATE_FORMAT(registration_date, '%Y-%m-01'), region_id, car_type_id
+"""
+
+MONTHLY_COLUMNS = "month, region_id, car_type_id, total_count, row_count"
+
+# 백엔드별 상태 행 추가 구문 (이미 있으면 그대로 둠)
+INSERT_STATE = {
+    'mysql': "INSERT IGNORE INTO rollup_state (name, last_id) VALUES (%s, 0)",
+    'sqlite': "INSERT OR IGNORE INTO rollup_state (name, last_id) VALUES (%s, 0)",
+}
+
+# 백엔드별 upsert 구문 (같은 그룹이 이미 있으면 값을 더함, {keys}: 기본 키 컬럼)
+UPSERT_CLAUSES = {
+    'mysql': """
+        ON DUPLICATE KEY UPDATE
+            total_count = total_count + VALUES(total_count),
+            row_count = row_count + VALUES(row_count)
+    """,
+    'sqlite': """
+        ON CONFLICT ({keys}) DO UPDATE SET
+            total_count = total_count + excluded.total_count,
+            row_count = row_count + excluded.row_count
+    """,
+}
+
+# 테이블별 (컬럼, 집계 쿼리, 기본 키) - 같은 id 구간을 함께 반영
+DELTA_TARGETS = [
+    (ROLLUP_TABLE, ROLLUP_COLUMNS, DELTA_SELECT, "month, region_id, car_type_id, manufacturer_id"),
+    (MONTHLY_TABLE, MONTHLY_COLUMNS, MONTHLY_DELTA_SELECT, "month, region_id, car_type_id"),
+]
+
+# rollup 반영 위치와 원본 테이블의 마지막 id (MAX(id) 는 기본 키 끝만 읽음)
+STATE_QUERY = """
+    SELECT rs.last_id, (SELECT MAX(id) FROM car_registration) AS max_id
+    FROM rollup_state rs
+    WHERE rs.name = %s
+"""
+
+# 갱신 시 결과 캐시에서 비울 집계 테이블
+ROLLUP_TABLES = {ROLLUP_TABLE, MONTHLY_TABLE}
+
+# 집계 기준별 (rollup 컬럼, 원본 컬럼, 이름 테이블, 결과 컬럼명)
+GROUPINGS = {
+    'region': ('ru.region_id', 'cr.region_id', 'regions', 'region_name'),
+    'car_type': ('ru.car_type_id', 'cr.car_type_id', 'car_types', 'car_type'),
+    'manufacturer': ('ru.manufacturer_id', 'cm.manufacturer_id', 'manufacturers', 'manufacturer_name'),
+}
+
+_state_lock = threading.Lock()
+_state_checked_at = 0.0
+_state_available = False
+_state_last_id = None
+_state_pending = 0
+
+
+def _backend(conn=None):
+    if conn is not None:
+        return 'sqlite' if isinstance(conn, LocalConnection) else 'mysql'
+    return 'sqlite' if db.config.get('backend') == 'sqlite' else 'mysql'
+
+
+# conn 을 주면 그 커넥션에서 바로 실행 (합성 데이터 적재 등 페이지 밖의 작업), 없으면 공유 커넥터 경유
+def _run_transaction(handler, label, conn=None):
+    if conn is None:
+        return db.execute_transaction(handler, label=label)
+    result, _ = handler(conn)
+    conn.commit()
+    return result
+
+
+def _fetch_scalar(cursor, query, params=()):
+    cursor.execute(query, params)
+    row = cursor.fetchone()
+    cursor.fetchall()
+    return row[0] if row else None
+
+
+# rollup / 상태 / 월별 시계열 테이블 생성 (마이그레이션 - 이미 있으면 그대로 둠)
+def create_rollup_tables(conn=None):
+    def handler(conn):
+        cursor = conn.cursor()
+        try:
+            for statement in (CREATE_ROLLUP_TABLE, CREATE_STATE_TABLE, CREATE_MONTHLY_TABLE):
+                cursor.execute(statement)
+            cursor.execute(INSERT_STATE[_backend(conn)], (ROLLUP_NAME,))
+            return None, 0
+        finally:
+            cursor.close()
+
+    _run_transaction(handler, 'create_rollup_tables', conn)
+
+
+# 마지막 반영 이후 추가된 car_registration 행을 rollup 과 월별 시계열에 더함 (등록일과 관계없이 id 구간 기준)
+# 갱신한 rollup 행 수(cursor.rowcount - MySQL 은 기존 행 갱신을 2로 셈)를 반환하고, 반영할 행이 없으면 0
+# last_id 를 읽은 값과 같을 때만 새 상한으로 바꾸고(compare-and-set) 바꾼 경우에만 집계를 더하므로,
+# 다른 프로세스가 같은 구간을 먼저 반영했으면 아무것도 하지 않음
+def refresh_rollup(rebuild=False, conn=None):
+    def handler(conn):
+        cursor = conn.cursor()
+        try:
+            last_id = _fetch_scalar(cursor, "SELECT last_id FROM rollup_state WHERE name = %s", (ROLLUP_NAME,))
+            if last_id is None:
+                raise RuntimeError("rollup_state 가 없습니다 - python -m database.rollup 으로 먼저 생성하세요")
+            # 집계 도중 들어오는 행은 다음 반영 때 처리되도록 상한을 먼저 고정
+            max_id = _fetch_scalar(cursor, "SELECT MAX(id) FROM car_registration") or 0
+            if rebuild:
+                cursor.execute("UPDATE rollup_state SET last_id = %s WHERE name = %s", (max_id, ROLLUP_NAME))
+                for table, *_ in DELTA_TARGETS:
+                    cursor.execute(f"DELETE FROM {table}")
+                last_id = 0
+            else:
+                if max_id <= last_id:
+                    return 0, 0
+                cursor.execute(
+                    "UPDATE rollup_state SET last_id = %s WHERE name = %s AND last_id = %s", (max_id, ROLLUP_NAME, last_id)
+                )
+                if cursor.rowcount != 1:
+                    return 0, 0
+            applied = 0
+            for table, columns, delta_select, keys in DELTA_TARGETS:
+                upsert_clause = UPSERT_CLAUSES[_backend(conn)].format(keys=keys)
+                cursor.execute(f"INSERT INTO {table} ({columns}) {delta_select} {upsert_clause}", (last_id, max_id))
+                if table == ROLLUP_TABLE:
+                    applied = max(cursor.rowcount, 0)
+            return applied, applied
+        finally:
+            cursor.close()
+
+    applied = _run_transaction(handler, 'refresh_rollup', conn)
+    if applied or rebuild:
+        # 집계 결과가 바뀌었으므로 rollup / 월별 시계열을 읽은 조회 결과만 정리
+        db.cache.invalidate(ROLLUP_TABLES)
+    return applied
+
+
+# rollup 반영 위치 확인 -> (last_id, car_registration 의 MAX(id)), rollup 이 없으면 None
+def _read_state():
+    rows = db.execute_query(STATE_QUERY, (ROLLUP_NAME,), label='rollup_state')
+    if not rows:
+        return None
+    return int(rows[0]['last_id']), int(rows[0]['max_id'] or 0)
+
+
+# rollup 이 만들어져 있는지 확인하고 뒤처져 있으면 새 행을 반영 (STATE_CHECK_INTERVAL 동안 결과 재사용)
+# 반영은 refresh_rollup 의 compare-and-set 이라 여러 프로세스가 동시에 확인해도 한 번만 더해지며,
+# 다른 프로세스가 반영한 경우에도 last_id 가 바뀐 것을 보고 이 프로세스의 캐시된 집계 결과를 비움
+# AUTO_REFRESH 가 꺼져 있거나 반영에 실패하면(쓰기 권한 없음 등) 반영되지 않은 행 수만 기록 (rollup_pending_rows)
+def rollup_available():
+    global _state_checked_at, _state_available, _state_last_id, _state_pending
+    with _state_lock:
+        if time.monotonic() - _state_checked_at < STATE_CHECK_INTERVAL:
+            return _state_available
+        try:
+            state = _read_state()
+            if state is not None and AUTO_REFRESH and state[1] > state[0]:
+                try:
+                    # 명령(main)과 같은 순서 - 새로 추가된 집계 테이블이 있으면 먼저 만듦
+                    create_rollup_tables()
+                    refresh_rollup()
+                except Exception:
+                    # 실패는 쿼리 기록(refresh_rollup)에 남고, 페이지에는 반영되지 않은 행 수로 경고
+                    pass
+                state = _read_state()
+        except Exception:
+            state = None
+        _state_available = state is not None
+        if state is not None:
+            last_id, max_id = state
+            if _state_last_id is not None and last_id != _state_last_id:
+                db.cache.invalidate(ROLLUP_TABLES)
+            _state_last_id, _state_pending = last_id, max(max_id - last_id, 0)
+        _state_checked_at = time.monotonic()
+        return _state_available
+
+
+# 마지막 확인 시점에 rollup 에 반영되지 않은 car_registration 행 수 (id 기준, 자동 갱신이 꺼져 있거나 실패한 경우)
+def rollup_pending_rows():
+    return _state_pending
+
+
+# 월 구간 조회 쿼리 - kind 'full' 은 온전히 포함된 월(rollup), 'daily' 는 일부만 포함된 월(원본, 일 단위)
+# 결과 컬럼: period(월 시작일 또는 등록일), 이름 컬럼, total_count
+def build_segment_query(group_by, kind, months, region_ids=None, car_type_ids=None):
+    rollup_key, raw_key, name_table, output_column = GROUPINGS[group_by]
+    if kind == 'full':
+        alias, period, source, key, count_column, join_clause = (
+            'ru', 'ru.month', f"{ROLLUP_TABLE} ru", rollup_key, 'ru.total_count', ""
+        )
+    else:
+        alias, period, source, key, count_column = (
+            'cr', 'cr.registration_date', "car_registration cr", raw_key, 'cr.registration_count'
+        )
+        join_clause = "JOIN car_models cm ON cr.car_model_id = cm.id" if group_by == 'manufacturer' else ""
+
+    range_clause, params = month_range_clause(period, months)
+    clauses = [range_clause]
+    params = list(params)
+    append_id_filters(clauses, params, [(f"{alias}.region_id", region_ids), (f"{alias}.car_type_id", car_type_ids)])
+    where_clause = " AND ".join(clauses)
+
+    query = f"""
+        SELECT {period} AS period, g.name AS {output_column}, SUM({count_column}) AS total_count
+        FROM {source}
+        {join_clause}
+        JOIN {name_table} g ON {key} = g.id
+        WHERE {where_clause}
+        GROUP BY {period}, g.name
+    """
+    return query, tuple(params)
+
+
+# 기간별 통계 - 월마다 캐시된 구간을 모아 기간에 맞게 자른 뒤 합산 (빠진 월만 조회)
+# 결과는 (이름, total_count) 내림차순
+# region_ids/car_type_ids: 하나 또는 여러 id (IN 조건 하나로 조회)
+def load_rollup_stats(group_by, region_ids=None, car_type_ids=None, start_date=None, end_date=None, label=None):
+    output_column = GROUPINGS[group_by][3]
+    label = label or f"rollup_{group_by}"
+    region_ids, car_type_ids = normalize_ids(region_ids), normalize_ids(car_type_ids)
+    start_date, end_date = to_date(start_date), to_date(end_date)
+
+    months = month_starts(start_date, end_date)
+    full_months = [m for m in months if m >= start_date and next_month(m) <= date.fromordinal(end_date.toordinal() + 1)]
+    partial_months = [m for m in months if m not in full_months]
+
+    segments = []
+    for kind, kind_months in (('full', full_months), ('daily', partial_months)):
+        if not kind_months:
+            continue
+
+        def fetch(missing, kind=kind):
+            query, params = build_segment_query(group_by, kind, missing, region_ids, car_type_ids)
+            return db.query_to_dataframe(query, params, label=label, columnar=True)
+
+        namespace = (label, group_by, kind, region_ids, car_type_ids)
+        tables = referenced_tables(build_segment_query(group_by, kind, kind_months, region_ids, car_type_ids)[0])
+        segments.extend(month_segment_cache.load(namespace, kind_months, fetch, label, tables=tables))
+
+    df = concat_segments(segments) if segments else pd.DataFrame(columns=['period', 'total_count'])
+    if df.empty:
+        return pd.DataFrame(columns=[output_column, 'total_count'])
+
+    periods = pd.to_datetime(df['period'])
+    in_range = (periods >= pd.Timestamp(start_date)) & (periods <= pd.Timestamp(end_date))
+    counts = df.loc[in_range, 'total_count'].astype('int64')
+
+    result = counts.groupby(df.loc[in_range, output_column], observed=True).sum().sort_values(ascending=False)
+    return result.reset_index()
+
+
+# 이번 달까지 최근 months 개 달력 월의 등록 대수 -> (month 'YYYY-MM', total_count), 등록이 없는 월은 0
+# split_by('region'/'car_type') 를 주면 같은 쿼리에서 그 기준으로도 나누어 (month, 이름 컬럼, total_count) 반환
+# 지난 달은 월 구간 캐시에 보관하고(갱신 시 비워짐) 이번 달만 짧은 TTL 로 다시 조회
+def load_monthly_series(region_ids=None, car_type_ids=None, months=12, label='monthly_series', split_by=None):
+    this_month = date.today().replace(day=1)
+    month_list = month_starts(shift_month(this_month, 1 - months), this_month)
+    region_ids, car_type_ids = normalize_ids(region_ids), normalize_ids(car_type_ids)
+    split_column = f"{split_by}_id" if split_by else None
+
+    def fetch(missing):
+        range_clause, params = month_range_clause('month', missing)
+        clauses = [range_clause]
+        params = list(params)
+        append_id_filters(clauses, params, [("region_id", region_ids), ("car_type_id", car_type_ids)])
+        split_select = f"{split_column} AS split_id, " if split_column else ""
+        split_group = f", {split_column}" if split_column else ""
+        query = f"""
+            SELECT month AS period, {split_select}SUM(total_count) AS total_count
+            FROM {MONTHLY_TABLE}
+            WHERE {" AND ".join(clauses)}
+            GROUP BY month{split_group}
+        """
+        return db.query_to_dataframe(query, tuple(params), label=label, columnar=True)
+
+    namespace = ('monthly_series', region_ids, car_type_ids, split_by)
+    segments = month_segment_cache.load(namespace, month_list, fetch, label, tables=(MONTHLY_TABLE,))
+    df = concat_segments(segments)
+    periods = pd.to_datetime(df['period']).dt.to_period('M')
+    month_index = pd.PeriodIndex(month_list, freq='M')
+    counts = df['total_count'].astype('int64')
+
+    if not split_by:
+        counts = counts.groupby(periods).sum().reindex(month_index, fill_value=0)
+        return pd.DataFrame({'month': counts.index.strftime('%Y-%m'), 'total_count': counts.to_numpy()})
+
+    # 같은 결과를 메모리에서 월 × 기준 으로 펼친 뒤 다시 긴 형식으로 (등록이 없는 월은 0)
+    output_column = GROUPINGS[split_by][3]
+    dimension = dimension_cache.load()[split_by]
+    codes = dimension.codes(df['split_id'])
+    known = codes >= 0
+    names = pd.Categorical.from_codes(codes[known], categories=dimension.categories)
+    table = counts[known].groupby([periods[known], names], observed=True).sum().unstack(fill_value=0)
+    table = table.reindex(month_index, fill_value=0)
+    table.index = table.index.strftime('%Y-%m')
+    table = table.rename_axis(index='month', columns=output_column)
+    return table.stack().rename('total_count').reset_index()
+
+
+# 2차원 집계용 월 구간 조회 쿼리 - 이름 대신 id 만 반환 (행렬 위치는 dimension_cache 로 결정)
+# 결과 컬럼: period, row_id, column_id, total_count
+def build_matrix_segment_query(row_group, column_group, kind, months):
+    row_rollup, row_raw = GROUPINGS[row_group][:2]
+    column_rollup, column_raw = GROUPINGS[column_group][:2]
+    if kind == 'full':
+        period, source, row_key, column_key, count_column, join_clause = (
+            'ru.month', f"{ROLLUP_TABLE} ru", row_rollup, column_rollup, 'ru.total_count', ""
+        )
+    else:
+        period, source, row_key, column_key, count_column = (
+            'cr.registration_date', "car_registration cr", row_raw, column_raw, 'cr.registration_count'
+        )
+        join_clause = "JOIN car_models cm ON cr.car_model_id = cm.id" if 'manufacturer' in (row_group, column_group) else ""
+
+    range_clause, params = month_range_clause(period, months)
+    query = f"""
+        SELECT {period} AS period, {row_key} AS row_id, {column_key} AS column_id, SUM({count_column}) AS total_count
+        FROM {source}
+        {join_clause}
+        WHERE {range_clause}
+        GROUP BY {period}, {row_key}, {column_key}
+    """
+    return query, params
+
+
+# 기간별 행 기준 × 열 기준 등록 대수 행렬 -> (행 이름 목록, 열 이름 목록, int64 2차원 배열)
+# 기준별 한 번의 그룹 조회(월 구간 캐시 경유)로 전체 행렬을 만들고, 등록이 없는 칸은 0
+def load_rollup_matrix(row_group, column_group, start_date=None, end_date=None, label=None):
+    label = label or f"rollup_{row_group}_{column_group}"
+    start_date, end_date = to_date(start_date), to_date(end_date)
+
+    months = month_starts(start_date, end_date)
+    full_months = [m for m in months if m >= start_date and next_month(m) <= date.fromordinal(end_date.toordinal() + 1)]
+    partial_months = [m for m in months if m not in full_months]
+
+    segments = []
+    for kind, kind_months in (('full', full_months), ('daily', partial_months)):
+        if not kind_months:
+            continue
+
+        def fetch(missing, kind=kind):
+            query, params = build_matrix_segment_query(row_group, column_group, kind, missing)
+            return db.query_to_dataframe(query, params, label=label, columnar=True)
+
+        namespace = (label, row_group, column_group, kind)
+        tables = referenced_tables(build_matrix_segment_query(row_group, column_group, kind, kind_months)[0])
+        segments.extend(month_segment_cache.load(namespace, kind_months, fetch, label, tables=tables))
+
+    dimensions = dimension_cache.load()
+    rows, columns = dimensions[row_group], dimensions[column_group]
+    matrix = np.zeros((len(rows.categories), len(columns.categories)), dtype=np.int64)
+
+    df = concat_segments(segments) if segments else pd.DataFrame()
+    if not df.empty:
+        periods = pd.to_datetime(df['period'])
+        df = df[((periods >= pd.Timestamp(start_date)) & (periods <= pd.Timestamp(end_date))).to_numpy()]
+        row_codes, column_codes = rows.codes(df['row_id']), columns.codes(df['column_id'])
+        # 기준 정보에 없는 id 는 이름 조인과 같이 제외
+        known = (row_codes >= 0) & (column_codes >= 0)
+        np.add.at(matrix, (row_codes[known], column_codes[known]), df['total_count'].to_numpy(dtype=np.int64)[known])
+
+    return list(rows.categories), list(columns.categories), matrix
+
+
+# 통계 분석용 기본 집계 조회 - rollup 을 그대로 읽거나(BASE_QUERY), rollup 이 없으면 원본 테이블을 같은 단위로 그룹 조회
+# (BASE_RAW_QUERY - rollup 집계 쿼리와 같이 모델 정보가 없는 등록 건은 제조사 0)
+BASE_QUERY = f"SELECT month, region_id, car_type_id, manufacturer_id, total_count FROM {ROLLUP_TABLE}"
+BASE_RAW_QUERY = """
+    SELECT
+        DATE_FORMAT(cr.registration_date, '%Y-%m-01') AS month,
+        cr.region_id,
+        cr.car_type_id,
+        COALESCE(cm.manufacturer_id, 0) AS manufacturer_id,
+        SUM(cr.registration_count) AS total_count
+    FROM
+        car_registration cr
+    LEFT JOIN
+        car_models cm ON cr.car_model_id = cm.id
+    GROUP BY
+        DATE_FORMAT(cr.registration_date, '%Y-%m-01'), cr.region_id, cr.car_type_id, COALESCE(cm.manufacturer_id, 0)
+"""
+
+
+# 통계 분석용 기본 집계 -> year, month, region, car_type, manufacturer, country(범주형), total_count
+# 한 번 읽어 이름을 메모리에서 매핑하고 결과 캐시에 보관 (캐시가 만료되거나 갱신으로 비워지면 다시 읽음)
+# rollup 이 없으면(rollup_available) 원본 테이블 그룹 조회로 같은 프레임을 만듦 - 느리지만 결과는 같음
+# 기준 정보에 없는 id(모델 정보가 없는 등록 건의 제조사 등)는 NaN - 기준별 집계에서는 빠지고 전체 합계에는 포함
+# 호출마다 얕은 복사본을 반환하므로 컬럼을 추가/변경해도 캐시된 프레임에는 영향 없음
+def load_registration_base(label='load_registration_base'):
+    query = BASE_QUERY if rollup_available() else BASE_RAW_QUERY
+
+    def load():
+        df = db.query_to_dataframe(query, label=label, columnar=True)
+        dimensions = dimension_cache.load()
+        months = pd.to_datetime(df['month'])
+        base = pd.DataFrame({
+            'year': months.dt.year.to_numpy(dtype=np.int16),
+            'month': months.dt.month.to_numpy(dtype=np.int8),
+        })
+        for column, dimension, ids in (
+            ('region', 'region', df['region_id']),
+            ('car_type', 'car_type', df['car_type_id']),
+            ('manufacturer', 'manufacturer', df['manufacturer_id']),
+            ('country', 'country', df['manufacturer_id']),
+        ):
+            base[column] = pd.Categorical.from_codes(dimensions[dimension].codes(ids), categories=dimensions[dimension].categories)
+        base['total_count'] = df['total_count'].to_numpy(dtype=np.int64)
+        return base, frame_nbytes(base)
+
+    return db.cache.get_or_load(make_cache_key(query, None, 'base'), label, load, copy=lambda df: df.copy(deep=False))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='등록 현황 rollup / 월별 시계열 테이블 갱신')
+    parser.add_argument('--rebuild', action='store_true', help='rollup 과 월별 시계열을 비우고 전체 다시 집계')
+    args = parser.parse_args()
+
+    create_rollup_tables()
+
+    started = time.perf_counter()
+    applied = refresh_rollup(rebuild=args.rebuild)
+    print(f"rollup {applied:,}행 갱신, 월별 시계열 함께 반영 ({time.perf_counter() - started:.2f}초)")
+
+
+if __name__ == "__main__":
+    main()
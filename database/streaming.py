@@ -0,0 +1,76 @@
+import pandas as pd
+
+
+# iter_dataframes 가 돌려주는 DataFrame 청크를 전체 결과를 모으지 않고 처리하는 함수들
+
+# 청크별 합계를 누적
+def sum_chunks(chunks, column):
+    total = 0
+    rows = 0
+    for chunk in chunks:
+        total += int(chunk[column].sum())
+        rows += len(chunk)
+    return total, rows
+
+
+# 청크별 그룹 합계를 누적 (메모리는 그룹 수에만 비례, column 은 컬럼 하나 또는 목록 - 목록이면 첫 컬럼 기준 정렬)
+def groupby_sum_chunks(chunks, by, column):
+    by = [by] if isinstance(by, str) else list(by)
+    columns = [column] if isinstance(column, str) else list(column)
+    partials = []
+    for chunk in chunks:
+        partials.append(chunk.groupby(by, observed=True)[columns].sum())
+        # 부분 집계가 쌓이면 중간에 한 번씩 합쳐서 크기를 유지
+        if len(partials) >= 16:
+            partials = [pd.concat(partials).groupby(level=by).sum()]
+    if not partials:
+        return pd.DataFrame(columns=by + columns)
+    result = pd.concat(partials).groupby(level=by).sum()
+    return result.sort_values(columns[0], ascending=False).reset_index()
+
+
+# 청크를 순서대로 CSV 로 기록 (헤더는 첫 청크에만)
+def write_csv_chunks(chunks, fileobj, columns=None, rename=None, encoding='utf-8-sig'):
+    first = True
+    rows = 0
+    for chunk in chunks:
+        if columns is not None:
+            chunk = chunk[columns]
+        if rename:
+            chunk = chunk.rename(columns=rename)
+        text = chunk.to_csv(index=False, header=first, date_format='%Y-%m-%d')
+        # BOM 은 파일 맨 앞에 한 번만 기록
+        fileobj.write(text.encode(encoding if first else encoding.replace('-sig', '')))
+        first = False
+        rows += len(chunk)
+    return rows
+
+
+# 청크를 하나의 Parquet 파일로 기록 (pyarrow 필요, 청크마다 row group 하나)
+def write_parquet_chunks(chunks, fileobj, columns=None, rename=None, compression='snappy'):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    rows = 0
+    try:
+        for chunk in chunks:
+            if columns is not None:
+                chunk = chunk[columns]
+            if rename:
+                chunk = chunk.rename(columns=rename)
+            # 청크마다 범주 목록이 달라 스키마가 어긋나므로 값으로 풀어서 기록 (Parquet 가 다시 사전 인코딩)
+            categorical = [column for column in chunk.columns if isinstance(chunk[column].dtype, pd.CategoricalDtype)]
+            if categorical:
+                chunk = chunk.astype({column: object for column in categorical})
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(fileobj, table.schema, compression=compression)
+            else:
+                table = table.cast(writer.schema)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
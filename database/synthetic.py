@@ -0,0 +1,366 @@
+"""
+부하 테스트용 합성 데이터 생성기 (NumPy 벡터 연산, 시드 고정으로 재현 가능)
+
+car_registration(및 지역/차종/제조사/모델), used_car_table, rent_car_companies_table, faq_table 을
+지정한 규모로 생성하여 로컬 SQLite 백엔드(database.local_backend)에 기록한다.
+지역은 인구 비례, 모델/브랜드는 Zipf 분포, 등록일은 연간 증가 추세와 계절성을 갖도록 치우치게 생성한다.
+
+사용법:
+    python -m database.synthetic --registrations 1000000
+    python -m database.synthetic --registrations 50000000 --chunk-size 1000000 --seed 7
+    DB_BACKEND=sqlite streamlit run 01_car_registration.py
+"""
+import os
+import time
+import sqlite3
+import argparse
+from datetime import date
+
+import numpy as np
+
+from database.local_backend import DEFAULT_LOCAL_DB_PATH, build_local_database
+
+# (지역명, 인구 비중)
+REGIONS = [
+    ('서울', 9.4), ('부산', 3.3), ('대구', 2.4), ('인천', 3.0), ('광주', 1.4), ('대전', 1.4), ('울산', 1.1),
+    ('세종', 0.4), ('경기', 13.6), ('강원', 1.5), ('충북', 1.6), ('충남', 2.1), ('전북', 1.8), ('전남', 1.8),
+    ('경북', 2.6), ('경남', 3.3), ('제주', 0.7),
+]
+
+CAR_TYPES = ['승용차', 'SUV', '승합차', '화물차', '특수차', '전기차', '하이브리드', '수소차']
+
+# (제조사, 국가, 시장 비중, 모델 수)
+MANUFACTURERS = [
+    ('현대', '대한민국', 30.0, 14), ('기아', '대한민국', 25.0, 12), ('제네시스', '대한민국', 6.0, 5),
+    ('KGM', '대한민국', 3.0, 5), ('르노코리아', '대한민국', 2.0, 4), ('쉐보레', '대한민국', 2.0, 5),
+    ('BMW', '독일', 6.0, 8), ('벤츠', '독일', 6.5, 8), ('아우디', '독일', 1.5, 6), ('폭스바겐', '독일', 1.0, 5),
+    ('포르쉐', '독일', 0.6, 4), ('볼보', '스웨덴', 1.2, 5), ('도요타', '일본', 0.8, 5), ('렉서스', '일본', 0.9, 4),
+    ('혼다', '일본', 0.3, 4), ('테슬라', '미국', 1.8, 4), ('포드', '미국', 0.4, 3), ('미니', '영국', 0.7, 3),
+    ('랜드로버', '영국', 0.4, 3), ('푸조', '프랑스', 0.2, 3),
+]
+
+FAQ_TOPICS = ['보증 기간', '정기 점검', '포인트', '차량 구매', '할부 금융', '리콜', '블루투스 연결', '내비게이션 업데이트',
+              '타이어 교체', '엔진 오일', '충전 요금', '보험', '시승 신청', '중고차 판매', '부품 주문']
+FAQ_ACTIONS = [' 확인 방법이 궁금합니다.', ' 신청 방법이 궁금합니다.', ' 안내는 어디서 받을 수 있나요?', ' 비용은 얼마인가요?',
+               ' 관련 문의는 어디로 하나요?', ' 처리 기간은 얼마나 걸리나요?']
+FAQ_ANSWERS = ['가까운 서비스센터나 고객센터로 문의해 주세요.', '홈페이지 마이페이지 메뉴에서 확인하실 수 있습니다.',
+               '전용 앱에서 신청하실 수 있습니다.', '차종과 계약 조건에 따라 다르니 상세 내용은 안내 페이지를 참고해 주세요.']
+
+START_DATE = date(2015, 1, 1)
+REGISTRATION_ANNUAL_GROWTH = 0.04
+
+
+# 순위 기반 Zipf 가중치 (정규화)
+def zipf_weights(n, exponent=1.1):
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    return weights / weights.sum()
+
+
+def _normalize(weights):
+    weights = np.asarray(weights, dtype=np.float64)
+    return weights / weights.sum()
+
+
+# 지역/차종/제조사/모델 기준 정보 생성 -> 각 테이블 행 목록과 모델별 선택 확률
+def build_dimensions(rng):
+    regions = [(i + 1, name) for i, (name, _) in enumerate(REGIONS)]
+    region_weights = _normalize([weight for _, weight in REGIONS])
+
+    car_types = [(i + 1, name) for i, name in enumerate(CAR_TYPES)]
+    # 승용/SUV 위주, 친환경 차종은 소수
+    car_type_weights = _normalize([40, 30, 6, 10, 1, 6, 6, 1])
+
+    manufacturers = []
+    models = []
+    model_weights = []
+    for manufacturer_id, (name, country, share, model_count) in enumerate(MANUFACTURERS, start=1):
+        manufacturers.append((manufacturer_id, name, country))
+        model_types = rng.choice(len(CAR_TYPES), size=model_count, p=car_type_weights) + 1
+        for rank, car_type_id in enumerate(model_types):
+            models.append((len(models) + 1, f"{name} 모델{rank + 1}", manufacturer_id, int(car_type_id)))
+        # 제조사 비중을 모델별 Zipf 로 나눔
+        model_weights.extend(share * zipf_weights(model_count))
+
+    return {
+        'regions': regions,
+        'region_weights': region_weights,
+        'car_types': car_types,
+        'manufacturers': manufacturers,
+        'models': models,
+        'model_weights': _normalize(model_weights),
+    }
+
+
+# 이미 적재된 기준 정보 -> build_dimensions 와 같은 형태 (--append 에서 새 행을 기존 모델/차종에 맞춰 생성)
+# 기준 정보가 비어 있으면 None
+def load_dimensions(conn):
+    regions = conn.execute('SELECT id, name FROM regions ORDER BY id').fetchall()
+    car_types = conn.execute('SELECT id, name FROM car_types ORDER BY id').fetchall()
+    manufacturers = conn.execute('SELECT id, name, country FROM manufacturers ORDER BY id').fetchall()
+    models = conn.execute(
+        'SELECT id, name, manufacturer_id, car_type_id FROM car_models WHERE car_type_id IS NOT NULL ORDER BY id'
+    ).fetchall()
+    if not (regions and car_types and models):
+        return None
+
+    # 이름이 생성기 목록에 있으면 같은 비중, 없으면 가장 작은 비중 (모델은 제조사 안에서 id 순 Zipf)
+    region_shares = dict(REGIONS)
+    region_weights = _normalize([region_shares.get(name, min(region_shares.values())) for _, name in regions])
+    shares = {name: share for name, _, share, _ in MANUFACTURERS}
+    manufacturer_shares = {manufacturer_id: shares.get(name, min(shares.values())) for manufacturer_id, name, _ in manufacturers}
+    model_weights = np.zeros(len(models))
+    for manufacturer_id in {model[2] for model in models}:
+        index = [i for i, model in enumerate(models) if model[2] == manufacturer_id]
+        model_weights[index] = manufacturer_shares.get(manufacturer_id, min(shares.values())) * zipf_weights(len(index))
+
+    return {
+        'regions': regions,
+        'region_weights': region_weights,
+        'car_types': car_types,
+        'manufacturers': manufacturers,
+        'models': models,
+        'model_weights': _normalize(model_weights),
+    }
+
+
+# 등록일: 월별 가중치(연간 증가 + 봄/가을 성수기) 로 월을 고르고 월 안에서 일자를 균등 선택
+def registration_dates(rng, n, start_date=START_DATE, end_date=None):
+    end_date = end_date or date.today()
+    months = np.arange(
+        np.datetime64(start_date, 'M'), np.datetime64(end_date, 'M') + 1, dtype='datetime64[M]'
+    )
+    index = np.arange(len(months))
+    month_of_year = months.astype(np.int64) % 12
+    weights = (1 + REGISTRATION_ANNUAL_GROWTH) ** (index / 12) * (1 + 0.15 * np.cos((month_of_year - 3) / 12 * 2 * np.pi))
+    picked = rng.choice(len(months), size=n, p=_normalize(weights))
+
+    month_start = months[picked].astype('datetime64[D]')
+    month_days = ((months + 1).astype('datetime64[D]') - months.astype('datetime64[D]')).astype(np.int64)[picked]
+    dates = month_start + (rng.random(n) * month_days).astype(np.int64)
+    return np.minimum(dates, np.datetime64(end_date, 'D'))
+
+
+# car_registration 청크 생성 -> 컬럼 배열 dict
+def generate_registrations(rng, dimensions, n, start_id=1, end_date=None):
+    models = np.array([model[0] for model in dimensions['models']])
+    model_types = np.array([model[3] for model in dimensions['models']])
+    picked = rng.choice(len(models), size=n, p=dimensions['model_weights'])
+    region_ids = np.array([region[0] for region in dimensions['regions']])[
+        rng.choice(len(dimensions['regions']), size=n, p=dimensions['region_weights'])
+    ]
+    counts = np.maximum(rng.lognormal(mean=3.5, sigma=1.0, size=n).astype(np.int64), 1)
+    return {
+        'id': np.arange(start_id, start_id + n),
+        'registration_date': registration_dates(rng, n, end_date=end_date).astype(str),
+        'region_id': region_ids,
+        'car_type_id': model_types[picked],
+        'car_model_id': models[picked],
+        'registration_count': counts,
+    }
+
+
+# used_car_table 청크 생성 (기존 덤프의 브랜드/차종 분포를 표본으로 사용)
+def generate_used_cars(rng, n, catalog, start_id=1):
+    brand_nums, brands, categories, frequencies = catalog
+    picked = rng.choice(len(brands), size=n, p=_normalize(frequencies))
+    this_year = date.today().year
+    age = np.minimum(rng.gamma(shape=2.0, scale=2.5, size=n).astype(np.int64), 25)
+    km = np.maximum(age * rng.normal(15000, 5000, size=n), rng.integers(10, 3000, size=n)).astype(np.int64)
+    # 가격(만원): 차종별 기준가에서 연식에 따라 감가
+    base_price = np.exp(rng.normal(8.0, 0.5, size=len(brands)))[picked]
+    price = np.maximum(base_price * 0.88 ** age * rng.lognormal(0, 0.15, size=n), 50).astype(np.int64)
+    brand = np.asarray(brands, dtype=object)[picked]
+    category = np.asarray(categories, dtype=object)[picked]
+    trims = np.array(['스탠다드', '프리미엄', '익스클루시브', '스포츠', '인스퍼레이션'], dtype=object)
+    return {
+        'id': np.arange(start_id, start_id + n),
+        'car_name': brand + ' ' + category + ' ' + trims[rng.integers(0, len(trims), size=n)],
+        'car_year': this_year - age,
+        'car_km': km,
+        'car_price': price,
+        'car_cate': category,
+        'car_brand': brand,
+        'brand_num': np.asarray(brand_nums)[picked],
+    }
+
+
+# rent_car_companies_table 청크 생성 (제주/수도권 편중, 전기차 비중은 낮게)
+def generate_rent_companies(rng, n, start_id=1):
+    rent_weights = _normalize([weight * (12 if name == '제주' else 1) for name, weight in REGIONS])
+    region_ids = rng.choice(len(REGIONS), size=n, p=rent_weights) + 1
+    names = np.array([name for name, _ in REGIONS], dtype=object)[region_ids - 1]
+    ids = np.arange(start_id, start_id + n)
+    fleet = np.maximum(rng.lognormal(mean=3.0, sigma=1.1, size=n).astype(np.int64), 1)
+    sedan = (fleet * rng.uniform(0.5, 0.8, size=n)).astype(np.int64)
+    van = fleet - sedan
+    return {
+        'id': ids,
+        'company_name': names + '렌터카' + ids.astype(str).astype(object),
+        'region_id': region_ids,
+        'sedan_vehicle_count': sedan,
+        'van_vehicle_count': van,
+        'electric_sedan_vehicle_count': rng.binomial(sedan, 0.12),
+        'electric_van_vehicle_count': rng.binomial(van, 0.05),
+    }
+
+
+# faq_table 청크 생성 (질문은 주제 × 문형 조합)
+def generate_faqs(rng, n, company_ids, start_id=1):
+    topics = np.array(FAQ_TOPICS, dtype=object)[rng.choice(len(FAQ_TOPICS), size=n, p=zipf_weights(len(FAQ_TOPICS), 0.8))]
+    actions = np.array(FAQ_ACTIONS, dtype=object)[rng.integers(0, len(FAQ_ACTIONS), size=n)]
+    answers = np.array(FAQ_ANSWERS, dtype=object)[rng.integers(0, len(FAQ_ANSWERS), size=n)]
+    return {
+        'id': np.arange(start_id, start_id + n),
+        'car_company_id': np.asarray(company_ids)[rng.integers(0, len(company_ids), size=n)],
+        'question': topics + actions,
+        'answer': topics + ' 관련: ' + answers,
+    }
+
+
+# 컬럼 배열 dict 를 executemany 로 기록
+def insert_columns(conn, table, columns):
+    names = list(columns)
+    placeholders = ', '.join('?' * len(names))
+    rows = zip(*(columns[name].tolist() for name in names))
+    conn.executemany(f'INSERT INTO "{table}" ({", ".join(names)}) VALUES ({placeholders})', rows)
+
+
+def _replace_rows(conn, table, rows):
+    conn.execute(f'DELETE FROM "{table}"')
+    if rows:
+        placeholders = ', '.join('?' * len(rows[0]))
+        conn.executemany(f'INSERT INTO "{table}" VALUES ({placeholders})', rows)
+
+
+def _next_id(conn, table, append):
+    if not append:
+        conn.execute(f'DELETE FROM "{table}"')
+        return 1
+    return (conn.execute(f'SELECT MAX(id) FROM "{table}"').fetchone()[0] or 0) + 1
+
+
+# 청크 단위로 생성하여 기록 (메모리는 chunk_size 에 비례)
+def write_chunks(conn, table, total, chunk_size, generate, start_id):
+    written = 0
+    while written < total:
+        n = min(chunk_size, total - written)
+        insert_columns(conn, table, generate(n, start_id + written))
+        written += n
+    conn.commit()
+    return written
+
+
+def used_car_catalog(conn):
+    rows = conn.execute("""
+        SELECT u.brand_num, b.car_brand, u.car_cate, COUNT(*)
+        FROM used_car_table u JOIN car_brands b ON u.brand_num = b.brand_num
+        GROUP BY u.brand_num, b.car_brand, u.car_cate
+    """).fetchall()
+    if not rows:
+        rows = [(i + 1, name, f'{name} 모델', share) for i, (name, _, share, _) in enumerate(MANUFACTURERS)]
+    return tuple(zip(*rows))
+
+
+def generate_all(path=None, registrations=100_000, used_cars=10_000, rent_companies=2_000, faqs=10_000,
+                 chunk_size=500_000, seed=42, append=False):
+    path = path or DEFAULT_LOCAL_DB_PATH
+    if not os.path.exists(path):
+        build_local_database(path, if_missing=True)
+
+    rng = np.random.default_rng(seed)
+    conn = sqlite3.connect(path)
+    # 대량 적재 중에는 저널/동기화 생략 (실패 시 --rebuild 로 다시 생성)
+    conn.execute('PRAGMA journal_mode = OFF')
+    conn.execute('PRAGMA synchronous = OFF')
+    results = {}
+    try:
+        if registrations:
+            # --append 는 이미 적재된 기준 정보에 맞춰 생성 (시드가 달라도 모델과 차종이 어긋나지 않음)
+            dimensions = load_dimensions(conn) if append else None
+            if dimensions is None:
+                dimensions = build_dimensions(rng)
+                _replace_rows(conn, 'regions', [(i, name, None, None, None, None) for i, name in dimensions['regions']])
+                _replace_rows(conn, 'car_types', [(i, name, None, None, None) for i, name in dimensions['car_types']])
+                _replace_rows(conn, 'manufacturers', [(i, name, country, None, None, None)
+                                                      for i, name, country in dimensions['manufacturers']])
+                _replace_rows(conn, 'car_models', [(i, name, m, t, None, None, None, None)
+                                                   for i, name, m, t in dimensions['models']])
+                # 원본이 바뀌므로 rollup 은 적재 후 처음부터 다시 집계
+                conn.execute('DROP TABLE IF EXISTS registration_rollup')
+                conn.execute('DROP TABLE IF EXISTS rollup_state')
+                conn.execute('DROP TABLE IF EXISTS registration_monthly')
+            start_id = _next_id(conn, 'car_registration', append)
+            results['car_registration'] = write_chunks(
+                conn, 'car_registration', registrations, chunk_size,
+                lambda n, first_id: generate_registrations(rng, dimensions, n, first_id), start_id,
+            )
+
+        if used_cars:
+            catalog = used_car_catalog(conn)
+            start_id = _next_id(conn, 'used_car_table', append)
+            results['used_car_table'] = write_chunks(
+                conn, 'used_car_table', used_cars, chunk_size,
+                lambda n, first_id: generate_used_cars(rng, n, catalog, first_id), start_id,
+            )
+
+        if rent_companies:
+            if not append or not conn.execute('SELECT COUNT(*) FROM regions_table').fetchone()[0]:
+                _replace_rows(conn, 'regions_table', [(i + 1, name) for i, (name, _) in enumerate(REGIONS)])
+            start_id = _next_id(conn, 'rent_car_companies_table', append)
+            results['rent_car_companies_table'] = write_chunks(
+                conn, 'rent_car_companies_table', rent_companies, chunk_size,
+                lambda n, first_id: generate_rent_companies(rng, n, first_id), start_id,
+            )
+
+        if faqs:
+            company_ids = [row[0] for row in conn.execute('SELECT id FROM car_company_table')] or [1]
+            start_id = _next_id(conn, 'faq_table', append)
+            results['faq_table'] = write_chunks(
+                conn, 'faq_table', faqs, chunk_size,
+                lambda n, first_id: generate_faqs(rng, n, company_ids, first_id), start_id,
+            )
+    finally:
+        conn.close()
+    if registrations:
+        refresh_rollup_tables(path, rebuild=not append)
+    return results
+
+
+# 적재한 car_registration 을 rollup / 월별 시계열 / 연도별 요약에 반영 (페이지는 읽기만 하므로 적재 직후에 갱신, --append 면 추가분만)
+def refresh_rollup_tables(path, rebuild=False):
+    # rollup 모듈은 공유 커넥터를 만들므로 필요할 때만 import
+    from database.local_backend import LocalConnection
+    from database.rollup import create_rollup_tables, refresh_rollup
+
+    conn = LocalConnection(path)
+    try:
+        create_rollup_tables(conn)
+        refresh_rollup(rebuild=rebuild, conn=conn)
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 SQLite 백엔드에 부하 테스트용 합성 데이터 생성')
+    parser.add_argument('--path', default=os.getenv('DB_LOCAL_PATH') or DEFAULT_LOCAL_DB_PATH)
+    parser.add_argument('--registrations', type=int, default=100_000, help='car_registration 행 수 (1만 ~ 5천만)')
+    parser.add_argument('--used-cars', type=int, default=10_000)
+    parser.add_argument('--rent-companies', type=int, default=2_000)
+    parser.add_argument('--faqs', type=int, default=10_000)
+    parser.add_argument('--chunk-size', type=int, default=500_000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--append', action='store_true', help='기존 행을 지우지 않고 뒤에 추가')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    results = generate_all(
+        args.path, args.registrations, args.used_cars, args.rent_companies, args.faqs,
+        args.chunk_size, args.seed, args.append,
+    )
+    for table, rows in results.items():
+        print(f"{table:30} {rows:>12,}")
+    print(f"{time.perf_counter() - started:.1f}초")
+
+
+if __name__ == "__main__":
+    main()